@@ -0,0 +1,93 @@
+"""댄서 대량 업로드(upsert) 벤치마크
+
+행마다 SELECT 하던 기존 방식과 DancerStore.create_or_update_dancers_bulk 를 같은 데이터로 비교한다.
+DB_ 환경변수로 지정한 DB(MySQL 또는 로컬 sqlite)에 테이블이 있어야 하며, 실행 전후로 dancers / dancer_names 를 비운다.
+
+    python -m benchmarks.bench_dancer_bulk_upsert --rows 50000
+"""
+import argparse
+import asyncio
+import random
+import time
+from typing import Any, Dict, List
+
+from sqlalchemy import delete, event, select
+
+from server.database.connection import DATABASE, SESSION
+from server.features.dancer.models import Dancer, DancerName
+from server.features.dancer.store import DancerStore, sync_name_entries
+
+
+def make_rows(count: int, seed: int = 42) -> List[Dict[str, Any]]:
+    """instagram 이 겹치는 행(별칭 추가)과 instagram 없는 행이 섞인 업로드 데이터"""
+    rng = random.Random(seed)
+    handles = [f"dancer_{i}" for i in range(int(count * 0.7))]
+    rows = []
+    for i in range(count):
+        instagram = rng.choice(handles) if rng.random() < 0.9 else ""
+        rows.append({"name": f"name{i % 5000}_{rng.randint(0, 9)}", "instagram": instagram})
+    return rows
+
+
+async def legacy_bulk_upsert(rows: List[Dict[str, Any]]) -> int:
+    """비교 기준: 행마다 instagram 으로 SELECT 후 ORM 객체를 하나씩 추가하던 방식"""
+    processed: Dict[str, Dancer] = {}
+    for row in rows:
+        name = row["name"].strip()
+        instagram = row["instagram"].strip() or None
+        if instagram and instagram in processed:
+            dancer = processed[instagram]
+        elif instagram:
+            dancer = await SESSION.scalar(select(Dancer).where(Dancer.instagram == instagram))
+            if dancer is None:
+                dancer = Dancer(main_name=name, names=[], instagram=instagram)
+                SESSION.add(dancer)
+            processed[instagram] = dancer
+        else:
+            dancer = Dancer(main_name=name, names=[], instagram=None)
+            SESSION.add(dancer)
+        if name not in dancer.names:
+            dancer.names = dancer.names + [name]
+            sync_name_entries(dancer)
+    await SESSION.commit()
+    return len(rows)
+
+
+async def reset_tables() -> None:
+    await SESSION.execute(delete(DancerName))
+    await SESSION.execute(delete(Dancer))
+    await SESSION.commit()
+
+
+async def measure(label: str, fn, rows: List[Dict[str, Any]]) -> None:
+    statements = 0
+
+    def count(*_: Any) -> None:
+        nonlocal statements
+        statements += 1
+
+    engine = DATABASE.engine.sync_engine
+    await reset_tables()
+    event.listen(engine, "before_cursor_execute", count)
+    started = time.perf_counter()
+    await fn(rows)
+    elapsed = time.perf_counter() - started
+    event.remove(engine, "before_cursor_execute", count)
+    print(f"{label:<8} rows={len(rows):>7} statements={statements:>7} elapsed={elapsed:8.2f}s")
+
+
+async def main(row_count: int) -> None:
+    rows = make_rows(row_count)
+    try:
+        await measure("legacy", legacy_bulk_upsert, rows)
+        await measure("batched", DancerStore().create_or_update_dancers_bulk, rows)
+    finally:
+        await reset_tables()
+        await SESSION.close()
+        await DATABASE.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=50000)
+    asyncio.run(main(parser.parse_args().rows))
@@ -0,0 +1,77 @@
+"""앱 import 시간 측정 / 예산 확인
+
+새 프로세스에서 python -X importtime 으로 server.main 을 import 해 모듈별 self 시간을 모으고,
+최상위 패키지별 시간과 전체 시간을 출력한다 (워커 부팅/오토스케일 시 매번 드는 비용).
+여러 번 실행해 가장 빠른 회차를 쓰고 (첫 회차는 .pyc 생성 포함), --budget-ms 를 넘거나
+import 만으로 DB 엔진이 만들어졌으면 1 로 종료한다.
+
+    python -m benchmarks.bench_import_time --budget-ms 1500
+"""
+import argparse
+import os
+import subprocess
+import sys
+from typing import Dict, Tuple
+
+# import 후 엔진이 만들어졌는지 출력 (엔진은 lifespan 에서 DATABASE.start() 로 생성해야 함)
+IMPORT_SCRIPT = (
+    "import server.main\n"
+    "from server.database.connection import DATABASE\n"
+    "print('engine_created', DATABASE._engine is not None)\n"
+)
+
+
+def measure_once(module_root: str) -> Tuple[Dict[str, int], int, bool]:
+    """(최상위 패키지별 self us 합, 전체 us, 엔진 생성 여부) - importtime 출력은 stderr 로 나옴"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", IMPORT_SCRIPT],
+        cwd=module_root,
+        env=os.environ.copy(),
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    by_package: Dict[str, int] = {}
+    total = 0
+    for line in result.stderr.splitlines():
+        # "import time: self [us] | cumulative | imported package"
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        self_us, _, name = line[len("import time:"):].split("|")
+        # self 시간은 겹치지 않으므로 최상위 패키지로 묶어 더하면 합이 전체와 같다
+        package = name.strip().split(".")[0]
+        by_package[package] = by_package.get(package, 0) + int(self_us)
+        total += int(self_us)
+    engine_created = "engine_created True" in result.stdout
+    return by_package, total, engine_created
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="앱 import 시간 측정 / 예산 확인")
+    parser.add_argument("--runs", type=int, default=5, help="측정 횟수 (가장 빠른 회차 사용)")
+    parser.add_argument("--top", type=int, default=15, help="출력할 패키지 수")
+    parser.add_argument("--budget-ms", type=float, help="허용 import 시간 (넘으면 1 로 종료)")
+    args = parser.parse_args()
+
+    module_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    runs = [measure_once(module_root) for _ in range(args.runs)]
+    by_package, total, _ = min(runs, key=lambda run: run[1])
+
+    print(f"⏱️ import server.main: {total / 1000:.1f}ms (best of {args.runs})")
+    for name, us in sorted(by_package.items(), key=lambda item: item[1], reverse=True)[:args.top]:
+        print(f"  {us / 1000:8.1f}ms  {name}")
+
+    failed = False
+    if any(run[2] for run in runs):
+        print("❌ DB engine created at import time (create it in lifespan)")
+        failed = True
+    if args.budget_ms is not None and total / 1000 > args.budget_ms:
+        print(f"❌ over budget: {total / 1000:.1f}ms > {args.budget_ms:.1f}ms")
+        failed = True
+    if not failed and args.budget_ms is not None:
+        print("✅ within budget")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,109 @@
+"""큰 목록 응답 직렬화 벤치마크
+
+같은 수업 목록을 두 경로로 JSON 바이트까지 만들어 시간을 비교한다 (DB 없이 합성 데이터 사용).
+- 기존: ORM 객체 -> ClassDetailResponse.from_class -> FastAPI serialize_response(반환 타입 재검증) -> JSONResponse
+- 빠른 경로: class_listings 행 (댄서 목록 JSON 포함) -> ClassDetailResponse.dict_from_row -> orjson (RawJSONResponse)
+
+두 경로의 결과가 같은 JSON 인지도 확인한다.
+
+    python -m benchmarks.bench_list_serialization --rows 1000 10000
+"""
+import argparse
+import asyncio
+import json
+import random
+import time
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from typing import Callable, List, Tuple
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_model_field
+
+from server.common.fast_json import RawJSONResponse, encode_json
+from server.features.dance_class.dto.responses import ClassDetailResponse, DancerInfo
+from server.features.dance_class.models import Level
+from server.features.dancer.models import Genre
+
+DANCERS_PER_CLASS = 2
+REPEAT = 5
+
+
+def make_classes(count: int, seed: int = 42) -> Tuple[List[SimpleNamespace], List[SimpleNamespace]]:
+    """(ORM 객체 대용, class_listings 행 대용)"""
+    rng = random.Random(seed)
+    studios = [
+        SimpleNamespace(studio_id=f"studio-{i}", name=f"스튜디오{i}", instagram=f"studio_{i}" if i % 3 else None)
+        for i in range(50)
+    ]
+    dancers = [
+        SimpleNamespace(dancer_id=f"dancer-{i}", main_name=f"댄서{i}", instagram=f"dancer_{i}" if i % 4 else None)
+        for i in range(500)
+    ]
+    start = datetime(2025, 1, 1, 10, 0)
+
+    objects, listing_rows = [], []
+    for i in range(count):
+        studio = rng.choice(studios)
+        class_dancers = rng.sample(dancers, DANCERS_PER_CLASS)
+        fields = dict(
+            class_id=f"class-{i:06d}",
+            timezone="Asia/Seoul",
+            class_datetime=start + timedelta(hours=i),
+            level=rng.choice(list(Level)),
+            genre=rng.choice([None, *Genre])
+        )
+        objects.append(SimpleNamespace(**fields, studio=studio, dancers=class_dancers))
+        listing_rows.append(SimpleNamespace(
+            **fields,
+            studio_id=studio.studio_id,
+            studio_name=studio.name,
+            studio_instagram=studio.instagram,
+            dancers=[DancerInfo.dict_from_row(dancer) for dancer in class_dancers]
+        ))
+    return objects, listing_rows
+
+
+def legacy_encode(objects: List[SimpleNamespace]) -> bytes:
+    """response_model 이 있는 라우트에서 FastAPI 가 하던 처리와 같은 순서"""
+    field = create_model_field(name="Response", type_=List[ClassDetailResponse], mode="serialization")
+    content = [ClassDetailResponse.from_class(c) for c in objects]
+    serialized = asyncio.run(serialize_response(field=field, response_content=content))
+    return JSONResponse(serialized).body
+
+
+def fast_encode(listing_rows: List[SimpleNamespace]) -> bytes:
+    """ClassService._encode_class_page 와 같은 처리"""
+    body = encode_json([ClassDetailResponse.dict_from_row(row, row.dancers) for row in listing_rows])
+    return RawJSONResponse(body).body
+
+
+def measure(fn: Callable[[], bytes]) -> Tuple[float, bytes]:
+    """REPEAT 회 중 가장 빠른 시간 (초)"""
+    best, body = float("inf"), b""
+    for _ in range(REPEAT):
+        started = time.perf_counter()
+        body = fn()
+        best = min(best, time.perf_counter() - started)
+    return best, body
+
+
+def main(row_counts: List[int]) -> None:
+    for count in row_counts:
+        objects, listing_rows = make_classes(count)
+        legacy_time, legacy_body = measure(lambda: legacy_encode(objects))
+        fast_time, fast_body = measure(lambda: fast_encode(listing_rows))
+        same = json.loads(legacy_body) == json.loads(fast_body)
+
+        print(f"📊 {count} rows ({len(fast_body) / 1024:.0f} KiB)")
+        print(f"  기존       : {legacy_time * 1000:8.1f} ms")
+        print(f"  빠른 경로  : {fast_time * 1000:8.1f} ms  (x{legacy_time / fast_time:.1f})")
+        print(f"  동일 응답  : {'✅' if same else '❌'}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="큰 목록 응답 직렬화 벤치마크")
+    parser.add_argument("--rows", type=int, nargs="+", default=[1000, 10000], help="목록 행 수")
+    args = parser.parse_args()
+    main(args.rows)
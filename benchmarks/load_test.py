@@ -0,0 +1,408 @@
+"""API 부하 테스트 / 성능 기준선
+
+benchmarks.seed_data 로 채운 DB 에 대해 FastAPI 앱을 프로세스 안에서 (httpx ASGITransport) 구동하고,
+시나리오별 처리량, p50/p95/p99 지연 시간, 요청당 SQL 문장 수를 JSON 으로 남긴다.
+문장 수는 DefaultSessionMiddleware 의 Server-Timing 헤더(db;desc="N queries")에서 읽는다.
+
+    python -m benchmarks.load_test --output result.json
+    python -m benchmarks.load_test --update-baseline benchmarks/baseline.json
+    python -m benchmarks.load_test --baseline benchmarks/baseline.json --tolerance 0.2
+
+--baseline 을 주면 기준선보다 지연 시간/처리량이 tolerance 이상, 문장 수가 statement-tolerance 이상
+나빠진 시나리오를 출력하고 종료 코드 1 로 끝난다.
+
+/dancer/bulk-upload 는 fakeredis 큐로 작업만 등록(API 응답 시간)하고,
+등록된 CSV 는 워커와 같은 DancerService.bulk_upload_dancers 로 이 프로세스에서 처리해 따로 기록한다.
+(업로드는 실제로 댄서를 추가/갱신하므로 기준선을 다시 잡을 때는 seed_data --reset 부터)
+추가 의존성: pip install httpx fakeredis
+"""
+import argparse
+import asyncio
+import json
+import math
+import os
+import platform
+import random
+import re
+import subprocess
+import sys
+import time
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import httpx
+from sqlalchemy import func, select
+
+from server.common.csv_stream import AsyncFileReader
+from server.database.connection import DATABASE, SESSION
+from server.database.instrumentation import reset_query_stats, start_query_stats
+from server.database.settings import DB_SETTINGS
+from server.features.dance_class.models import Class
+from server.features.dancer.models import Dancer
+from server.features.dancer.service import DancerService
+from server.features.dancer.store import DancerStore
+from server.features.search.index import SEARCH_INDEX
+from server.features.studio.models import Studio
+from server.jobs.queue import DANCER_IMPORT_QUEUE, get_dancer_import_queue
+from server.main import app
+
+from benchmarks.seed_data import CLASS_RANGE_START, DISTRICTS, NAME_SYLLABLES, STATIONS
+from server.features.dance_class.store import TIME_OF_DAY_BUCKETS
+from server.features.dancer.models import Genre
+
+# 기간 조회 창 / 페이지 크기 (클라이언트 월간 화면과 비슷하게)
+CLASS_WINDOW = timedelta(days=30)
+CLASS_PAGE_SIZE = 100
+UPLOAD_ROWS = 1000
+SEARCH_INDEX_WARM_TIMEOUT = 300
+QUERY_COUNT_PATTERN = re.compile(r'db;[^,]*desc="(\d+) queries"')
+
+# 요청 하나: (method, url, httpx 요청 kwargs)
+RequestSpec = Tuple[str, str, Dict[str, Any]]
+
+
+@dataclass
+class Scenario:
+    name: str
+    make_request: Callable[[random.Random], RequestSpec]
+    requests: int
+    concurrency: int
+
+
+@dataclass
+class ScenarioResult:
+    requests: int
+    errors: int
+    throughput_rps: float
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    statements_per_request: float
+    statements_max: int
+    extra: Dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass
+class Fixtures:
+    """요청에 넣을 실제 ID / 검색어 (seed 데이터에서 읽음)"""
+    studio_ids: List[str]
+    dancer_ids: List[str]
+    dancer_names: List[str]
+    instagrams: List[str]
+    class_range: Tuple[datetime, datetime]
+    counts: Dict[str, int]
+
+
+# ======================== SCENARIOS ========================
+
+def build_scenarios(fixtures: Fixtures, scale: float, upload_rows: int) -> List[Scenario]:
+    first, last = fixtures.class_range
+    window_days = max((last - first - CLASS_WINDOW).days, 0)
+
+    def class_window(rng: random.Random) -> Dict[str, Any]:
+        date_from = first + timedelta(days=rng.randint(0, window_days))
+        return {"from": date_from.isoformat(), "to": (date_from + CLASS_WINDOW).isoformat(), "limit": CLASS_PAGE_SIZE}
+
+    def feed_params(rng: random.Random) -> Dict[str, Any]:
+        # 첫 페이지(facet 포함) 조회, 조건은 0~2개 항목을 무작위로
+        date_from = first + timedelta(days=rng.randint(0, window_days))
+        params: Dict[str, Any] = {"from": date_from.isoformat(), "to": (date_from + timedelta(days=7)).isoformat(), "limit": 50}
+        choices = {
+            "genre": [g.value for g in Genre],
+            "time_of_day": [name for name, _, _ in TIME_OF_DAY_BUCKETS],
+            "district": DISTRICTS,
+            "station": STATIONS,
+        }
+        for key in rng.sample(sorted(choices), rng.randint(0, 2)):
+            params[key] = rng.sample(choices[key], rng.randint(1, 2))
+        return params
+
+    def search_keyword(rng: random.Random) -> str:
+        # 전방 일치(이름 앞부분) / 부분 일치(음절 하나) / 인스타그램 섞어서
+        kind = rng.random()
+        if kind < 0.5:
+            return rng.choice(fixtures.dancer_names)[:2]
+        if kind < 0.8:
+            return rng.choice(NAME_SYLLABLES)
+        return rng.choice(fixtures.instagrams)
+
+    def upload_csv(rng: random.Random) -> bytes:
+        # 기존 인스타그램(별칭 추가)과 새 댄서가 섞인 업로드
+        lines = ["name,instagram"]
+        for i in range(upload_rows):
+            if rng.random() < 0.5 and fixtures.instagrams:
+                lines.append(f"업로드{rng.randint(0, 9999)},{rng.choice(fixtures.instagrams)}")
+            else:
+                lines.append(f"업로드{rng.randint(0, 9999)},bench_{rng.getrandbits(48):x}")
+        return "\n".join(lines).encode()
+
+    def count(n: int) -> int:
+        return max(1, math.ceil(n * scale))
+
+    return [
+        Scenario("studio_list", lambda rng: ("GET", "/studio/list", {}), count(2000), 20),
+        Scenario(
+            "search",
+            lambda rng: ("GET", "/search/", {"params": {"keyword": search_keyword(rng), "limit": 20}}),
+            count(2000), 20
+        ),
+        Scenario(
+            "class_by_studio",
+            lambda rng: ("GET", f"/class/studio/{rng.choice(fixtures.studio_ids)}", {"params": class_window(rng)}),
+            count(2000), 20
+        ),
+        Scenario(
+            "class_by_dancer",
+            lambda rng: ("GET", f"/class/dancer/{rng.choice(fixtures.dancer_ids)}", {"params": class_window(rng)}),
+            count(2000), 20
+        ),
+        Scenario("class_feed", lambda rng: ("GET", "/class/feed", {"params": feed_params(rng)}), count(1000), 20),
+        Scenario(
+            "dancer_bulk_upload",
+            lambda rng: ("POST", "/dancer/bulk-upload", {"files": {"file": ("dancers.csv", upload_csv(rng), "text/csv")}}),
+            count(20), 2
+        ),
+    ]
+
+
+async def load_fixtures(sample: int) -> Fixtures:
+    studio_ids = list(await SESSION.scalars(select(Studio.studio_id)))
+    dancer_rows = (await SESSION.execute(
+        select(Dancer.dancer_id, Dancer.main_name, Dancer.instagram).order_by(Dancer.dancer_id).limit(sample)
+    )).all()
+    class_range = (await SESSION.execute(
+        select(func.min(Class.class_datetime), func.max(Class.class_datetime))
+    )).one()
+    counts = {
+        "studios": len(studio_ids),
+        "dancers": await SESSION.scalar(select(func.count()).select_from(Dancer)) or 0,
+        "classes": await SESSION.scalar(select(func.count()).select_from(Class)) or 0,
+    }
+    await SESSION.remove()
+    if not studio_ids or not dancer_rows:
+        raise SystemExit("❌ 데이터가 없습니다. 먼저 python -m benchmarks.seed_data 를 실행하세요.")
+    return Fixtures(
+        studio_ids=studio_ids,
+        dancer_ids=[row.dancer_id for row in dancer_rows],
+        dancer_names=[row.main_name for row in dancer_rows],
+        instagrams=[row.instagram for row in dancer_rows if row.instagram],
+        class_range=(class_range[0] or CLASS_RANGE_START, class_range[1] or CLASS_RANGE_START),
+        counts=counts,
+    )
+
+
+# ======================== RUNNER ========================
+
+def percentile(sorted_values: List[float], q: float) -> float:
+    """nearest-rank 백분위수"""
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(len(sorted_values) - 1, max(0, math.ceil(q * len(sorted_values)) - 1))]
+
+
+def summarize(latencies: List[float], statements: List[int], errors: int, elapsed: float) -> ScenarioResult:
+    ordered = sorted(latencies)
+    return ScenarioResult(
+        requests=len(latencies),
+        errors=errors,
+        throughput_rps=round(len(latencies) / elapsed, 2) if elapsed > 0 else 0.0,
+        p50_ms=round(percentile(ordered, 0.50), 2),
+        p95_ms=round(percentile(ordered, 0.95), 2),
+        p99_ms=round(percentile(ordered, 0.99), 2),
+        statements_per_request=round(sum(statements) / len(statements), 2) if statements else 0.0,
+        statements_max=max(statements, default=0),
+    )
+
+
+async def run_scenario(client: httpx.AsyncClient, scenario: Scenario, rng: random.Random, warmup: int) -> ScenarioResult:
+    # 요청 목록을 미리 만들어 두어 실행 순서(동시성)와 관계없이 같은 요청 집합이 되도록
+    specs = [scenario.make_request(rng) for _ in range(warmup + scenario.requests)]
+    for method, url, kwargs in specs[:warmup]:
+        await client.request(method, url, **kwargs)
+
+    pending = iter(specs[warmup:])
+    latencies: List[float] = []
+    statements: List[int] = []
+    errors = 0
+
+    async def worker() -> None:
+        nonlocal errors
+        for method, url, kwargs in pending:
+            started = time.perf_counter()
+            response = await client.request(method, url, **kwargs)
+            latencies.append((time.perf_counter() - started) * 1000)
+            if response.status_code >= 400:
+                errors += 1
+            match = QUERY_COUNT_PATTERN.search(response.headers.get("server-timing", ""))
+            if match:
+                statements.append(int(match.group(1)))
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(scenario.concurrency)))
+    return summarize(latencies, statements, errors, time.perf_counter() - started)
+
+
+async def run_upload_jobs(queue: Any) -> Optional[ScenarioResult]:
+    """등록된 업로드 작업을 워커와 같은 경로로 순서대로 처리 (작업 하나 = 요청 하나로 집계)"""
+    jobs = [job for job in queue.get_jobs() if job.func_name.endswith("run_dancer_bulk_upload")]
+    if not jobs:
+        return None
+    latencies: List[float] = []
+    statements: List[int] = []
+    rows = errors = 0
+    started = time.perf_counter()
+    for job in jobs:
+        upload_path = job.args[0]
+        token, stats = start_query_stats()
+        job_started = time.perf_counter()
+        try:
+            with open(upload_path, "rb") as file:
+                result = await DancerService(DancerStore()).bulk_upload_dancers(AsyncFileReader(file))
+            latencies.append((time.perf_counter() - job_started) * 1000)
+            statements.append(stats.count)
+        finally:
+            reset_query_stats(token)
+            os.remove(upload_path)
+            job.delete()
+        rows += result.total
+        errors += 1 if result.failed else 0
+    elapsed = time.perf_counter() - started
+    summary = summarize(latencies, statements, errors, elapsed)
+    summary.extra["rows_per_second"] = round(rows / elapsed, 1) if elapsed > 0 else 0.0
+    return summary
+
+
+async def wait_for_search_index() -> None:
+    started = time.perf_counter()
+    while not SEARCH_INDEX.is_warm:
+        if time.perf_counter() - started > SEARCH_INDEX_WARM_TIMEOUT:
+            print("⚠️ 검색 색인이 준비되지 않아 SQL 검색으로 측정합니다.")
+            return
+        await asyncio.sleep(0.2)
+
+
+def git_commit() -> Optional[str]:
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], text=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+async def run(args: argparse.Namespace) -> Dict[str, Any]:
+    import fakeredis
+    from rq import Queue
+
+    fixtures = await load_fixtures(args.fixture_sample)
+    queue = Queue(DANCER_IMPORT_QUEUE, connection=fakeredis.FakeRedis())
+    app.dependency_overrides[get_dancer_import_queue] = lambda: queue
+    rng = random.Random(args.seed)
+    selected = set(args.scenarios or [])
+    results: Dict[str, Any] = {}
+    try:
+        async with app.router.lifespan_context(app):
+            await wait_for_search_index()
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+                for scenario in build_scenarios(fixtures, args.scale, args.upload_rows):
+                    if selected and scenario.name not in selected:
+                        continue
+                    result = await run_scenario(client, scenario, rng, args.warmup)
+                    results[scenario.name] = asdict(result)
+                    print(format_result(scenario.name, result))
+            job_result = await run_upload_jobs(queue)
+            if job_result is not None:
+                results["dancer_bulk_upload_job"] = asdict(job_result)
+                print(format_result("dancer_bulk_upload_job", job_result))
+    finally:
+        app.dependency_overrides.pop(get_dancer_import_queue, None)
+        await DATABASE.dispose()
+
+    return {
+        "meta": {
+            "created_at": datetime.utcnow().isoformat(timespec="seconds"),
+            "git_commit": git_commit(),
+            "python": platform.python_version(),
+            "db_dialect": DB_SETTINGS.dialect,
+            "data": fixtures.counts,
+            "seed": args.seed,
+            "scale": args.scale,
+            "warmup": args.warmup,
+        },
+        "scenarios": results,
+    }
+
+
+# ======================== BASELINE ========================
+
+def compare(current: Dict[str, Any], baseline: Dict[str, Any], tolerance: float, statement_tolerance: float) -> List[str]:
+    """기준선보다 나빠진 항목 목록 (비어 있으면 통과)"""
+    regressions = []
+    for name, base in baseline["scenarios"].items():
+        now = current["scenarios"].get(name)
+        if now is None:
+            continue
+        for metric in ("p50_ms", "p95_ms", "p99_ms"):
+            if base[metric] > 0 and now[metric] > base[metric] * (1 + tolerance):
+                regressions.append(f"{name}.{metric}: {base[metric]} -> {now[metric]}")
+        if now["throughput_rps"] < base["throughput_rps"] * (1 - tolerance):
+            regressions.append(f"{name}.throughput_rps: {base['throughput_rps']} -> {now['throughput_rps']}")
+        if now["statements_per_request"] > base["statements_per_request"] * (1 + statement_tolerance):
+            regressions.append(
+                f"{name}.statements_per_request: {base['statements_per_request']} -> {now['statements_per_request']}"
+            )
+        if now["errors"] > base["errors"]:
+            regressions.append(f"{name}.errors: {base['errors']} -> {now['errors']}")
+    return regressions
+
+
+def format_result(name: str, result: ScenarioResult) -> str:
+    return (
+        f"📊 {name:<24} n={result.requests:<5} err={result.errors:<3} "
+        f"{result.throughput_rps:>8.1f} req/s  p50={result.p50_ms:>7.1f}  p95={result.p95_ms:>7.1f}  "
+        f"p99={result.p99_ms:>7.1f} ms  sql/req={result.statements_per_request:>5.1f} (max {result.statements_max})"
+    )
+
+
+def write_json(path: str, data: Dict[str, Any]) -> None:
+    with open(path, "w", encoding="utf-8") as out:
+        json.dump(data, out, ensure_ascii=False, indent=2)
+        out.write("\n")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="API 부하 테스트 / 성능 기준선")
+    parser.add_argument("--scenarios", nargs="*", help="실행할 시나리오 (기본: 전체)")
+    parser.add_argument("--scale", type=float, default=1.0, help="시나리오별 요청 수 배율")
+    parser.add_argument("--warmup", type=int, default=20, help="시나리오별 측정 전 요청 수")
+    parser.add_argument("--upload-rows", type=int, default=UPLOAD_ROWS, help="업로드 CSV 한 개의 행 수")
+    parser.add_argument("--fixture-sample", type=int, default=5000, help="요청에 쓸 댄서 수")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", help="결과 JSON 저장 경로")
+    parser.add_argument("--baseline", help="비교할 기준선 JSON")
+    parser.add_argument("--update-baseline", metavar="PATH", help="이번 결과를 기준선으로 저장")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="지연 시간/처리량 허용 악화 비율")
+    parser.add_argument("--statement-tolerance", type=float, default=0.05, help="요청당 문장 수 허용 증가 비율")
+    args = parser.parse_args()
+
+    current = asyncio.run(run(args))
+    if args.output:
+        write_json(args.output, current)
+    if args.update_baseline:
+        write_json(args.update_baseline, current)
+        print(f"💾 baseline saved: {args.update_baseline}")
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare(current, baseline, args.tolerance, args.statement_tolerance)
+        if regressions:
+            print("❌ regression against baseline:")
+            for line in regressions:
+                print(f"  {line}")
+            return 1
+        print("✅ no regression against baseline")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
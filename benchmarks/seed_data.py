@@ -0,0 +1,214 @@
+"""부하 테스트용 데이터 생성
+
+DB_ 환경변수로 지정한 DB 에 실제 서비스 규모의 스튜디오 / 댄서(별칭 포함) / 수업(목록 읽기 모델 포함)을 채운다.
+같은 --seed 면 항상 같은 데이터가 만들어지므로 실행 간 결과를 비교할 수 있다.
+ORM 을 거치지 않고 테이블별 다중 행 INSERT 를 청크 단위로 커밋한다.
+
+    python -m benchmarks.seed_data --reset --studios 500 --dancers 20000 --classes 1000000
+
+테이블은 alembic upgrade head 로 미리 만들어 두어야 한다 (--create-tables 는 로컬 sqlite 확인용).
+"""
+import argparse
+import asyncio
+import random
+import time
+import uuid
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterator, List, Tuple
+
+from sqlalchemy import delete, insert
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from server.common.geo import studio_geohash
+from server.common.utils import normalize_name
+from server.database.common import Base
+from server.database.connection import DATABASE
+from server.features.dance_class.models import Class, ClassListing, Level, class_dancer_association
+from server.features.dancer.models import Dancer, DancerName, Genre
+from server.features.studio.models import Studio
+
+INSERT_CHUNK_SIZE = 5000
+# 수업 시작 시각 범위 (부하 테스트의 기간 조회가 이 범위 안에서 이뤄짐)
+CLASS_RANGE_START = datetime(2025, 1, 1, 10, 0)
+CLASS_SLOT = timedelta(hours=3)
+# 서울 근처 좌표 범위 (client MAP_BOUNDS 와 비슷하게)
+LAT_RANGE = (37.45, 37.65)
+LNG_RANGE = (126.85, 127.15)
+DISTRICTS = ["마포구", "강남구", "서초구", "성동구", "용산구", "송파구", "관악구", "광진구"]
+STATIONS = ["홍대입구", "합정", "강남", "신논현", "성수", "이태원", "잠실", "서울대입구", "건대입구", "신촌"]
+NAME_SYLLABLES = "가나다라마바사아자차카타파하준민서연지우현수영은"
+
+
+def dancer_name(rng: random.Random, index: int) -> str:
+    """검색 테스트에서 전방/부분 일치가 고르게 나오도록 한글 2~3글자 + 번호"""
+    syllables = "".join(rng.choice(NAME_SYLLABLES) for _ in range(rng.randint(2, 3)))
+    return f"{syllables}{index}"
+
+
+def make_studios(rng: random.Random, count: int, now: datetime) -> List[Dict[str, Any]]:
+    studios = []
+    for i in range(count):
+        lat = round(rng.uniform(*LAT_RANGE), 7)
+        lng = round(rng.uniform(*LNG_RANGE), 7)
+        studios.append({
+            "studio_id": str(uuid.UUID(int=rng.getrandbits(128))),
+            "name": f"스튜디오{i:04d}",
+            "instagram": f"studio_{i:04d}",
+            "lat": lat,
+            "lng": lng,
+            "geohash": studio_geohash(lat, lng),
+            "city": "서울",
+            "district": rng.choice(DISTRICTS),
+            "station": rng.choice(STATIONS),
+            "is_verified": rng.random() < 0.3,
+            "updated_at": now,
+        })
+    return studios
+
+
+def make_dancers(
+    rng: random.Random, count: int, now: datetime
+) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+    """(dancers 행, dancer_names 행) - 댄서마다 별칭 0~2개, 85% 는 인스타그램 있음"""
+    dancers, names = [], []
+    for i in range(count):
+        dancer_id = str(uuid.UUID(int=rng.getrandbits(128)))
+        main_name = dancer_name(rng, i)
+        aliases = [f"{main_name}{suffix}" for suffix in rng.sample(["X", "Crew", "J", "K"], rng.randint(0, 2))]
+        all_names = [main_name, *aliases]
+        dancers.append({
+            "dancer_id": dancer_id,
+            "main_name": main_name,
+            "names": all_names,
+            "instagram": f"dancer_{i}" if rng.random() < 0.85 else None,
+            "is_verified": rng.random() < 0.2,
+            "genre": rng.choice([None, *Genre]),
+            "updated_at": now,
+        })
+        names.extend(
+            {
+                "dancer_name_id": str(uuid.UUID(int=rng.getrandbits(128))),
+                "dancer_id": dancer_id,
+                "name": name,
+                "normalized_name": normalize_name(name),
+            }
+            for name in dict.fromkeys(all_names)
+        )
+    return dancers, names
+
+
+def iter_classes(
+    rng: random.Random, count: int, studio_ids: List[str], dancer_ids: List[str], now: datetime
+) -> Iterator[Tuple[Dict[str, Any], List[Dict[str, Any]]]]:
+    """(classes 행, class_dancer_association 행) - 스튜디오마다 CLASS_SLOT 간격으로 배치해 중복 키가 생기지 않음
+
+    댄서는 앞쪽 번호일수록 자주 뽑히도록 치우치게 (인기 댄서의 수업 목록이 길어지도록)
+    """
+    for i in range(count):
+        class_id = str(uuid.UUID(int=rng.getrandbits(128)))
+        slot = i // len(studio_ids)
+        class_row = {
+            "class_id": class_id,
+            "studio_id": studio_ids[i % len(studio_ids)],
+            "timezone": "Asia/Seoul",
+            "class_datetime": CLASS_RANGE_START + slot * CLASS_SLOT,
+            "genre": rng.choice([None, *Genre]),
+            "level": rng.choice(list(Level)),
+            "updated_at": now,
+        }
+        picked = {dancer_ids[int(len(dancer_ids) * rng.random() ** 2)] for _ in range(rng.randint(1, 2))}
+        yield class_row, [{"class_id": class_id, "dancer_id": dancer_id} for dancer_id in picked]
+
+
+def listing_row(
+    class_row: Dict[str, Any],
+    studio: Dict[str, Any],
+    dancers: List[Dict[str, Any]],
+    now: datetime
+) -> Dict[str, Any]:
+    """class_listings 행 - listing.build_listing_rows 와 같은 모양 (원본을 다시 읽지 않고 생성한 값으로)"""
+    return {
+        **{key: class_row[key] for key in ("class_id", "studio_id", "timezone", "class_datetime", "genre", "level")},
+        "studio_name": studio["name"],
+        "studio_instagram": studio["instagram"],
+        "dancers": [
+            {"dancer_id": d["dancer_id"], "main_name": d["main_name"], "instagram": d["instagram"]} for d in dancers
+        ],
+        "refreshed_at": now,
+    }
+
+
+async def insert_chunks(engine: AsyncEngine, table: Any, rows: List[Dict[str, Any]]) -> None:
+    for start in range(0, len(rows), INSERT_CHUNK_SIZE):
+        async with engine.begin() as conn:
+            await conn.execute(insert(table), rows[start:start + INSERT_CHUNK_SIZE])
+
+
+async def reset(engine: AsyncEngine) -> None:
+    async with engine.begin() as conn:
+        for table in (ClassListing.__table__, class_dancer_association, Class.__table__, DancerName.__table__, Dancer.__table__, Studio.__table__):
+            await conn.execute(delete(table))
+
+
+async def main(args: argparse.Namespace) -> None:
+    engine = DATABASE.engine
+    rng = random.Random(args.seed)
+    now = datetime.utcnow()
+    started = time.perf_counter()
+    try:
+        if args.create_tables:
+            async with engine.begin() as conn:
+                await conn.run_sync(Base.metadata.create_all)
+        if args.reset:
+            await reset(engine)
+
+        studios = make_studios(rng, args.studios, now)
+        await insert_chunks(engine, Studio.__table__, studios)
+        print(f"🏢 studios {len(studios)}")
+
+        dancers, names = make_dancers(rng, args.dancers, now)
+        await insert_chunks(engine, Dancer.__table__, dancers)
+        await insert_chunks(engine, DancerName.__table__, names)
+        print(f"💃 dancers {len(dancers)} (names {len(names)})")
+
+        studios_by_id = {s["studio_id"]: s for s in studios}
+        dancers_by_id = {d["dancer_id"]: d for d in dancers}
+        class_rows: List[Dict[str, Any]] = []
+        link_rows: List[Dict[str, Any]] = []
+        listing_rows: List[Dict[str, Any]] = []
+        inserted = 0
+        for class_row, links in iter_classes(rng, args.classes, list(studios_by_id), list(dancers_by_id), now):
+            class_rows.append(class_row)
+            link_rows.extend(links)
+            listing_rows.append(listing_row(
+                class_row,
+                studios_by_id[class_row["studio_id"]],
+                [dancers_by_id[link["dancer_id"]] for link in links],
+                now
+            ))
+            if len(class_rows) == INSERT_CHUNK_SIZE:
+                await insert_chunks(engine, Class.__table__, class_rows)
+                await insert_chunks(engine, class_dancer_association, link_rows)
+                await insert_chunks(engine, ClassListing.__table__, listing_rows)
+                inserted += len(class_rows)
+                class_rows, link_rows, listing_rows = [], [], []
+                if inserted % 100_000 == 0:
+                    print(f"📅 classes {inserted}/{args.classes}")
+        await insert_chunks(engine, Class.__table__, class_rows)
+        await insert_chunks(engine, class_dancer_association, link_rows)
+        await insert_chunks(engine, ClassListing.__table__, listing_rows)
+        print(f"📅 classes {args.classes}")
+        print(f"✅ done in {time.perf_counter() - started:.1f}s")
+    finally:
+        await DATABASE.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="부하 테스트용 데이터 생성")
+    parser.add_argument("--studios", type=int, default=500)
+    parser.add_argument("--dancers", type=int, default=20000)
+    parser.add_argument("--classes", type=int, default=1_000_000)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--reset", action="store_true", help="생성 전에 스튜디오/댄서/수업 테이블 비우기")
+    parser.add_argument("--create-tables", action="store_true", help="Base.metadata.create_all (로컬 확인용)")
+    asyncio.run(main(parser.parse_args()))
@@ -4,11 +4,19 @@ import { apiClient } from './client';
 export const studioApi = {
   getList: () => apiClient.get('/studio/list'),
   getById: (id: string) => apiClient.get(`/studio/${id}`),
+  // 스튜디오 정보 + 수업 목록 묶음 ({ studio, classes, next_cursor })
+  getPage: (id: string) => apiClient.get(`/studio/${id}/page`),
+  getInBounds: (sw: [number, number], ne: [number, number], limit = 500) =>
+    apiClient.get('/studio/in-bounds', {
+      params: { sw: sw.join(','), ne: ne.join(','), limit },
+    }),
 };
 
 // Dancer API
 export const dancerApi = {
   getById: (id: string) => apiClient.get(`/dancer/${id}`),
+  // 댄서 정보 + 수업 목록 묶음 ({ dancer, classes, next_cursor })
+  getPage: (id: string) => apiClient.get(`/dancer/${id}/page`),
 };
 
 // Class API
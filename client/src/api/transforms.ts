@@ -27,17 +27,20 @@ export function transformClassResponse(backendClass: any): ClassSchedule {
   };
 }
 
+/**
+ * 서울 지도 이미지의 위경도 범위
+ * 지도 뷰는 이 범위 안의 스튜디오만 /studio/in-bounds 로 조회
+ */
+export const MAP_BOUNDS = {
+  lat: { min: 37.4, max: 37.7 },  // 남 ~ 북
+  lng: { min: 126.8, max: 127.2 }, // 서 ~ 동
+};
+
 /**
  * 위경도를 지도 이미지 상의 % 좌표로 변환
  * 서울 지도 이미지가 커버하는 범위 기준
  */
 function convertLatLngToPercent(lat: number, lng: number): { x: number; y: number } {
-  // 서울 지도 이미지의 위경도 범위
-  const MAP_BOUNDS = {
-    lat: { min: 37.4, max: 37.7 },  // 남 ~ 북
-    lng: { min: 126.8, max: 127.2 }, // 서 ~ 동
-  };
-
   // 경도 → x% (왼쪽 0% ~ 오른쪽 100%)
   const x = ((lng - MAP_BOUNDS.lng.min) / (MAP_BOUNDS.lng.max - MAP_BOUNDS.lng.min)) * 100;
 
@@ -1,6 +1,6 @@
 import { useQuery } from '@tanstack/react-query';
 import { dancerApi } from '@/api/services';
-import { transformDancerResponse } from '@/api/transforms';
+import { transformClassResponse, transformDancerResponse } from '@/api/transforms';
 
 export function useDancer(dancerId: string) {
   return useQuery({
@@ -12,3 +12,20 @@ export function useDancer(dancerId: string) {
     enabled: !!dancerId,
   });
 }
+
+/**
+ * 댄서 상세 페이지용 - 댄서 정보와 수업 목록을 한 번의 요청으로 조회
+ */
+export function useDancerPage(dancerId: string) {
+  return useQuery({
+    queryKey: ['dancer', dancerId, 'page'],
+    queryFn: async () => {
+      const response = await dancerApi.getPage(dancerId);
+      return {
+        dancer: transformDancerResponse(response.data.dancer),
+        classes: response.data.classes.map(transformClassResponse),
+      };
+    },
+    enabled: !!dancerId,
+  });
+}
@@ -1,6 +1,6 @@
 import { useQuery } from '@tanstack/react-query';
 import { studioApi } from '@/api/services';
-import { transformStudioResponse } from '@/api/transforms';
+import { MAP_BOUNDS, transformClassResponse, transformStudioResponse } from '@/api/transforms';
 
 export function useStudioList() {
   return useQuery({
@@ -12,6 +12,23 @@ export function useStudioList() {
   });
 }
 
+/**
+ * 지도 뷰용 - 지도 이미지 범위 안의 스튜디오만 조회
+ */
+export function useMapStudios(enabled = true) {
+  return useQuery({
+    queryKey: ['studios', 'in-bounds', MAP_BOUNDS],
+    queryFn: async () => {
+      const response = await studioApi.getInBounds(
+        [MAP_BOUNDS.lat.min, MAP_BOUNDS.lng.min],
+        [MAP_BOUNDS.lat.max, MAP_BOUNDS.lng.max],
+      );
+      return response.data.map(transformStudioResponse);
+    },
+    enabled,
+  });
+}
+
 export function useStudio(studioId: string) {
   return useQuery({
     queryKey: ['studio', studioId],
@@ -22,3 +39,20 @@ export function useStudio(studioId: string) {
     enabled: !!studioId,
   });
 }
+
+/**
+ * 스튜디오 상세 페이지용 - 스튜디오 정보와 수업 목록을 한 번의 요청으로 조회
+ */
+export function useStudioPage(studioId: string) {
+  return useQuery({
+    queryKey: ['studio', studioId, 'page'],
+    queryFn: async () => {
+      const response = await studioApi.getPage(studioId);
+      return {
+        studio: transformStudioResponse(response.data.studio),
+        classes: response.data.classes.map(transformClassResponse),
+      };
+    },
+    enabled: !!studioId,
+  });
+}
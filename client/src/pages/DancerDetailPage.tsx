@@ -1,8 +1,7 @@
 import { useParams, Link, useNavigate } from "react-router-dom";
 import { Calendar } from "@/components/calendar";
 import { Logo, SearchBar } from "@/components/common";
-import { useDancer } from "@/hooks/useDancer";
-import { useDancerClasses } from "@/hooks/useClasses";
+import { useDancerPage } from "@/hooks/useDancer";
 import ArrowLeftIcon from "@/assets/icons/arrow_left.svg";
 
 /**
@@ -12,8 +11,9 @@ import ArrowLeftIcon from "@/assets/icons/arrow_left.svg";
 export default function DancerDetailPage() {
   const { id } = useParams<{ id: string }>();
   const navigate = useNavigate();
-  const { data: dancer, isLoading: dancerLoading } = useDancer(id || "");
-  const { data: classes = [] } = useDancerClasses(id || "");
+  const { data, isLoading: dancerLoading } = useDancerPage(id || "");
+  const dancer = data?.dancer;
+  const classes = data?.classes ?? [];
 
   if (dancerLoading) {
     return (
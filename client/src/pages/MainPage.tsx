@@ -7,7 +7,7 @@ import {
   StudioMapView,
 } from "@/components/main";
 import { Calendar } from "@/components/calendar";
-import { useStudioList } from "@/hooks/useStudio";
+import { useStudioList, useMapStudios } from "@/hooks/useStudio";
 import { useStudioClasses } from "@/hooks/useClasses";
 import type { ViewMode, Studio } from "@/types";
 
@@ -31,6 +31,7 @@ export default function MainPage() {
 
   // API 데이터 가져오기
   const { data: studios = [], isLoading: studiosLoading } = useStudioList();
+  const { data: mapStudios = [] } = useMapStudios(viewMode === "map");
   const { data: classes = [] } = useStudioClasses(selectedStudio?.studio_id || "");
 
   // 8. 헤더 높이 측정
@@ -176,7 +177,7 @@ export default function MainPage() {
             onStudioClick={handleStudioClick}
           />
         ) : (
-          <StudioMapView studios={studios} onPinClick={handleStudioClick} />
+          <StudioMapView studios={mapStudios} onPinClick={handleStudioClick} />
         )}
       </div>
 
@@ -1,8 +1,7 @@
 import { useParams, Link, useNavigate } from "react-router-dom";
 import { Calendar } from "@/components/calendar";
 import { Logo, SearchBar } from "@/components/common";
-import { useStudio } from "@/hooks/useStudio";
-import { useStudioClasses } from "@/hooks/useClasses";
+import { useStudioPage } from "@/hooks/useStudio";
 import ArrowLeftIcon from "@/assets/icons/arrow_left.svg";
 
 /**
@@ -12,8 +11,9 @@ import ArrowLeftIcon from "@/assets/icons/arrow_left.svg";
 export default function StudioDetailPage() {
   const { id } = useParams<{ id: string }>();
   const navigate = useNavigate();
-  const { data: studio, isLoading: studioLoading } = useStudio(id || "");
-  const { data: classes = [] } = useStudioClasses(id || "");
+  const { data, isLoading: studioLoading } = useStudioPage(id || "");
+  const studio = data?.studio;
+  const classes = data?.classes ?? [];
 
   if (studioLoading) {
     return (
@@ -1,6 +1,2 @@
-# Import models in correct order to resolve foreign key dependencies
-from server.features.user import models as user_models
-from server.features.dancer import models as dancer_models
-from server.features.studio import models as studio_models
-
-__all__ = ["user_models", "dancer_models", "studio_models"]
+# 어느 모듈을 먼저 import 하더라도 모든 모델이 등록되도록 (FK/관계 해석)
+import server.database.models  # noqa: F401
@@ -4,10 +4,18 @@ from server.features.dancer.views import dancer_router
 from server.features.studio.views import studio_router
 from server.features.dance_class.views import class_router
 from server.features.search.views import search_router
+from server.features.page.views import page_router
+from server.internal.settings import INTERNAL_SETTINGS
+from server.internal.views import internal_router
 
 api_router = APIRouter()
 
 api_router.include_router(dancer_router, prefix="/dancer", tags=["dancer"])
 api_router.include_router(studio_router, prefix="/studio", tags=["studio"])
 api_router.include_router(class_router, prefix="/class", tags=["class"])
-api_router.include_router(search_router, prefix="/search", tags=["search"])
\ No newline at end of file
+api_router.include_router(search_router, prefix="/search", tags=["search"])
+# 상세 페이지 묶음 (/studio/{id}/page, /dancer/{id}/page)
+api_router.include_router(page_router, prefix="", tags=["page"])
+# 운영 지표 (/internal/cache, /internal/db-pool) - 기본은 노출하지 않음
+if INTERNAL_SETTINGS.enabled:
+    api_router.include_router(internal_router, prefix="/internal", tags=["internal"])
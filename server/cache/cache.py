@@ -0,0 +1,275 @@
+"""조회 응답 read-through 캐시 (프로세스 내 LRU + 선택적 Redis 공유 계층)
+
+서비스에서 RESPONSE_CACHE.get_or_load(...) 로 조회를 감싸고,
+Store 의 쓰기 경로에서 queue_cache_invalidation(SESSION().info, tags) 로 바뀐 대상을 태그로 등록하면
+커밋 직후 해당 태그가 붙은 항목을 지운다 (롤백되면 폐기).
+"""
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, asdict
+from typing import Any, Awaitable, Callable, Dict, Iterable, Optional, Set, Tuple, TypeVar, overload
+
+from pydantic import TypeAdapter
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from server.cache.settings import CACHE_SETTINGS, CacheSettings
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+_MISSING = object()
+_PENDING_KEY = "cache_invalidation_pending"
+
+
+# ======================== TAGS ========================
+
+STUDIO_LIST_TAG = "studio:list"
+
+
+def studio_tag(studio_id: str) -> str:
+    return f"studio:{studio_id}"
+
+
+def dancer_tag(dancer_id: str) -> str:
+    return f"dancer:{dancer_id}"
+
+
+def studio_classes_tag(studio_id: str) -> str:
+    return f"class:studio:{studio_id}"
+
+
+# ======================== TIERS ========================
+
+class LRUCacheTier:
+    """프로세스 내 LRU (항목별 만료 시각 + 태그 역색인)"""
+
+    def __init__(self, max_entries: int, ttl: int) -> None:
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.entries: OrderedDict[str, Tuple[float, Any, Tuple[str, ...]]] = OrderedDict()
+        self.keys_by_tag: Dict[str, Set[str]] = {}
+
+    def get(self, key: str) -> Any:
+        entry = self.entries.get(key)
+        if entry is None:
+            return _MISSING
+        expires_at, value, _ = entry
+        if expires_at <= time.monotonic():
+            self._drop(key)
+            return _MISSING
+        self.entries.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: Any, tags: Tuple[str, ...]) -> None:
+        self._drop(key)
+        self.entries[key] = (time.monotonic() + self.ttl, value, tags)
+        for tag in tags:
+            self.keys_by_tag.setdefault(tag, set()).add(key)
+        while len(self.entries) > self.max_entries:
+            self._drop(next(iter(self.entries)))
+
+    def discard(self, tags: Iterable[str]) -> None:
+        for tag in tags:
+            for key in self.keys_by_tag.pop(tag, ()):
+                self._drop(key)
+
+    def _drop(self, key: str) -> None:
+        entry = self.entries.pop(key, None)
+        if entry is None:
+            return
+        for tag in entry[2]:
+            keys = self.keys_by_tag.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self.keys_by_tag[tag]
+
+
+class RedisCacheTier:
+    """여러 API 프로세스가 공유하는 Redis 계층 (JSON 직렬화, 태그는 Redis SET 으로 관리)"""
+
+    def __init__(self, redis: Redis, ttl: int, key_prefix: str) -> None:
+        self.redis = redis
+        self.ttl = ttl
+        self.key_prefix = key_prefix
+
+    async def get(self, key: str) -> Optional[bytes]:
+        return await self.redis.get(self.key_prefix + key)
+
+    async def set(self, key: str, payload: bytes, tags: Tuple[str, ...]) -> None:
+        async with self.redis.pipeline(transaction=False) as pipe:
+            pipe.set(self.key_prefix + key, payload, ex=self.ttl)
+            for tag in tags:
+                pipe.sadd(self._tag_key(tag), self.key_prefix + key)
+                pipe.expire(self._tag_key(tag), self.ttl)
+            await pipe.execute()
+
+    async def discard(self, tags: Iterable[str]) -> None:
+        tag_keys = [self._tag_key(tag) for tag in tags]
+        async with self.redis.pipeline(transaction=False) as pipe:
+            for tag_key in tag_keys:
+                pipe.smembers(tag_key)
+            members = await pipe.execute()
+        keys = {key for tag_members in members for key in tag_members}
+        await self.redis.delete(*keys, *tag_keys)
+
+    def _tag_key(self, tag: str) -> str:
+        return f"{self.key_prefix}tag:{tag}"
+
+
+# ======================== CACHE ========================
+
+@dataclass
+class CacheStats:
+    """캐시 크기 조정용 카운터 (프로세스 단위)"""
+    local_hits: int = 0
+    shared_hits: int = 0
+    misses: int = 0
+    invalidated_tags: int = 0
+    shared_errors: int = 0
+
+
+class ResponseCache:
+    def __init__(self, settings: CacheSettings) -> None:
+        self.enabled = settings.enabled
+        self.local = LRUCacheTier(settings.lru_max_entries, settings.lru_ttl)
+        self.shared: Optional[RedisCacheTier] = None
+        if settings.redis_url:
+            self.shared = RedisCacheTier(Redis.from_url(settings.redis_url), settings.redis_ttl, settings.key_prefix)
+        self.stats = CacheStats()
+        # 조회 중에 무효화가 일어났으면 (이전 데이터일 수 있으므로) 결과를 저장하지 않기 위한 순번
+        self._invalidation_seq = 0
+        self._background: Set[asyncio.Task] = set()
+
+    # loader 가 None 을 반환하지 않으면 결과도 None 이 아님
+    @overload
+    async def get_or_load(
+        self,
+        key: str,
+        adapter: TypeAdapter[T],
+        loader: Callable[[], Awaitable[T]],
+        tags: Iterable[str] = ()
+    ) -> T: ...
+
+    @overload
+    async def get_or_load(
+        self,
+        key: str,
+        adapter: TypeAdapter[T],
+        loader: Callable[[], Awaitable[Optional[T]]],
+        tags: Iterable[str] = ()
+    ) -> Optional[T]: ...
+
+    async def get_or_load(
+        self,
+        key: str,
+        adapter: TypeAdapter[T],
+        loader: Callable[[], Awaitable[Optional[T]]],
+        tags: Iterable[str] = ()
+    ) -> Optional[T]:
+        """캐시에 있으면 반환하고, 없으면 loader 결과를 저장 후 반환 (None 은 저장하지 않음)
+
+        Args:
+            adapter: Redis 계층 직렬화용
+            tags: 이 항목을 무효화할 태그
+        """
+        if not self.enabled:
+            return await loader()
+        tags = tuple(set(tags))
+
+        value = self.local.get(key)
+        if value is not _MISSING:
+            self.stats.local_hits += 1
+            return value
+
+        seq = self._invalidation_seq
+        if self.shared is not None:
+            payload = await self._shared_call(self.shared.get(key))
+            if payload is not None:
+                self.stats.shared_hits += 1
+                value = adapter.validate_json(payload)
+                if seq == self._invalidation_seq:
+                    self.local.set(key, value, tags)
+                return value
+
+        self.stats.misses += 1
+        value = await loader()
+        if value is None or seq != self._invalidation_seq:
+            return value
+        self.local.set(key, value, tags)
+        if self.shared is not None:
+            await self._shared_call(self.shared.set(key, adapter.dump_json(value), tags))
+        return value
+
+    def invalidate(self, tags: Iterable[str]) -> None:
+        """태그가 붙은 항목 삭제 (LRU 는 즉시, Redis 는 백그라운드)"""
+        tags = tuple(set(tags))
+        if not tags:
+            return
+        self._invalidation_seq += 1
+        self.stats.invalidated_tags += len(tags)
+        self.local.discard(tags)
+        if self.shared is None:
+            return
+        try:
+            task = asyncio.get_running_loop().create_task(self._shared_call(self.shared.discard(tags)))
+        except RuntimeError:
+            # 이벤트 루프 밖(스크립트 등)의 커밋 - Redis 항목은 TTL 로 만료
+            logger.warning("cache invalidation outside event loop, shared entries expire by TTL: %s", tags)
+            return
+        self._background.add(task)
+        task.add_done_callback(self._background.discard)
+
+    async def close(self) -> None:
+        """진행 중인 Redis 무효화를 기다린 뒤 연결 정리 (이벤트 루프를 닫기 전에 호출)"""
+        if self._background:
+            await asyncio.gather(*self._background, return_exceptions=True)
+        if self.shared is not None:
+            await self.shared.redis.connection_pool.disconnect()
+
+    def snapshot(self) -> Dict[str, Any]:
+        lookups = self.stats.local_hits + self.stats.shared_hits + self.stats.misses
+        return {
+            **asdict(self.stats),
+            "hit_ratio": (lookups - self.stats.misses) / lookups if lookups else None,
+            "local_entries": len(self.local.entries),
+            "local_max_entries": self.local.max_entries,
+            "shared_enabled": self.shared is not None,
+        }
+
+    async def _shared_call(self, call: Awaitable[Any]) -> Any:
+        """Redis 오류는 캐시 미스로 취급 (요청은 DB 로 처리)"""
+        try:
+            return await call
+        except (RedisError, OSError) as e:
+            self.stats.shared_errors += 1
+            logger.warning("shared cache error: %s", e)
+            return None
+
+
+RESPONSE_CACHE = ResponseCache(CACHE_SETTINGS)
+
+
+# ======================== WRITE-DRIVEN INVALIDATION ========================
+
+def queue_cache_invalidation(session_info: Dict[str, Any], tags: Iterable[str]) -> None:
+    """쓰기 트랜잭션이 커밋되면 무효화할 태그 등록"""
+    session_info.setdefault(_PENDING_KEY, set()).update(tags)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_committed(session: Session) -> None:
+    tags = session.info.pop(_PENDING_KEY, None)
+    if tags:
+        RESPONSE_CACHE.invalidate(tags)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_pending_invalidation(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
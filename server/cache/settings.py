@@ -0,0 +1,27 @@
+from typing import Optional
+
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+
+class CacheSettings(BaseSettings):
+    # False 면 캐시를 거치지 않고 항상 DB 조회
+    enabled: bool = True
+    # 프로세스 내 LRU 최대 항목 수
+    lru_max_entries: int = 2048
+    # 프로세스 내 LRU 보관 시간 (초) - 다른 프로세스에서 발생한 쓰기는 LRU 까지 무효화하지 못하므로 짧게 유지
+    lru_ttl: int = 30
+    # Redis 공유 캐시 (비우면 Redis 계층 없이 LRU 만 사용)
+    redis_url: Optional[str] = None
+    # Redis 보관 시간 (초)
+    redis_ttl: int = 300
+    key_prefix: str = "oddc:cache:"
+
+    model_config = SettingsConfigDict(
+        case_sensitive=False,
+        env_prefix="CACHE_",
+        env_file=".env",
+        extra = "allow"
+    )
+
+
+CACHE_SETTINGS = CacheSettings()
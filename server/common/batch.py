@@ -0,0 +1,29 @@
+"""id 목록 일괄 조회 (POST /studio/batch, /dancer/batch, /class/batch) 공통 요청/정렬"""
+from typing import Dict, List, Tuple, TypeVar
+
+from pydantic import BaseModel, Field, field_validator
+
+# 한 번에 조회할 수 있는 최대 id 개수
+MAX_BATCH_IDS = 100
+
+T = TypeVar("T")
+
+
+class BatchGetRequest(BaseModel):
+    """id 목록 일괄 조회 요청 (중복 id 는 처음 한 번만 조회/응답)"""
+    ids: List[str] = Field(
+        description=f"조회할 id 목록 (최대 {MAX_BATCH_IDS}개, 응답은 이 순서)",
+        examples=[["550e8400-e29b-41d4-a716-446655440001", "550e8400-e29b-41d4-a716-446655440002"]],
+        min_length=1,
+        max_length=MAX_BATCH_IDS
+    )
+
+    @field_validator("ids")
+    @classmethod
+    def dedupe_ids(cls, v: List[str]) -> List[str]:
+        return list(dict.fromkeys(v))
+
+
+def in_request_order(ids: List[str], items_by_id: Dict[str, T]) -> Tuple[List[T], List[str]]:
+    """(요청 순서대로 정렬한 결과, 찾지 못한 id 목록)"""
+    return [items_by_id[i] for i in ids if i in items_by_id], [i for i in ids if i not in items_by_id]
@@ -0,0 +1,46 @@
+"""updated_at 워터마크 기반 강한 ETag / 조건부 GET
+
+응답 본문을 해시하지 않고 엔티티 버전으로 ETag 를 만들기 때문에,
+If-None-Match 가 일치하면 행을 불러오거나 직렬화하지 않고 304 를 반환할 수 있다.
+"""
+import hashlib
+from datetime import datetime
+from typing import Any
+
+from fastapi import Request, Response
+from starlette.status import HTTP_304_NOT_MODIFIED
+
+ETAG_HEADER = "ETag"
+# 브라우저가 저장은 하되 매번 If-None-Match 로 재검증하도록
+ETAG_CACHE_CONTROL = "no-cache"
+
+
+def make_etag(*parts: Any) -> str:
+    """리소스 종류/ID/워터마크로 ETag 생성"""
+    raw = "|".join(
+        "" if part is None else part.isoformat() if isinstance(part, datetime) else str(part)
+        for part in parts
+    )
+    return f'"{hashlib.sha1(raw.encode()).hexdigest()}"'
+
+
+def is_not_modified(request: Request, etag: str) -> bool:
+    """If-None-Match 에 현재 ETag 가 있는지 (If-None-Match 는 약한 비교)"""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    return any(candidate.strip().removeprefix("W/") == etag for candidate in header.split(","))
+
+
+def not_modified_response(etag: str) -> Response:
+    return Response(
+        status_code=HTTP_304_NOT_MODIFIED,
+        headers={ETAG_HEADER: etag, "Cache-Control": ETAG_CACHE_CONTROL}
+    )
+
+
+def set_etag(response: Response, etag: str) -> None:
+    response.headers[ETAG_HEADER] = etag
+    response.headers["Cache-Control"] = ETAG_CACHE_CONTROL
@@ -0,0 +1,19 @@
+"""큰 목록 응답용 빠른 JSON 경로
+
+SQL 결과 행을 응답 스키마 모양의 dict 로 바로 만들어 orjson 으로 인코딩한다.
+pydantic 모델 생성과 FastAPI 의 반환 타입 재검증/jsonable_encoder 를 거치지 않으므로,
+라우트에는 response_model 을 지정해 OpenAPI 문서를 유지한다.
+"""
+from typing import Any
+
+import orjson
+from fastapi import Response
+
+
+def encode_json(content: Any) -> bytes:
+    return orjson.dumps(content)
+
+
+class RawJSONResponse(Response):
+    """이미 인코딩된 JSON 바이트를 그대로 보내는 응답"""
+    media_type = "application/json"
@@ -0,0 +1,103 @@
+"""위치 기반 조회용 geohash / 거리 계산
+
+스튜디오 좌표를 geohash 문자열로 저장해 B-tree 인덱스로 범위 조회한다.
+조회 영역(BoundingBox)을 덮는 geohash 셀 prefix 들로 후보를 좁히고 (LIKE 'prefix%' 는 인덱스 범위 스캔),
+정확한 범위 판정과 거리순 정렬은 위경도로 SQL 에서 한다.
+"""
+import math
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
+
+GEOHASH_BASE32 = "0123456789bcdefghjkmnpqrstuvwxyz"
+# 저장 정밀도 (9자리 ≈ 4.8m x 4.8m)
+GEOHASH_PRECISION = 9
+# 한 조회에서 OR 로 묶을 최대 셀 개수 (넘으면 한 단계 짧은 prefix 사용)
+MAX_COVER_CELLS = 16
+EARTH_RADIUS_M = 6_371_008.8
+# 위도 1도의 길이 (m)
+METERS_PER_DEGREE = EARTH_RADIUS_M * math.pi / 180
+
+
+@dataclass(frozen=True)
+class BoundingBox:
+    """남서(south, west) ~ 북동(north, east) 위경도 범위 (날짜변경선을 넘는 범위는 지원하지 않음)"""
+    south: float
+    west: float
+    north: float
+    east: float
+
+    @property
+    def center(self) -> Tuple[float, float]:
+        return (self.south + self.north) / 2, (self.west + self.east) / 2
+
+
+def encode_geohash(lat: float, lng: float, precision: int = GEOHASH_PRECISION) -> str:
+    """위경도를 geohash 문자열로 인코딩 (경도/위도 비트를 번갈아 5비트씩 base32 문자로)"""
+    lat_range = [-90.0, 90.0]
+    lng_range = [-180.0, 180.0]
+    chars: List[str] = []
+    bits = bit_count = 0
+    use_lng = True
+    while len(chars) < precision:
+        value_range, value = (lng_range, lng) if use_lng else (lat_range, lat)
+        mid = (value_range[0] + value_range[1]) / 2
+        if value >= mid:
+            bits = bits * 2 + 1
+            value_range[0] = mid
+        else:
+            bits = bits * 2
+            value_range[1] = mid
+        use_lng = not use_lng
+        bit_count += 1
+        if bit_count == 5:
+            chars.append(GEOHASH_BASE32[bits])
+            bits = bit_count = 0
+    return "".join(chars)
+
+
+def studio_geohash(lat: Optional[float], lng: Optional[float]) -> Optional[str]:
+    """좌표가 모두 있을 때만 geohash (저장용)"""
+    if lat is None or lng is None:
+        return None
+    return encode_geohash(float(lat), float(lng))
+
+
+def geohash_cover(box: BoundingBox) -> List[str]:
+    """box 를 덮는 geohash 셀 prefix 목록 (MAX_COVER_CELLS 개 이하가 되는 가장 긴 길이)
+
+    셀 개수가 너무 많은 넓은 범위(대륙 단위 등)면 빈 목록 - 위경도 범위 조건만으로 조회
+    """
+    for precision in range(GEOHASH_PRECISION, 0, -1):
+        # precision 자리 geohash 셀의 크기 (경도 비트가 위도 비트보다 같거나 하나 많음)
+        lat_bits, lng_bits = 5 * precision // 2, (5 * precision + 1) // 2
+        cell_height, cell_width = 180.0 / 2 ** lat_bits, 360.0 / 2 ** lng_bits
+        rows = range(_cell_index(box.south + 90, cell_height, lat_bits), _cell_index(box.north + 90, cell_height, lat_bits) + 1)
+        cols = range(_cell_index(box.west + 180, cell_width, lng_bits), _cell_index(box.east + 180, cell_width, lng_bits) + 1)
+        if len(rows) * len(cols) <= MAX_COVER_CELLS:
+            return [
+                encode_geohash((row + 0.5) * cell_height - 90, (col + 0.5) * cell_width - 180, precision)
+                for row in rows
+                for col in cols
+            ]
+    return []
+
+
+def _cell_index(offset: float, cell_size: float, bits: int) -> int:
+    return min(int(offset // cell_size), 2 ** bits - 1)
+
+
+def box_around(lat: float, lng: float, radius_m: float) -> BoundingBox:
+    """(lat, lng) 중심 반경 radius_m 원을 감싸는 범위"""
+    lat_delta = math.degrees(radius_m / EARTH_RADIUS_M)
+    lng_delta = lat_delta / longitude_scale(lat)
+    return BoundingBox(
+        south=max(lat - lat_delta, -90.0),
+        west=max(lng - lng_delta, -180.0),
+        north=min(lat + lat_delta, 90.0),
+        east=min(lng + lng_delta, 180.0)
+    )
+
+
+def longitude_scale(lat: float) -> float:
+    """위도 lat 에서 경도 1도의 길이 / 위도 1도의 길이 (평면 근사 거리용)"""
+    return max(math.cos(math.radians(lat)), 1e-6)
@@ -0,0 +1,56 @@
+import base64
+from datetime import datetime
+from typing import Iterator, List, Tuple, TypeVar
+
+from server.common.errors import invalid_field_format_error
+
+
+def encode_cursor(position: datetime, item_id: str) -> str:
+    """(정렬 기준 시각, ID) 키셋 위치를 URL-safe 커서 문자열로 인코딩"""
+    raw = f"{position.isoformat()}|{item_id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, str]:
+    """encode_cursor 로 만든 커서를 (정렬 기준 시각, ID) 로 디코딩"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        position, item_id = base64.urlsafe_b64decode(padded.encode()).decode().split("|", 1)
+        return datetime.fromisoformat(position), item_id
+    except Exception:
+        raise invalid_field_format_error("유효하지 않은 커서입니다.")
+
+
+def encode_distance_cursor(distance: float, item_id: str) -> str:
+    """(거리, ID) 키셋 위치를 커서 문자열로 인코딩 (거리순 목록용)"""
+    raw = f"{distance!r}|{item_id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_distance_cursor(cursor: str) -> Tuple[float, str]:
+    """encode_distance_cursor 로 만든 커서를 (거리, ID) 로 디코딩"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        distance, item_id = base64.urlsafe_b64decode(padded.encode()).decode().split("|", 1)
+        return float(distance), item_id
+    except Exception:
+        raise invalid_field_format_error("유효하지 않은 커서입니다.")
+
+
+def to_naive_datetime(value: datetime) -> datetime:
+    """DB 의 DateTime 컬럼은 tz 없이 벽시계 시각을 저장하므로 비교용으로 tzinfo 제거"""
+    return value.replace(tzinfo=None)
+
+
+def normalize_name(name: str) -> str:
+    """이름 비교/조회용 정규화 (앞뒤 공백 제거 + 대소문자 통일)"""
+    return name.strip().casefold()
+
+
+T = TypeVar("T")
+
+
+def chunked(items: List[T], size: int) -> Iterator[List[T]]:
+    """IN 쿼리/다중 행 INSERT 크기를 제한하기 위해 size 개씩 나눔"""
+    for i in range(0, len(items), size):
+        yield items[i:i + size]
@@ -10,10 +10,7 @@ from server.database.common import Base
 from server.database.settings import DB_SETTINGS
 
 # 모든 모델 import (Alembic autogenerate를 위해 필요)
-import server.features.user.models
-import server.features.dancer.models
-import server.features.studio.models
-import server.features.dance_class.models
+import server.database.models  # noqa: F401
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
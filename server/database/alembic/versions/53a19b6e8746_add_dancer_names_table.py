@@ -0,0 +1,71 @@
+"""add dancer_names table
+
+Revision ID: 53a19b6e8746
+Revises: a5228ac1f2c1
+Create Date: 2026-10-18 11:02:47.118530
+
+"""
+import uuid
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from server.common.utils import normalize_name
+
+
+# revision identifiers, used by Alembic.
+revision: str = '53a19b6e8746'
+down_revision: Union[str, Sequence[str], None] = 'a5228ac1f2c1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BACKFILL_BATCH_SIZE = 1000
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    dancer_names = op.create_table(
+        'dancer_names',
+        sa.Column('dancer_name_id', sa.String(length=36), nullable=False),
+        sa.Column('dancer_id', sa.String(length=36), nullable=False),
+        sa.Column('name', sa.String(length=50), nullable=False),
+        sa.Column('normalized_name', sa.String(length=50), nullable=False),
+        sa.ForeignKeyConstraint(['dancer_id'], ['dancers.dancer_id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('dancer_name_id'),
+        sa.UniqueConstraint('dancer_id', 'normalized_name', name='uq_dancer_names_dancer_id_normalized_name')
+    )
+    op.create_index('ix_dancer_names_normalized_name', 'dancer_names', ['normalized_name'], unique=False)
+
+    # 기존 dancers.names JSON 배열을 펼쳐 채움 (앱과 같은 normalize_name 사용)
+    dancers = sa.table(
+        'dancers',
+        sa.column('dancer_id', sa.String(36)),
+        sa.column('names', sa.JSON)
+    )
+    bind = op.get_bind()
+    rows = []
+    for dancer_id, names in bind.execute(sa.select(dancers.c.dancer_id, dancers.c.names)):
+        seen = set()
+        for name in names or []:
+            normalized = normalize_name(name)
+            if not normalized or normalized in seen:
+                continue
+            seen.add(normalized)
+            rows.append({
+                'dancer_name_id': str(uuid.uuid4()),
+                'dancer_id': dancer_id,
+                'name': name,
+                'normalized_name': normalized
+            })
+        if len(rows) >= BACKFILL_BATCH_SIZE:
+            op.bulk_insert(dancer_names, rows)
+            rows = []
+    if rows:
+        op.bulk_insert(dancer_names, rows)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_dancer_names_normalized_name', table_name='dancer_names')
+    op.drop_table('dancer_names')
@@ -0,0 +1,52 @@
+"""add studio geohash
+
+Revision ID: a4d7c2e9b815
+Revises: e3b9d27f5c14
+Create Date: 2026-10-18 17:05:12.381904
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from server.common.geo import studio_geohash
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a4d7c2e9b815'
+down_revision: Union[str, Sequence[str], None] = 'e3b9d27f5c14'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('studios', sa.Column('geohash', sa.String(length=12), nullable=True))
+    op.create_index(op.f('ix_studios_geohash'), 'studios', ['geohash'], unique=False)
+
+    # 좌표가 있는 기존 스튜디오 채우기 (updated_at 은 그대로 - 응답 내용은 바뀌지 않음)
+    studios = sa.table(
+        'studios',
+        sa.column('studio_id', sa.String),
+        sa.column('lat', sa.Numeric),
+        sa.column('lng', sa.Numeric),
+        sa.column('geohash', sa.String)
+    )
+    connection = op.get_bind()
+    rows = connection.execute(
+        sa.select(studios.c.studio_id, studios.c.lat, studios.c.lng)
+        .where(studios.c.lat.is_not(None), studios.c.lng.is_not(None))
+    ).all()
+    for row in rows:
+        connection.execute(
+            studios.update()
+            .where(studios.c.studio_id == row.studio_id)
+            .values(geohash=studio_geohash(row.lat, row.lng))
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_studios_geohash'), table_name='studios')
+    op.drop_column('studios', 'geohash')
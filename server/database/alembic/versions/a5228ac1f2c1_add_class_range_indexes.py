@@ -0,0 +1,40 @@
+"""add class range indexes
+
+Revision ID: a5228ac1f2c1
+Revises: 
+Create Date: 2026-10-18 10:12:31.402116
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a5228ac1f2c1'
+down_revision: Union[str, Sequence[str], None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'ix_classes_studio_id_class_datetime',
+        'classes',
+        ['studio_id', 'class_datetime'],
+        unique=False
+    )
+    op.create_index(
+        'ix_class_dancer_association_dancer_id_class_id',
+        'class_dancer_association',
+        ['dancer_id', 'class_id'],
+        unique=False
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_class_dancer_association_dancer_id_class_id', table_name='class_dancer_association')
+    op.drop_index('ix_classes_studio_id_class_datetime', table_name='classes')
@@ -0,0 +1,64 @@
+"""index dancer main names
+
+Revision ID: a9e3d5b17c42
+Revises: f4a1c8e2b9d6
+Create Date: 2026-10-19 10:05:41.730266
+
+"""
+import uuid
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from server.common.utils import normalize_name
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a9e3d5b17c42'
+down_revision: Union[str, Sequence[str], None] = 'f4a1c8e2b9d6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BACKFILL_BATCH_SIZE = 1000
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # names 에 없는 main_name 도 dancer_names 에 채움 (앱의 sync_name_entries 와 같은 기준)
+    dancers = sa.table(
+        'dancers',
+        sa.column('dancer_id', sa.String(36)),
+        sa.column('main_name', sa.String(20))
+    )
+    dancer_names = sa.table(
+        'dancer_names',
+        sa.column('dancer_name_id', sa.String(36)),
+        sa.column('dancer_id', sa.String(36)),
+        sa.column('name', sa.String(50)),
+        sa.column('normalized_name', sa.String(50))
+    )
+    bind = op.get_bind()
+    indexed = set(bind.execute(sa.select(dancer_names.c.dancer_id, dancer_names.c.normalized_name)).all())
+    rows = []
+    for dancer_id, main_name in bind.execute(sa.select(dancers.c.dancer_id, dancers.c.main_name)):
+        normalized = normalize_name(main_name or "")
+        if not normalized or (dancer_id, normalized) in indexed:
+            continue
+        rows.append({
+            'dancer_name_id': str(uuid.uuid4()),
+            'dancer_id': dancer_id,
+            'name': main_name,
+            'normalized_name': normalized
+        })
+        if len(rows) >= BACKFILL_BATCH_SIZE:
+            op.bulk_insert(dancer_names, rows)
+            rows = []
+    if rows:
+        op.bulk_insert(dancer_names, rows)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # 채운 행은 names 에 있는 이름과 구분되지 않고, 남아 있어도 조회에 해가 없으므로 그대로 둠
+    pass
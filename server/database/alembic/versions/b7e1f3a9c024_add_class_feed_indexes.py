@@ -0,0 +1,40 @@
+"""add class feed indexes
+
+Revision ID: b7e1f3a9c024
+Revises: a4d7c2e9b815
+Create Date: 2026-10-18 18:02:44.915307
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7e1f3a9c024'
+down_revision: Union[str, Sequence[str], None] = 'a4d7c2e9b815'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'ix_classes_class_datetime',
+        'classes',
+        ['class_datetime'],
+        unique=False
+    )
+    op.create_index(
+        'ix_classes_class_datetime_genre_level_studio_id',
+        'classes',
+        ['class_datetime', 'genre', 'level', 'studio_id'],
+        unique=False
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_classes_class_datetime_genre_level_studio_id', table_name='classes')
+    op.drop_index('ix_classes_class_datetime', table_name='classes')
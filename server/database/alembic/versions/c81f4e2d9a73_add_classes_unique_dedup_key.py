@@ -0,0 +1,48 @@
+"""add classes unique dedup key
+
+Revision ID: c81f4e2d9a73
+Revises: 53a19b6e8746
+Create Date: 2026-10-18 14:41:09.527344
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c81f4e2d9a73'
+down_revision: Union[str, Sequence[str], None] = '53a19b6e8746'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # 남아 있는 중복이 있으면 인덱스 생성이 실패하므로 먼저 정리 스크립트를 안내
+    duplicates = op.get_bind().scalar(sa.text(
+        "SELECT COUNT(*) FROM ("
+        "  SELECT 1 FROM classes"
+        "  GROUP BY studio_id, class_datetime, genre, level"
+        "  HAVING COUNT(*) > 1"
+        ") AS duplicate_groups"
+    ))
+    if duplicates:
+        raise RuntimeError(
+            f"classes 에 중복 그룹이 {duplicates}개 있습니다. "
+            "python -m server.scripts.remove_duplicate_classes 로 정리한 뒤 다시 실행하세요."
+        )
+
+    # genre 는 NULL 끼리도 중복으로 보도록 COALESCE 한 함수형 키 (MySQL 8.0.13+)
+    op.create_index(
+        'uq_classes_studio_id_class_datetime_genre_level',
+        'classes',
+        ['studio_id', 'class_datetime', sa.text("(coalesce(genre, ''))"), 'level'],
+        unique=True
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('uq_classes_studio_id_class_datetime_genre_level', table_name='classes')
@@ -0,0 +1,85 @@
+"""add class listings
+
+Revision ID: d2c8a5f1b367
+Revises: b7e1f3a9c024
+Create Date: 2026-10-18 19:11:37.204518
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import mysql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd2c8a5f1b367'
+down_revision: Union[str, Sequence[str], None] = 'b7e1f3a9c024'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+GENRES = (
+    'CHOREOGRAPHY', 'HIPHOP', 'GIRLS_HIPHOP', 'BREAKING', 'LOCKING', 'POPPING', 'HOUSE', 'KRUMP', 'WACKING',
+    'VOGUING', 'HEEL', 'SOUL', 'AFRO', 'K_POP', 'CONTEMPORARY', 'JAZZ', 'DANCEHALL'
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'class_listings',
+        sa.Column('class_id', sa.String(length=36), nullable=False),
+        sa.Column('studio_id', sa.String(length=36), nullable=False),
+        sa.Column('timezone', sa.String(length=50), nullable=False),
+        sa.Column('class_datetime', sa.DateTime(), nullable=False),
+        sa.Column('genre', sa.Enum(*GENRES, name='genre'), nullable=True),
+        sa.Column('level', sa.Enum('BASIC', 'ADVANCED', name='level'), nullable=False),
+        sa.Column('studio_name', sa.String(length=50), nullable=False),
+        sa.Column('studio_instagram', sa.String(length=50), nullable=True),
+        sa.Column('dancers', sa.JSON(), nullable=False),
+        sa.Column('refreshed_at', sa.DateTime().with_variant(mysql.DATETIME(fsp=6), 'mysql'), nullable=False),
+        sa.ForeignKeyConstraint(['class_id'], ['classes.class_id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('class_id')
+    )
+    op.create_index(
+        'ix_class_listings_studio_id_class_datetime',
+        'class_listings',
+        ['studio_id', 'class_datetime'],
+        unique=False
+    )
+    op.create_index('ix_class_listings_class_datetime', 'class_listings', ['class_datetime'], unique=False)
+
+    # 기존 수업 채우기 - 서버에서 한 문장으로 (JSON_ARRAYAGG, MySQL 5.7.22+)
+    # 이후 어긋나면 python -m server.scripts.rebuild_class_listings 로 다시 만든다
+    op.execute(
+        """
+        INSERT INTO class_listings (
+            class_id, studio_id, timezone, class_datetime, genre, level,
+            studio_name, studio_instagram, dancers, refreshed_at
+        )
+        SELECT
+            c.class_id, c.studio_id, c.timezone, c.class_datetime, c.genre, c.level,
+            s.name, s.instagram,
+            COALESCE(
+                (
+                    SELECT JSON_ARRAYAGG(
+                        JSON_OBJECT('dancer_id', d.dancer_id, 'main_name', d.main_name, 'instagram', d.instagram)
+                    )
+                    FROM class_dancer_association a
+                    JOIN dancers d ON d.dancer_id = a.dancer_id
+                    WHERE a.class_id = c.class_id
+                ),
+                JSON_ARRAY()
+            ),
+            UTC_TIMESTAMP(6)
+        FROM classes c
+        JOIN studios s ON s.studio_id = c.studio_id
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_class_listings_class_datetime', table_name='class_listings')
+    op.drop_index('ix_class_listings_studio_id_class_datetime', table_name='class_listings')
+    op.drop_table('class_listings')
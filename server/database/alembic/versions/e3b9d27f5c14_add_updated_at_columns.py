@@ -0,0 +1,42 @@
+"""add updated_at columns
+
+Revision ID: e3b9d27f5c14
+Revises: c81f4e2d9a73
+Create Date: 2026-10-18 15:20:44.610283
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import mysql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e3b9d27f5c14'
+down_revision: Union[str, Sequence[str], None] = 'c81f4e2d9a73'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLES = ('studios', 'dancers', 'classes')
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # 기존 행은 마이그레이션 시각으로 채움 (이후 값은 애플리케이션에서 지정)
+    for table in TABLES:
+        op.add_column(
+            table,
+            sa.Column(
+                'updated_at',
+                mysql.DATETIME(fsp=6),
+                nullable=False,
+                server_default=sa.text('CURRENT_TIMESTAMP(6)')
+            )
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in reversed(TABLES):
+        op.drop_column(table, 'updated_at')
@@ -0,0 +1,34 @@
+"""drop redundant class studio index
+
+Revision ID: f4a1c8e2b9d6
+Revises: d2c8a5f1b367
+Create Date: 2026-10-18 21:40:12.581903
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f4a1c8e2b9d6'
+down_revision: Union[str, Sequence[str], None] = 'd2c8a5f1b367'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # (studio_id, class_datetime) 는 uq_classes_studio_id_class_datetime_genre_level 의 왼쪽 접두사 -
+    # 기간 조회와 studio_id FK 모두 유니크 인덱스로 처리되므로 쓰기마다 유지할 필요 없음
+    op.drop_index('ix_classes_studio_id_class_datetime', table_name='classes')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index(
+        'ix_classes_studio_id_class_datetime',
+        'classes',
+        ['studio_id', 'class_datetime'],
+        unique=False
+    )
@@ -1,4 +1,10 @@
-from server.database.connection import SESSION, reset_session, start_new_session_if_not_exists
+from server.database.connection import (
+    SESSION,
+    in_default_session,
+    reset_session,
+    start_new_session_if_not_exists,
+)
+from server.database.routing import use_primary
 
 
 from functools import wraps
@@ -7,14 +13,32 @@ from typing import Awaitable, Callable, ParamSpec, TypeVar
 P = ParamSpec("P")
 RT = TypeVar("RT")
 
+# 요청 세션에 쓰기가 있었는지 / 실패한 쓰기가 있었는지 표시 (DefaultSessionMiddleware 가 커밋 여부 판단에 사용)
+SESSION_WRITES_KEY = "unit_of_work_writes"
+SESSION_FAILED_KEY = "unit_of_work_failed"
+
 
 def transactional(f: Callable[P, Awaitable[RT]]) -> Callable[P, Awaitable[RT]]:
     @wraps(f)
     async def wrapper(*args: P.args, **kwargs: P.kwargs) -> RT:
+        if in_default_session():
+            # 요청 세션에 합류 - 커밋은 DefaultSessionMiddleware 가 응답 직전에 한 번만
+            SESSION().info[SESSION_WRITES_KEY] = True
+            use_primary(SESSION().info)
+            try:
+                ret = await f(*args, **kwargs)
+                # 제약 조건 위반 등은 (커밋하던 때처럼) 이 호출 안에서 드러나도록 flush
+                await SESSION.flush()
+            except Exception as e:
+                # 호출한 쪽이 예외를 잡고 2xx 로 응답하더라도 실패한 쓰기는 커밋하지 않음
+                SESSION().info[SESSION_FAILED_KEY] = True
+                raise e
+            return ret
         tokens = start_new_session_if_not_exists()
         # 이미 현재 태스크에서 생성된 세션이 있는 경우 tokens 는 None
         if tokens is None:
             return await f(*args, **kwargs)
+        use_primary(SESSION().info)
         try:
             ret = await f(*args, **kwargs)
         except Exception as e:
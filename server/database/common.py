@@ -1,4 +1,50 @@
+from typing import ClassVar, Sequence
+
+from sqlalchemy import DateTime, Table
+from sqlalchemy.dialects import mysql, sqlite
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.sql.dml import Insert
+
+from server.database.settings import DB_SETTINGS
+
+# 마이크로초까지 저장하는 DATETIME (1초 안에 여러 번 바뀌어도 updated_at 워터마크가 달라지도록)
+PreciseDateTime = DateTime().with_variant(mysql.DATETIME(fsp=6), "mysql")
 
 class Base(DeclarativeBase):
-    pass
\ No newline at end of file
+    # 모든 모델은 __tablename__ 으로 매핑된 Table - Core insert()/insert_on_conflict() 에 그대로 넘길 수 있도록
+    __table__: ClassVar[Table]
+
+
+def insert_on_conflict(table: Table, key_columns: Sequence[str], update_columns: Sequence[str] = ()) -> Insert:
+    """키가 겹치는 행은 update_columns 만 새 값으로 갱신하는 다중 행 INSERT (비우면 기존 행을 그대로 둠)
+
+    키 중복 외의 오류(값 잘림, FK 위반 등)는 그대로 발생한다 (INSERT IGNORE 와 다름).
+    MySQL 은 ON DUPLICATE KEY UPDATE (key_columns 와 관계없이 모든 유니크 키에 적용),
+    SQLite(로컬/테스트)는 key_columns 로 ON CONFLICT.
+    """
+    if DB_SETTINGS.dialect == "sqlite":
+        sqlite_stmt = sqlite.insert(table)
+        if not update_columns:
+            return sqlite_stmt.on_conflict_do_nothing(index_elements=list(key_columns))
+        return sqlite_stmt.on_conflict_do_update(
+            index_elements=list(key_columns),
+            set_={column: sqlite_stmt.excluded[column] for column in update_columns}
+        )
+    mysql_stmt = mysql.insert(table)
+    if not update_columns:
+        # 자기 자신으로 갱신 - 행은 바뀌지 않음
+        return mysql_stmt.on_duplicate_key_update({key_columns[0]: table.c[key_columns[0]]})
+    return mysql_stmt.on_duplicate_key_update({column: mysql_stmt.inserted[column] for column in update_columns})
+
+
+# MySQL ER_DUP_ENTRY
+MYSQL_DUPLICATE_ENTRY = 1062
+
+
+def is_duplicate_key_error(error: IntegrityError) -> bool:
+    """유니크 키 중복으로 인한 IntegrityError 인지 (FK/NOT NULL 위반과 구분)"""
+    if DB_SETTINGS.dialect == "sqlite":
+        return "UNIQUE constraint failed" in str(error.orig)
+    args = getattr(error.orig, "args", ())
+    return bool(args) and args[0] == MYSQL_DUPLICATE_ENTRY
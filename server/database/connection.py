@@ -1,35 +1,94 @@
 import asyncio
 from contextvars import ContextVar, Token
+from typing import Any, Awaitable, Callable, List, Optional, TypeVar
 from uuid import uuid4
-from sqlalchemy import AsyncAdaptedQueuePool
 from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
     async_scoped_session,
     async_sessionmaker,
     create_async_engine,
 )
 
+from server.database.instrumentation import install_query_instrumentation
+from server.database.pool import InstrumentedQueuePool, install_pool_events
+from server.database.routing import USE_PRIMARY_KEY, RoutingSession, use_primary
 from server.database.settings import DB_SETTINGS
 from server.database.common import Base  # noqa: F401
 
-# Import models to register them with Base.metadata
-import server.features.user.models  # noqa: F401
-import server.features.dancer.models  # noqa: F401
-import server.features.studio.models  # noqa: F401
-
 
 class DatabaseManager:
+    """엔진/커넥션 풀은 import 시점이 아니라 start() 에서 생성
+
+    앱은 lifespan 에서 start() 를 호출하고, lifespan 이 없는 스크립트/워커는 첫 세션을 만들 때 생성된다.
+    """
+
     def __init__(self):
-        # TODO pool 이 뭘까요?
-        # pool_recycle 은 뭐고 왜 28000으로 설정해두었을까요?
-        self.engine = create_async_engine(
-            DB_SETTINGS.url,
-            poolclass=AsyncAdaptedQueuePool,
-            pool_recycle=28000,
-            pool_pre_ping=True,
+        self._engine: Optional[AsyncEngine] = None
+        # 읽기 전용 replica (없으면 모든 문장이 primary 로)
+        self._replica_engine: Optional[AsyncEngine] = None
+        self.session_factory = _StartOnFirstSession(self, expire_on_commit=False, sync_session_class=RoutingSession)
+
+    def start(self) -> None:
+        """엔진을 만들고 세션 팩토리에 bind (이미 만들었으면 아무것도 하지 않음)"""
+        if self._engine is not None:
+            return
+        self._engine = self._create_engine(DB_SETTINGS.url)
+        self._replica_engine = self._create_engine(DB_SETTINGS.replica_url) if DB_SETTINGS.replica_url else None
+        self.session_factory.configure(
+            bind=self._engine,
+            replica_bind=self._replica_engine.sync_engine if self._replica_engine is not None else None
         )
-        self.session_factory = async_sessionmaker(
-            bind=self.engine, expire_on_commit=False
+
+    @property
+    def engine(self) -> AsyncEngine:
+        self.start()
+        return self._engine  # type: ignore[return-value]
+
+    @property
+    def replica_engine(self) -> Optional[AsyncEngine]:
+        self.start()
+        return self._replica_engine
+
+    @staticmethod
+    def _create_engine(url: str) -> AsyncEngine:
+        # 풀 크기/대기 시간/검증 방식은 DB_ 환경변수로 조정 (DatabaseSettings 참고)
+        engine = create_async_engine(
+            url,
+            poolclass=InstrumentedQueuePool,
+            pool_size=DB_SETTINGS.pool_size,
+            max_overflow=DB_SETTINGS.max_overflow,
+            pool_timeout=DB_SETTINGS.pool_timeout,
+            pool_recycle=DB_SETTINGS.pool_recycle,
+            pool_use_lifo=DB_SETTINGS.pool_use_lifo,
+            pool_pre_ping=DB_SETTINGS.pool_pre_ping,
+        )
+        # pre_ping 을 켜면 체크아웃마다 검증하므로 유휴 시간 기준 검증은 생략
+        install_pool_events(
+            engine,
+            validate_idle_after=0 if DB_SETTINGS.pool_pre_ping else DB_SETTINGS.pool_validate_idle_after
         )
+        install_query_instrumentation(engine)
+        return engine
+
+    async def dispose(self) -> None:
+        """풀의 커넥션 정리 (엔진은 남으므로 이후 조회 시 새 커넥션을 염)"""
+        if self._engine is not None:
+            await self._engine.dispose()
+        if self._replica_engine is not None:
+            await self._replica_engine.dispose()
+
+
+class _StartOnFirstSession(async_sessionmaker):
+    """세션을 만들기 전에 DatabaseManager.start() 를 보장하는 세션 팩토리"""
+
+    def __init__(self, manager: DatabaseManager, **kw: Any) -> None:
+        super().__init__(**kw)
+        self.manager = manager
+
+    def __call__(self, **local_kw: Any) -> AsyncSession:
+        self.manager.start()
+        return super().__call__(**local_kw)
 
 
 session_context_var: ContextVar[tuple[str | None, str | None]] = ContextVar(
@@ -43,10 +102,16 @@ def reset_session(token: Token) -> None:
 
 
 def start_default_session() -> Token:
-    """DefaultSessionMiddleware 에서 단 한 번만 사용"""
+    """DefaultSessionMiddleware 에서 요청마다 단 한 번만 사용"""
     return session_context_var.set((uuid4().hex, None))
 
 
+def in_default_session() -> bool:
+    """요청 단위 세션(DefaultSessionMiddleware) 안인지 - task 이름 없이 ID 만 있는 세션"""
+    session_id, session_task = session_context_var.get()
+    return session_id is not None and session_task is None
+
+
 def start_new_session_if_not_exists() -> Token | None:
     _, session_task = session_context_var.get()
     current_task_name = asyncio.current_task().get_name()  # type: ignore
@@ -58,6 +123,42 @@ def get_session_id() -> str | None:
     return session_context_var.get()[0]
 
 
+DATABASE = DatabaseManager()
+
 SESSION = async_scoped_session(
-    session_factory=DatabaseManager().session_factory, scopefunc=get_session_id
-)
\ No newline at end of file
+    session_factory=DATABASE.session_factory, scopefunc=get_session_id
+)
+
+T = TypeVar("T")
+
+
+async def attach(instance: T) -> T:
+    """현재 세션의 객체면 그대로 (요청 세션에서 읽은 경우 - 추가 조회 없음), 다른 세션에서 읽은 객체면 merge"""
+    if instance in SESSION():
+        return instance
+    return await SESSION.merge(instance)
+
+
+async def gather_in_new_sessions(*calls: Callable[[], Awaitable[Any]], reuse_current: bool = False) -> List[Any]:
+    """서로 독립적인 조회를 각자의 세션(커넥션)에서 동시에 실행해 결과를 순서대로 반환
+
+    한 AsyncSession 에서는 문장을 동시에 실행할 수 없으므로 호출마다 새 세션을 열고 끝나면 닫는다.
+    reuse_current 이면 첫 호출은 현재(요청) 세션에서 실행 - 요청 세션이 이미 커넥션을 잡고 있을 때 하나를 덜 씀.
+    조회 전용 - 쓰기는 요청 세션에서. 현재 세션이 primary 로 고정되어 있으면 새 세션도 primary 로 (read-your-writes)
+    """
+    primary = bool(SESSION().info.get(USE_PRIMARY_KEY))
+
+    async def run(call: Callable[[], Awaitable[Any]]) -> Any:
+        token = session_context_var.set((uuid4().hex, asyncio.current_task().get_name()))  # type: ignore
+        try:
+            if primary:
+                use_primary(SESSION().info)
+            return await call()
+        finally:
+            await SESSION.remove()
+            reset_session(token)
+
+    if reuse_current and calls:
+        first, *rest = calls
+        return list(await asyncio.gather(first(), *(run(call) for call in rest)))
+    return list(await asyncio.gather(*(run(call) for call in calls)))
@@ -0,0 +1,119 @@
+"""요청별 SQL 계측
+
+DefaultSessionMiddleware 가 요청 세션을 열 때 start_query_stats() 로 요청 컨텍스트를 만들고,
+엔진의 before/after_cursor_execute 이벤트가 그 컨텍스트에 문장 수, DB 시간, 느린 문장을 모은다.
+응답에는 Server-Timing 헤더를 붙이고, DB_SLOW_REQUEST_MS 를 넘는 요청은 구조화 로그로 남긴다.
+(요청 밖 - 백그라운드 태스크, RQ 작업 - 의 문장은 집계하지 않음)
+"""
+import heapq
+import json
+import logging
+import time
+from contextvars import ContextVar, Token
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from server.database.settings import DB_SETTINGS
+
+logger = logging.getLogger(__name__)
+
+# 로그에 남길 문장 길이 (파라미터 값은 남기지 않음)
+MAX_STATEMENT_LENGTH = 300
+_STARTED_AT = "query_started_at"
+
+
+@dataclass
+class QueryStats:
+    started_at: float = field(default_factory=time.perf_counter)
+    count: int = 0
+    db_ms: float = 0.0
+    commit_ms: float = 0.0
+    # (소요 시간 ms, 순번, 문장) 최소 힙 - 가장 느린 DB_SLOW_QUERY_SAMPLE 개만 유지
+    slowest: List[Tuple[float, int, str]] = field(default_factory=list)
+
+    def record(self, elapsed_ms: float, statement: str) -> None:
+        self.count += 1
+        self.db_ms += elapsed_ms
+        entry = (elapsed_ms, self.count, statement)
+        if len(self.slowest) < DB_SETTINGS.slow_query_sample:
+            heapq.heappush(self.slowest, entry)
+        elif self.slowest and elapsed_ms > self.slowest[0][0]:
+            heapq.heapreplace(self.slowest, entry)
+
+    def elapsed_ms(self) -> float:
+        return (time.perf_counter() - self.started_at) * 1000
+
+
+query_stats_var: ContextVar[Optional[QueryStats]] = ContextVar("query_stats", default=None)
+
+
+def start_query_stats() -> Tuple[Token, QueryStats]:
+    """DefaultSessionMiddleware 에서 start_default_session() 과 함께 요청마다 한 번 - (reset 용 토큰, 새 컨텍스트)"""
+    stats = QueryStats()
+    return query_stats_var.set(stats), stats
+
+
+def reset_query_stats(token: Token) -> None:
+    query_stats_var.reset(token)
+
+
+def current_query_stats() -> Optional[QueryStats]:
+    return query_stats_var.get()
+
+
+def install_query_instrumentation(engine: AsyncEngine) -> None:
+    sync_engine = engine.sync_engine
+
+    @event.listens_for(sync_engine, "before_cursor_execute")
+    def _before(conn, cursor, statement, parameters, context, executemany) -> None:
+        if query_stats_var.get() is not None:
+            conn.info.setdefault(_STARTED_AT, []).append(time.perf_counter())
+
+    @event.listens_for(sync_engine, "after_cursor_execute")
+    def _after(conn, cursor, statement, parameters, context, executemany) -> None:
+        stats = query_stats_var.get()
+        started = conn.info.get(_STARTED_AT)
+        if stats is None or not started:
+            return
+        stats.record((time.perf_counter() - started.pop()) * 1000, statement)
+
+    @event.listens_for(sync_engine, "handle_error")
+    def _on_error(context) -> None:
+        # 실패한 문장의 시작 시각이 남아 다음 문장 측정이 어긋나지 않도록
+        started = context.connection.info.get(_STARTED_AT) if context.connection is not None else None
+        if started:
+            started.pop()
+
+
+def server_timing_header(stats: QueryStats) -> Tuple[bytes, bytes]:
+    value = (
+        f'db;dur={stats.db_ms:.1f};desc="{stats.count} queries", '
+        f"commit;dur={stats.commit_ms:.1f}, "
+        f"total;dur={stats.elapsed_ms():.1f}"
+    )
+    return b"server-timing", value.encode("latin-1")
+
+
+def log_if_slow(stats: QueryStats, method: str, path: str, status: int) -> None:
+    """DB_SLOW_REQUEST_MS 를 넘은 요청을 JSON 한 줄로 기록"""
+    total_ms = stats.elapsed_ms()
+    if total_ms < DB_SETTINGS.slow_request_ms:
+        return
+    record: Dict[str, Any] = {
+        "event": "slow_request",
+        "method": method,
+        "path": path,
+        "status": status,
+        "total_ms": round(total_ms, 1),
+        "db_ms": round(stats.db_ms, 1),
+        "commit_ms": round(stats.commit_ms, 1),
+        "queries": stats.count,
+        "slowest": [
+            {"ms": round(ms, 1), "statement": " ".join(statement.split())[:MAX_STATEMENT_LENGTH]}
+            for ms, _, statement in sorted(stats.slowest, reverse=True)
+        ],
+    }
+    logger.warning(json.dumps(record, ensure_ascii=False))
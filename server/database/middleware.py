@@ -0,0 +1,111 @@
+"""요청 단위 세션 (Unit of Work)
+
+요청마다 세션 하나를 열고, 요청 안의 @transactional 메서드는 모두 그 세션에 합류한다.
+쓰기가 있었던 요청은 응답을 보내기 직전에 한 번만 커밋하고,
+4xx/5xx 응답, 예외, 또는 실패한 @transactional 호출이 있었으면 롤백한다.
+http.response.start 메시지는 커밋이 끝날 때까지 붙잡아 두었다가 넘기므로 (상태 줄이 나가기 전),
+커밋이 실패하면 원래 상태 코드 대신 ServerErrorMiddleware 의 500 이 나간다.
+(StreamingResponse 처럼 상태 줄 이후에 본문을 만드는 응답은 본문 생성 중의 쓰기가 커밋되지 않음)
+
+read replica 를 쓰는 경우 쓰기 요청은 처음부터 primary 로 고정하고, 커밋한 응답에는
+DB_READ_YOUR_WRITES_WINDOW 초짜리 쿠키를 붙여 그 사이 같은 클라이언트의 조회도 primary 로 보낸다.
+(쿠키를 보내지 못하는 클라이언트는 X-Read-Primary: 1 헤더로 같은 효과)
+
+요청마다 SQL 계측 컨텍스트도 함께 열어, 커밋까지 포함한 Server-Timing 헤더와 느린 요청 로그를 남긴다.
+"""
+import time
+
+from starlette.requests import HTTPConnection
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from server.database.annotation import SESSION_FAILED_KEY, SESSION_WRITES_KEY
+from server.database.connection import SESSION, reset_session, start_default_session
+from server.database.instrumentation import (
+    log_if_slow,
+    reset_query_stats,
+    server_timing_header,
+    start_query_stats,
+)
+from server.database.routing import use_primary
+from server.database.settings import DB_SETTINGS
+
+SAFE_METHODS = ("GET", "HEAD", "OPTIONS")
+READ_PRIMARY_COOKIE = "read_primary"
+READ_PRIMARY_HEADER = "x-read-primary"
+
+
+class DefaultSessionMiddleware:
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        token = start_default_session()
+        stats_token, stats = start_query_stats()
+        if DB_SETTINGS.replica_url and _wants_primary(scope):
+            use_primary(SESSION().info)
+        finished = False
+
+        async def send_after_commit(message: Message) -> None:
+            nonlocal finished
+            if message["type"] == "http.response.start" and not finished:
+                finished = True
+                # 커밋 실패는 여기서 예외로 올라가고 message 는 send 로 넘어가지 않음
+                commit_started = time.perf_counter()
+                committed = await _finish(commit=message["status"] < 400)
+                stats.commit_ms = (time.perf_counter() - commit_started) * 1000
+                headers = list(message.get("headers", []))
+                if committed and DB_SETTINGS.replica_url:
+                    headers.append(_read_primary_cookie())
+                if DB_SETTINGS.server_timing:
+                    headers.append(server_timing_header(stats))
+                message["headers"] = headers
+                log_if_slow(stats, scope["method"], scope["path"], message["status"])
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_after_commit)
+        except Exception:
+            if not finished:
+                finished = True
+                await _finish(commit=False)
+            raise
+        finally:
+            await SESSION.remove()
+            reset_query_stats(stats_token)
+            reset_session(token)
+
+
+def _wants_primary(scope: Scope) -> bool:
+    """쓰기 요청이거나, 최근에 쓰기를 한 클라이언트(쿠키) / primary 조회를 요청한 경우(헤더)"""
+    if scope["method"] not in SAFE_METHODS:
+        return True
+    connection = HTTPConnection(scope)
+    return READ_PRIMARY_COOKIE in connection.cookies or bool(connection.headers.get(READ_PRIMARY_HEADER))
+
+
+def _read_primary_cookie() -> tuple[bytes, bytes]:
+    value = f"{READ_PRIMARY_COOKIE}=1; Max-Age={DB_SETTINGS.read_your_writes_window}; Path=/; HttpOnly; SameSite=Lax"
+    return b"set-cookie", value.encode("latin-1")
+
+
+async def _finish(commit: bool) -> bool:
+    """요청 세션을 커밋 또는 롤백 - 커밋했으면 True"""
+    session = SESSION()
+    written = session.info.pop(SESSION_WRITES_KEY, False)
+    failed = session.info.pop(SESSION_FAILED_KEY, False)
+    if not session.in_transaction():
+        return False
+    if commit and written and not failed:
+        try:
+            await session.commit()
+        except Exception:
+            await session.rollback()
+            raise
+        return True
+    # 조회만 한 요청도 커넥션을 돌려주기 전에 트랜잭션을 닫음
+    await session.rollback()
+    return False
@@ -0,0 +1,8 @@
+"""모든 모델 모듈 등록 - Base.metadata (alembic, create_all) 와 매퍼 관계 문자열 해석에 필요
+
+FK 참조 순서대로 import (user -> dancer / studio -> dance_class)
+"""
+import server.features.user.models  # noqa: F401
+import server.features.dancer.models  # noqa: F401
+import server.features.studio.models  # noqa: F401
+import server.features.dance_class.models  # noqa: F401
@@ -0,0 +1,150 @@
+"""커넥션 풀 계측 / 유휴 커넥션 검증
+
+- InstrumentedQueuePool: 체크아웃 대기 시간과 QueuePool limit 타임아웃 횟수를 POOL_METRICS 에 기록 (공개 API Pool.connect() 를 감쌈)
+- install_idle_validation: pre_ping 대신, 일정 시간 이상 쉬었던 커넥션만 체크아웃 시 ping
+- pool_snapshot / log_pool_stats_periodically: /internal/db-pool 과 주기 로그용 현황
+"""
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, asdict
+from typing import Any, Dict, Optional
+
+from sqlalchemy import AsyncAdaptedQueuePool, QueuePool, event, exc
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import PoolProxiedConnection
+
+logger = logging.getLogger(__name__)
+
+_CHECKED_IN_AT = "checked_in_at"
+
+
+@dataclass
+class PoolMetrics:
+    """프로세스 단위 누적 카운터 + 마지막 로그 이후 구간(window) 대기 시간"""
+    checkouts: int = 0
+    timeouts: int = 0
+    connects: int = 0
+    idle_validations: int = 0
+    invalidated: int = 0
+    wait_total_ms: float = 0.0
+    wait_max_ms: float = 0.0
+    window_checkouts: int = 0
+    window_wait_total_ms: float = 0.0
+    window_wait_max_ms: float = 0.0
+
+    def record_wait(self, wait_ms: float) -> None:
+        self.checkouts += 1
+        self.wait_total_ms += wait_ms
+        self.wait_max_ms = max(self.wait_max_ms, wait_ms)
+        self.window_checkouts += 1
+        self.window_wait_total_ms += wait_ms
+        self.window_wait_max_ms = max(self.window_wait_max_ms, wait_ms)
+
+    def take_window(self) -> Dict[str, Any]:
+        """구간 대기 시간 통계를 반환하고 초기화"""
+        window = {
+            "checkouts": self.window_checkouts,
+            "wait_avg_ms": self.window_wait_total_ms / self.window_checkouts if self.window_checkouts else 0.0,
+            "wait_max_ms": self.window_wait_max_ms,
+        }
+        self.window_checkouts = 0
+        self.window_wait_total_ms = 0.0
+        self.window_wait_max_ms = 0.0
+        return window
+
+
+POOL_METRICS = PoolMetrics()
+
+
+class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+    """체크아웃 대기 시간(새 커넥션을 여는 시간, checkout 이벤트의 유휴 검증 포함)을 기록하는 풀
+
+    Engine 은 커넥션마다 pool.connect() 를 호출하므로 그 한 곳만 감싼다.
+    """
+
+    def connect(self) -> PoolProxiedConnection:
+        started = time.perf_counter()
+        try:
+            return super().connect()
+        except exc.TimeoutError:
+            POOL_METRICS.timeouts += 1
+            raise
+        finally:
+            POOL_METRICS.record_wait((time.perf_counter() - started) * 1000)
+
+
+def install_pool_events(engine: AsyncEngine, validate_idle_after: float) -> None:
+    """연결/무효화 횟수 기록 + validate_idle_after 초 이상 쉬었던 커넥션은 체크아웃 시 ping"""
+    sync_engine = engine.sync_engine
+
+    @event.listens_for(sync_engine, "connect")
+    def _on_connect(dbapi_connection, connection_record) -> None:
+        POOL_METRICS.connects += 1
+
+    @event.listens_for(sync_engine, "invalidate")
+    def _on_invalidate(dbapi_connection, connection_record, exception) -> None:
+        POOL_METRICS.invalidated += 1
+
+    if validate_idle_after <= 0:
+        return
+
+    @event.listens_for(sync_engine, "checkin")
+    def _on_checkin(dbapi_connection, connection_record) -> None:
+        connection_record.info[_CHECKED_IN_AT] = time.monotonic()
+
+    @event.listens_for(sync_engine, "checkout")
+    def _on_checkout(dbapi_connection, connection_record, connection_proxy) -> None:
+        checked_in_at = connection_record.info.pop(_CHECKED_IN_AT, None)
+        if checked_in_at is None or time.monotonic() - checked_in_at < validate_idle_after:
+            return
+        POOL_METRICS.idle_validations += 1
+        try:
+            alive = sync_engine.dialect.do_ping(dbapi_connection)
+        except Exception:
+            alive = False
+        if not alive:
+            # 풀이 이 커넥션을 버리고 새 커넥션으로 다시 체크아웃
+            raise exc.DisconnectionError("idle connection failed validation")
+
+
+def pool_state(engine: AsyncEngine) -> Dict[str, Any]:
+    """QueuePool 이면 크기/체크아웃/오버플로 수, 아니면 (NullPool, StaticPool 등) status() 문자열만"""
+    pool = engine.sync_engine.pool
+    if not isinstance(pool, QueuePool):
+        return {"status": pool.status()}
+    return {
+        "size": pool.size(),
+        "checked_in": pool.checkedin(),
+        "checked_out": pool.checkedout(),
+        "overflow": pool.overflow(),
+        "timeout": pool.timeout(),
+    }
+
+
+def pool_snapshot(engine: AsyncEngine, replica_engine: Optional[AsyncEngine] = None) -> Dict[str, Any]:
+    """primary 풀 현황 + 누적 계측값 (replica 가 있으면 replica 풀 현황도, 계측값은 두 풀 합계)"""
+    return {
+        **pool_state(engine),
+        **asdict(POOL_METRICS),
+        "wait_avg_ms": POOL_METRICS.wait_total_ms / POOL_METRICS.checkouts if POOL_METRICS.checkouts else 0.0,
+        "replica": pool_state(replica_engine) if replica_engine is not None else None,
+    }
+
+
+async def log_pool_stats_periodically(engine: AsyncEngine, interval: int) -> None:
+    """interval 초마다 체크아웃/오버플로 커넥션 수와 구간 대기 시간 로그 (lifespan 에서 백그라운드 태스크로 실행)"""
+    while True:
+        await asyncio.sleep(interval)
+        state = pool_state(engine)
+        window = POOL_METRICS.take_window()
+        logger.info(
+            "db pool: checked_out=%s overflow=%s checked_in=%s checkouts=%d wait_avg=%.1fms wait_max=%.1fms timeouts=%d",
+            state.get("checked_out"),
+            state.get("overflow"),
+            state.get("checked_in"),
+            window["checkouts"],
+            window["wait_avg_ms"],
+            window["wait_max_ms"],
+            POOL_METRICS.timeouts,
+        )
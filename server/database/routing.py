@@ -0,0 +1,48 @@
+"""읽기/쓰기 분리 (primary + 선택적 read replica)
+
+DB_REPLICA_URL 이 있으면 세션이 문장마다 커넥션을 고른다.
+- 잠금 없는 SELECT: replica
+- 그 외 (INSERT/UPDATE/DELETE, flush, SELECT ... FOR UPDATE, text()): primary
+- primary 로 고정된 세션의 모든 문장: primary
+
+세션은 다음 경우 primary 로 고정된다 (read-your-writes).
+- @transactional 진입
+- 쓰기 문장 실행 (같은 요청의 이후 조회는 방금 쓴 데이터를 봄)
+- 쓰기 요청(GET/HEAD/OPTIONS 외) 또는 최근 쓰기 쿠키/X-Read-Primary 헤더가 있는 요청 (DefaultSessionMiddleware)
+
+로컬 확인: 같은 스키마의 SQLite 파일 두 개로
+    DB_REPLICA_URL=sqlite+aiosqlite:////tmp/oddc-replica.db
+"""
+from typing import Any, Dict, Optional
+
+from sqlalchemy import Engine
+from sqlalchemy.orm import Session
+
+USE_PRIMARY_KEY = "use_primary"
+
+
+class RoutingSession(Session):
+    def __init__(self, *args: Any, replica_bind: Optional[Engine] = None, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.replica_bind = replica_bind
+
+    def get_bind(self, mapper=None, clause=None, **kw):
+        if self.replica_bind is not None and not self.info.get(USE_PRIMARY_KEY) and not self._flushing:
+            if _is_plain_select(clause):
+                return self.replica_bind
+            # 쓰기/잠금 문장 이후의 조회는 primary 에서 (방금 쓴 데이터가 replica 에 아직 없을 수 있음)
+            use_primary(self.info)
+        return super().get_bind(mapper=mapper, clause=clause, **kw)
+
+
+def _is_plain_select(clause: Any) -> bool:
+    return (
+        clause is not None
+        and getattr(clause, "is_select", False)
+        and getattr(clause, "_for_update_arg", None) is None
+    )
+
+
+def use_primary(session_info: Dict[str, Any]) -> None:
+    """이 세션의 이후 문장을 모두 primary 로 보냄"""
+    session_info[USE_PRIMARY_KEY] = True
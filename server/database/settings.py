@@ -1,3 +1,5 @@
+from typing import Optional
+
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -10,6 +12,38 @@ class DatabaseSettings(BaseSettings):
     password: str = ""
     database: str = ""
 
+    # ===== READ REPLICA =====
+    # 읽기 전용 replica 전체 URL (비우면 모든 문장을 primary 로) - 예: mysql+aiomysql://user:pw@replica:3306/oddc
+    replica_url: Optional[str] = None
+    # 쓰기 요청 이후 이 시간(초) 동안 같은 클라이언트의 조회를 primary 로 (replica 복제 지연 대비)
+    read_your_writes_window: int = 5
+
+    # ===== CONNECTION POOL =====
+    # 항상 유지하는 커넥션 수
+    pool_size: int = 10
+    # pool_size 를 넘어 순간적으로 더 열 수 있는 커넥션 수
+    max_overflow: int = 20
+    # 커넥션을 기다리는 최대 시간 (초) - 넘으면 QueuePool limit TimeoutError
+    pool_timeout: float = 30
+    # 이 시간(초)보다 오래된 커넥션은 다시 연결 (MySQL wait_timeout(기본 28800) 보다 짧게)
+    pool_recycle: int = 28000
+    # 최근 반납된 커넥션부터 사용 - 부하가 줄면 남는 커넥션이 유휴 상태로 정리됨
+    pool_use_lifo: bool = True
+    # 체크아웃마다 ping (왕복 1회 추가) - 끄면 아래 유휴 시간 기준 검증 사용
+    pool_pre_ping: bool = False
+    # 이 시간(초) 이상 쉬었던 커넥션만 체크아웃 시 ping (0 이면 검증 안 함)
+    pool_validate_idle_after: float = 300
+    # 풀 상태 로그 주기 (초, 0 이면 로그 안 함)
+    pool_stats_log_interval: int = 60
+
+    # ===== QUERY INSTRUMENTATION =====
+    # 응답에 Server-Timing 헤더 (문장 수 / DB 시간 / 커밋 시간 / 전체 시간) 추가
+    server_timing: bool = True
+    # 이 시간(ms)을 넘는 요청은 문장 수와 가장 느린 문장들을 로그로 남김
+    slow_request_ms: float = 500
+    # 느린 요청 로그에 남길 문장 개수
+    slow_query_sample: int = 5
+
     @property
     def url(self) -> str:
         return f"{self.dialect}+{self.driver}://{self.user}:{self.password}@{self.host}:{self.port}/{self.database}"
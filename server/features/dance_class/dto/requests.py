@@ -1,6 +1,8 @@
 from pydantic import BaseModel, Field, field_validator
 from typing import List, Optional
 
+# 수업 대량 등록 한 번에 받을 수 있는 최대 행 수 (JSON/CSV 공통)
+MAX_BULK_CLASSES = 2000
 
 class ClassCreateRequest(BaseModel):
     """수업 생성 요청"""
@@ -92,3 +94,40 @@ class ClassDeleteRequest(BaseModel):
     class_id: str = Field(
         description="삭제할 수업 ID"
     )
+
+
+class ClassBulkItem(BaseModel):
+    """대량 등록할 수업 한 건 (형식 검증은 행별 결과로 보고하기 위해 저장 단계에서 수행)"""
+    studio: str = Field(
+        description="스튜디오 ID, 인스타그램 또는 이름",
+        examples=["1MILLION", "@1milliondance"]
+    )
+    dancers: List[str] = Field(
+        description="댄서 ID, 인스타그램 또는 이름 목록",
+        examples=[["김민준", "@dancer_minjun"]]
+    )
+    class_datetime: str = Field(
+        description="수업 날짜 및 시간 (ISO8601 형식)",
+        examples=["2025-01-15T14:00:00+09:00"]
+    )
+    timezone: str = Field(
+        description="타임존 (IANA timezone format)",
+        default="Asia/Seoul"
+    )
+    level: Optional[str] = Field(
+        default=None,
+        description="수업 레벨 (BASIC, ADVANCED)"
+    )
+    genre: Optional[str] = Field(
+        default=None,
+        description="댄스 장르"
+    )
+
+
+class ClassBulkCreateRequest(BaseModel):
+    """수업 대량 등록 요청 (JSON)"""
+    classes: List[ClassBulkItem] = Field(
+        description="등록할 수업 목록",
+        min_length=1,
+        max_length=MAX_BULK_CLASSES
+    )
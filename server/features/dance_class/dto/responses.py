@@ -1,5 +1,6 @@
 from pydantic import BaseModel
-from typing import List, Optional
+from sqlalchemy import Row
+from typing import Any, Dict, List, Optional
 
 from server.features.dance_class.models import Class
 
@@ -32,6 +33,11 @@ class DancerInfo(BaseModel):
     main_name: str
     instagram: Optional[str]
 
+    @staticmethod
+    def dict_from_row(row: Row) -> Dict[str, Any]:
+        """컬럼 projection 결과(Row)로 같은 모양의 dict 생성 (빠른 JSON 경로용)"""
+        return {"dancer_id": row.dancer_id, "main_name": row.main_name, "instagram": row.instagram}
+
 
 class StudioInfo(BaseModel):
     """수업의 스튜디오 정보"""
@@ -72,3 +78,83 @@ class ClassDetailResponse(BaseModel):
             level=class_obj.level.value if class_obj.level else None,
             genre=class_obj.genre.value if class_obj.genre else None
         )
+
+    @staticmethod
+    def dict_from_row(row: Row, dancers: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """컬럼 projection 결과(Row)로 같은 모양의 dict 생성 (빠른 JSON 경로용, 모델 생성/검증 없음)"""
+        return {
+            "class_id": row.class_id,
+            "studio": {
+                "studio_id": row.studio_id,
+                "name": row.studio_name,
+                "instagram": row.studio_instagram
+            },
+            "dancers": dancers,
+            "timezone": row.timezone,
+            "class_datetime": row.class_datetime.isoformat(),
+            "level": row.level.value if row.level else None,
+            "genre": row.genre.value if row.genre else None
+        }
+
+
+class ClassBatchResponse(BaseModel):
+    """수업 일괄 조회 결과 (요청 순서)"""
+    results: List[ClassDetailResponse]
+    missing: List[str]  # 찾지 못한 class_id
+
+
+class FacetCount(BaseModel):
+    """피드 facet 값 하나와 그 값을 고르면 나오는 수업 수"""
+    value: str
+    count: int
+
+
+class ClassFeedFacets(BaseModel):
+    """피드 facet - 각 항목은 자기 자신을 제외한 나머지 조건을 적용한 개수 (많은 순)"""
+    genre: List[FacetCount]
+    level: List[FacetCount]
+    time_of_day: List[FacetCount]   # NIGHT, MORNING, AFTERNOON, EVENING
+    city: List[FacetCount]
+    district: List[FacetCount]
+    station: List[FacetCount]
+
+
+class ClassFeedResponse(BaseModel):
+    """전체 스튜디오 수업 피드"""
+    classes: List[ClassDetailResponse]
+    next_cursor: Optional[str]          # 다음 페이지 커서 (cursor 로 사용)
+    total: Optional[int]                # 모든 조건에 맞는 수업 수 (facets=false 면 null)
+    facets: Optional[ClassFeedFacets]   # facets=false 면 null
+
+
+class CalendarDaySummary(BaseModel):
+    """캘린더 하루치 요약"""
+    date: str              # YYYY-MM-DD (요청 timezone 기준)
+    count: int             # 해당 일자의 수업 개수
+    genres: List[str]      # 해당 일자의 장르 목록 (중복 제거)
+    levels: List[str]      # 해당 일자의 레벨 목록 (중복 제거)
+
+
+class ClassCalendarResponse(BaseModel):
+    """월간 캘린더 요약 (일자별 수업 개수/장르/레벨)"""
+    year: int
+    month: int
+    timezone: str
+    days: List[CalendarDaySummary]
+
+
+class ClassBulkRowResult(BaseModel):
+    """대량 등록 행별 결과"""
+    row: int                         # 요청 내 순번 (1부터, CSV 는 헤더 제외)
+    status: str                      # "created", "duplicate", "error"
+    class_id: Optional[str] = None   # 생성된 수업 ID (created) 또는 이미 있는 수업 ID (duplicate)
+    error: Optional[str] = None
+
+
+class ClassBulkCreateResponse(BaseModel):
+    """수업 대량 등록 결과"""
+    total: int
+    created: int
+    duplicates: int
+    failed: int
+    results: List[ClassBulkRowResult]
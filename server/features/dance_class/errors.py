@@ -17,3 +17,15 @@ def class_delete_error(e: Exception):
         status_code=400,
         detail={"message": f"수업 삭제에 실패했습니다: {type(e).__name__} - {str(e)}"}
     )
+
+def class_bulk_conflict_error(e: Exception):
+    raise HTTPException(
+        status_code=409,
+        detail={"message": f"같은 수업이 다른 요청으로 먼저 등록되었습니다. 다시 시도해주세요: {type(e).__name__}"}
+    )
+
+def class_duplicate_error():
+    raise HTTPException(
+        status_code=409,
+        detail={"message": "같은 스튜디오/시간/장르/레벨의 수업이 이미 등록되어 있습니다 (duplicate)"}
+    )
@@ -0,0 +1,109 @@
+"""수업 목록 읽기 모델(class_listings) 갱신
+
+목록 조회가 classes / studios / class_dancer_association / dancers 를 매번 조인하지 않도록
+ClassDetailResponse 에 필요한 값을 수업마다 한 행으로 모아 둔다.
+원본을 바꾸는 Store 메서드가 호출하는 쪽의 트랜잭션 안에서 아래 함수로 맞춘다.
+"""
+from sqlalchemy import Row, delete, insert, update
+from sqlalchemy.sql import select
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+from server.common.utils import chunked
+from server.database.connection import SESSION
+from server.features.dance_class.dto.responses import DancerInfo
+from server.features.dance_class.models import Class, ClassListing, class_dancer_association
+from server.features.dancer.models import Dancer
+from server.features.studio.models import Studio
+
+LISTING_CHUNK_SIZE = 1000
+
+# 원본 테이블에서 목록 행을 만들 때 읽는 컬럼
+SOURCE_CLASS_COLUMNS = (
+    Class.class_id,
+    Class.timezone,
+    Class.class_datetime,
+    Class.level,
+    Class.genre,
+    Studio.studio_id,
+    Studio.name.label("studio_name"),
+    Studio.instagram.label("studio_instagram"),
+)
+SOURCE_DANCER_COLUMNS = (
+    class_dancer_association.c.class_id,
+    Dancer.dancer_id,
+    Dancer.main_name,
+    Dancer.instagram,
+)
+
+
+def build_listing_rows(
+    class_rows: Sequence[Row],
+    dancer_rows: Sequence[Row],
+    refreshed_at: datetime
+) -> List[Dict[str, Any]]:
+    """수업+스튜디오 행과 수업별 댄서 행으로 class_listings INSERT 행 생성 (DB 접근 없음)"""
+    dancers_by_class: Dict[str, List[Dict[str, Any]]] = {}
+    for row in dancer_rows:
+        dancers_by_class.setdefault(row.class_id, []).append(DancerInfo.dict_from_row(row))
+    return [
+        {
+            "class_id": row.class_id,
+            "studio_id": row.studio_id,
+            "timezone": row.timezone,
+            "class_datetime": row.class_datetime,
+            "genre": row.genre,
+            "level": row.level,
+            "studio_name": row.studio_name,
+            "studio_instagram": row.studio_instagram,
+            "dancers": dancers_by_class.get(row.class_id, []),
+            "refreshed_at": refreshed_at
+        }
+        for row in class_rows
+    ]
+
+
+async def refresh_class_listings(class_ids: Iterable[str]) -> int:
+    """수업들의 목록 행을 원본 테이블로부터 다시 만듦 (원본이 없는 수업은 행만 삭제), 다시 만든 행 수를 반환
+
+    청크마다 원본 조회 2번 + DELETE + 다중 행 INSERT. 바뀐 값이 먼저 flush 되어 있어야 한다 (autoflush).
+    """
+    refreshed_at = datetime.utcnow()
+    refreshed = 0
+    for chunk in chunked(list(dict.fromkeys(class_ids)), LISTING_CHUNK_SIZE):
+        class_rows = (await SESSION.execute(
+            select(*SOURCE_CLASS_COLUMNS)
+            .join(Studio, Studio.studio_id == Class.studio_id)
+            .where(Class.class_id.in_(chunk))
+        )).all()
+        dancer_rows = (await SESSION.execute(
+            select(*SOURCE_DANCER_COLUMNS)
+            .join(Dancer, Dancer.dancer_id == class_dancer_association.c.dancer_id)
+            .where(class_dancer_association.c.class_id.in_(chunk))
+        )).all() if class_rows else []
+
+        await SESSION.execute(delete(ClassListing).where(ClassListing.class_id.in_(chunk)))
+        rows = build_listing_rows(class_rows, dancer_rows, refreshed_at)
+        if rows:
+            await SESSION.execute(insert(ClassListing.__table__), rows)
+        refreshed += len(rows)
+    return refreshed
+
+
+async def dancer_class_ids(dancer_id: str) -> List[str]:
+    """댄서가 연결된 수업 ID 목록 (댄서 이름/인스타그램 변경, 삭제 시 다시 만들 대상)"""
+    result = await SESSION.scalars(
+        select(class_dancer_association.c.class_id)
+        .where(class_dancer_association.c.dancer_id == dancer_id)
+    )
+    return list(result.all())
+
+
+async def update_studio_class_listings(studio_id: str, name: str, instagram: Optional[str]) -> None:
+    """스튜디오 이름/인스타그램이 바뀌면 그 스튜디오 수업의 목록 행만 UPDATE 한 번으로 갱신"""
+    await SESSION.execute(
+        update(ClassListing)
+        .where(ClassListing.studio_id == studio_id)
+        .values(studio_name=name, studio_instagram=instagram, refreshed_at=datetime.utcnow())
+        .execution_options(synchronize_session=False)
+    )
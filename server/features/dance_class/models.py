@@ -1,9 +1,9 @@
-from server.database.common import Base
+from server.database.common import Base, PreciseDateTime
 
-from sqlalchemy import String, ForeignKey, Enum, Table, Column, DateTime
+from sqlalchemy import String, ForeignKey, Enum, Table, Column, DateTime, Index, JSON, func, literal_column
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from datetime import datetime
-from typing import List, Optional, TYPE_CHECKING
+from typing import Any, Dict, List, Optional, TYPE_CHECKING
 
 # Import Genre for actual use (not TYPE_CHECKING)
 from server.features.dancer.models import Genre
@@ -25,12 +25,31 @@ class_dancer_association = Table(
     'class_dancer_association',
     Base.metadata,
     Column('class_id', String(36), ForeignKey('classes.class_id', ondelete='CASCADE'), primary_key=True),
-    Column('dancer_id', String(36), ForeignKey('dancers.dancer_id', ondelete='CASCADE'), primary_key=True)
+    Column('dancer_id', String(36), ForeignKey('dancers.dancer_id', ondelete='CASCADE'), primary_key=True),
+    # 댄서별 수업 조회용 (PK 는 class_id 가 선두 컬럼이라 dancer_id 조회에 쓰이지 않음)
+    Index('ix_class_dancer_association_dancer_id_class_id', 'dancer_id', 'class_id')
 )
 
 # Class Model
 class Class(Base):
     __tablename__ = "classes"
+    __table_args__ = (
+        # 전체 수업 피드(/class/feed)의 기간 조회 + (class_datetime, class_id) 순서 (InnoDB 보조 인덱스에는 PK 가 붙음)
+        Index("ix_classes_class_datetime", "class_datetime"),
+        # 피드 facet 집계용 커버링 인덱스 - 기간 안의 장르/레벨/스튜디오별 개수를 테이블 접근 없이 계산
+        Index("ix_classes_class_datetime_genre_level_studio_id", "class_datetime", "genre", "level", "studio_id"),
+        # 중복 수업 방지 (scripts/remove_duplicate_classes.py 와 같은 키)
+        # 왼쪽 접두사 (studio_id, class_datetime) 로 스튜디오별 기간 조회 / studio_id FK 인덱스도 겸함
+        # UNIQUE 인덱스는 NULL 끼리 서로 다른 값으로 보므로 genre 는 COALESCE 한 함수형 키로 묶음 (MySQL 8.0.13+)
+        Index(
+            "uq_classes_studio_id_class_datetime_genre_level",
+            "studio_id",
+            "class_datetime",
+            func.coalesce(literal_column("genre"), ""),
+            "level",
+            unique=True
+        ),
+    )
 
     # Primary Key
     class_id: Mapped[str] = mapped_column(
@@ -56,11 +75,55 @@ class Class(Base):
     # Level
     level: Mapped[Level] = mapped_column(Enum(Level), nullable=False)
 
+    # 마지막 수정 시각 (ETag 워터마크) - ORM UPDATE 시 자동 갱신, 댄서 목록만 바꿀 때는 직접 갱신
+    updated_at: Mapped[datetime] = mapped_column(
+        PreciseDateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow
+    )
+
     # Relationships
-    studio: Mapped["Studio"] = relationship("Studio", back_populates="classes", lazy="selectin")
+    # 관계 로딩은 쿼리마다 options(selectinload(...)) 로 명시적으로 요청 (lazy="raise")
+    studio: Mapped["Studio"] = relationship("Studio", back_populates="classes", lazy="raise")
     dancers: Mapped[List["Dancer"]] = relationship(
         "Dancer",
         secondary=class_dancer_association,
         back_populates="classes",
-        lazy="selectin"
+        lazy="raise",
+        passive_deletes=True
     )
+
+
+# 수업 목록 읽기 모델 - 목록 응답(ClassDetailResponse)에 필요한 수업/스튜디오/댄서 값을 수업마다 한 행에
+# 원본(classes, studios, dancers, 연결 테이블)을 바꾸는 Store 메서드가 같은 트랜잭션에서 listing.py 로 갱신
+# 어긋난 경우 scripts/rebuild_class_listings.py 로 다시 만듦
+class ClassListing(Base):
+    __tablename__ = "class_listings"
+    __table_args__ = (
+        # 스튜디오별 목록의 기간 조회 + (class_datetime, class_id) 키셋 페이지네이션
+        Index("ix_class_listings_studio_id_class_datetime", "studio_id", "class_datetime"),
+        # 전체 수업 피드의 기간 조회
+        Index("ix_class_listings_class_datetime", "class_datetime"),
+    )
+
+    # 수업이 삭제되면 FK 의 ON DELETE CASCADE 로 함께 삭제 (스튜디오 삭제 시에도 수업을 거쳐 연쇄 삭제)
+    class_id: Mapped[str] = mapped_column(
+        String(36),
+        ForeignKey("classes.class_id", ondelete="CASCADE"),
+        primary_key=True
+    )
+
+    # classes 에서 복사
+    studio_id: Mapped[str] = mapped_column(String(36), nullable=False)
+    timezone: Mapped[str] = mapped_column(String(50), nullable=False)
+    class_datetime: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+    genre: Mapped[Optional[Genre]] = mapped_column(Enum(Genre), nullable=True)
+    level: Mapped[Level] = mapped_column(Enum(Level), nullable=False)
+
+    # studios 에서 복사
+    studio_name: Mapped[str] = mapped_column(String(50), nullable=False)
+    studio_instagram: Mapped[Optional[str]] = mapped_column(String(50), nullable=True)
+
+    # 연결된 댄서 목록 (DancerInfo 모양의 JSON 배열)
+    dancers: Mapped[List[Dict[str, Any]]] = mapped_column(JSON, nullable=False)
+
+    # 이 행을 마지막으로 다시 만든 시각 (수업 목록 ETag 워터마크)
+    refreshed_at: Mapped[datetime] = mapped_column(PreciseDateTime, nullable=False, default=datetime.utcnow)
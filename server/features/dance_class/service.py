@@ -1,14 +1,113 @@
 from fastapi import Depends, HTTPException
-from typing import Annotated, List
+from pydantic import TypeAdapter
+from sqlalchemy import Row
+from collections import Counter
+from datetime import datetime, date, timedelta
+from typing import Annotated, Any, Callable, Dict, List, Optional, Sequence, Tuple
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
-from server.features.dance_class.models import Class
+from server.cache.cache import RESPONSE_CACHE, dancer_tag, studio_classes_tag, studio_tag
+from server.common.batch import in_request_order
+from server.common.csv_stream import iter_csv_rows
+from server.common.etag import make_etag
+from server.common.fast_json import encode_json
+from server.common.errors import invalid_field_format_error
+from server.common.utils import encode_cursor, decode_cursor, to_naive_datetime
+from server.database.connection import gather_in_new_sessions
+
+from server.features.dance_class.models import Class, Level
+from server.features.dancer.models import Genre
 from server.features.dance_class.dto.requests import (
     ClassCreateRequest,
     ClassEditRequest,
-    ClassDeleteRequest
+    ClassDeleteRequest,
+    ClassBulkCreateRequest,
+    MAX_BULK_CLASSES
+)
+from server.features.dance_class.dto.responses import (
+    ClassResponse,
+    ClassDetailResponse,
+    ClassBatchResponse,
+    ClassBulkCreateResponse,
+    ClassBulkRowResult,
+    ClassCalendarResponse,
+    CalendarDaySummary
 )
-from server.features.dance_class.dto.responses import ClassResponse
-from server.features.dance_class.store import ClassStore
+from server.features.dance_class.store import ClassStore, ClassFeedFilter, TIME_OF_DAY_BUCKETS
+
+CLASS_CSV_REQUIRED_COLUMNS = ("studio", "dancers", "class_datetime")
+
+# 피드 기간 - to 를 생략하면 from 부터 FEED_DEFAULT_DAYS 일, 최대 FEED_MAX_DAYS 일 (facet 집계 범위 제한)
+FEED_DEFAULT_DAYS = 7
+FEED_MAX_DAYS = 31
+TIME_OF_DAY_NAMES = tuple(name for name, _, _ in TIME_OF_DAY_BUCKETS)
+
+# facet 이름 -> (집계 행에서 값 꺼내기, 조건 값 목록 꺼내기)
+FacetDimension = Tuple[Callable[[Row], Optional[str]], Callable[[ClassFeedFilter], Tuple[Any, ...]]]
+CLASS_FACETS: Dict[str, FacetDimension] = {
+    "genre": (lambda row: row.genre.value if row.genre else None, lambda feed: tuple(g.value for g in feed.genres)),
+    "level": (lambda row: row.level.value if row.level else None, lambda feed: tuple(l.value for l in feed.levels)),
+    "time_of_day": (lambda row: row.time_of_day, lambda feed: feed.times_of_day),
+}
+STUDIO_FACETS: Dict[str, FacetDimension] = {
+    "city": (lambda row: row.city, lambda feed: feed.cities),
+    "district": (lambda row: row.district, lambda feed: feed.districts),
+    "station": (lambda row: row.station, lambda feed: feed.stations),
+}
+
+# 응답 캐시의 Redis 계층 직렬화용 (List[ClassDetailResponse] 모양의 JSON, 다음 페이지 커서)
+CLASS_DETAIL_PAGE_ADAPTER = TypeAdapter(Tuple[bytes, Optional[str]])
+
+# 캘린더 조회 범위 여유 (UTC-12 ~ UTC+14 차이를 덮도록)
+CALENDAR_RANGE_MARGIN = timedelta(days=2)
+
+
+def _zone_or_none(name: str) -> Optional[ZoneInfo]:
+    try:
+        return ZoneInfo(name)
+    except (ZoneInfoNotFoundError, ValueError):
+        return None
+
+
+def summarize_calendar_days(
+    rows: Sequence[Row],
+    zone: ZoneInfo,
+    month_start: date,
+    month_end: date
+) -> List[CalendarDaySummary]:
+    """수업 행을 zone 기준 현지 날짜로 나눠 일자별 개수/장르/레벨 요약 (month_start 포함, month_end 미포함)
+
+    class_datetime 은 수업 timezone 의 벽시계 시각 - 수업 timezone 을 알 수 없으면 변환 없이 그 날짜로 본다
+    """
+    zones: Dict[str, Optional[ZoneInfo]] = {}
+    counts: Counter[date] = Counter()
+    # 날짜별 장르/레벨 - 처음 나온 순서대로 중복 제거 (dict 키)
+    genres: Dict[date, Dict[str, None]] = {}
+    levels: Dict[date, Dict[str, None]] = {}
+    for row in rows:
+        if row.timezone not in zones:
+            zones[row.timezone] = _zone_or_none(row.timezone)
+        class_zone = zones[row.timezone]
+        local = row.class_datetime
+        if class_zone is not None and class_zone.key != zone.key:
+            local = local.replace(tzinfo=class_zone).astimezone(zone)
+        day = local.date()
+        if not month_start <= day < month_end:
+            continue
+        counts[day] += 1
+        if row.genre is not None:
+            genres.setdefault(day, {})[row.genre.value] = None
+        levels.setdefault(day, {})[row.level.value] = None
+    return [
+        CalendarDaySummary(
+            date=day.isoformat(),
+            count=counts[day],
+            genres=list(genres.get(day, ())),
+            levels=list(levels.get(day, ()))
+        )
+        for day in sorted(counts)
+    ]
+
 
 class ClassService:
     def __init__(self, class_db_store: Annotated[ClassStore, Depends()]):
@@ -62,16 +161,338 @@ class ClassService:
         # 삭제
         await self.class_db_store.delete_class(class_obj)
 
+    # ======================== BULK CREATE ========================
+
+    async def bulk_create_classes(self, class_request: ClassBulkCreateRequest) -> ClassBulkCreateResponse:
+        """JSON 으로 받은 수업 목록 일괄 등록"""
+        return await self._bulk_create([item.model_dump() for item in class_request.classes])
+
+    async def bulk_create_classes_from_csv(self, file) -> ClassBulkCreateResponse:
+        """
+        CSV 파일로 받은 수업 목록 일괄 등록
+
+        CSV 형식: studio,dancers,class_datetime,timezone,level,genre (timezone/level/genre 는 생략 가능)
+        dancers 는 "|" 로 구분
+        예시:
+        studio,dancers,class_datetime,timezone,level,genre
+        1MILLION,김민준|@dancer_jieun,2025-01-15T14:00:00+09:00,Asia/Seoul,BASIC,HIPHOP
+        """
+        rows = iter_csv_rows(file)
+        header = await anext(rows, None) or []
+        missing = [c for c in CLASS_CSV_REQUIRED_COLUMNS if c not in header]
+        if missing:
+            raise invalid_field_format_error(f"CSV 에 필수 컬럼이 없습니다: {', '.join(missing)}")
+
+        classes_data = []
+        async for row in rows:
+            if len(classes_data) >= MAX_BULK_CLASSES:
+                raise invalid_field_format_error(f"한 번에 최대 {MAX_BULK_CLASSES}개의 수업만 등록할 수 있습니다.")
+            classes_data.append({column: row[i] if i < len(row) else "" for i, column in enumerate(header)})
+        if not classes_data:
+            raise invalid_field_format_error("등록할 수업이 없습니다.")
+        return await self._bulk_create(classes_data)
+
+    async def _bulk_create(self, classes_data: List[Dict[str, Any]]) -> ClassBulkCreateResponse:
+        results = await self.class_db_store.create_classes_bulk(classes_data)
+        created = sum(1 for result in results if result["status"] == "created")
+        duplicates = sum(1 for result in results if result["status"] == "duplicate")
+        return ClassBulkCreateResponse(
+            total=len(results),
+            created=created,
+            duplicates=duplicates,
+            failed=len(results) - created - duplicates,
+            results=[ClassBulkRowResult(**result) for result in results]
+        )
+
     # ======================== GETTER METHODS ========================
 
     async def get_class_by_id(self, class_id: str) -> Class | None:
         """수업 ID로 조회"""
         return await self.class_db_store.get_class_by_id(class_id)
 
-    async def get_classes_by_studio(self, studio_id: str) -> List[Class]:
-        """스튜디오별 수업 목록 조회"""
-        return await self.class_db_store.get_classes_by_studio(studio_id)
+    async def get_classes_by_ids(self, class_ids: List[str]) -> ClassBatchResponse:
+        """여러 수업 일괄 조회 (요청 순서, 없는 ID 는 missing 으로)"""
+        rows = await self.class_db_store.get_class_listing_rows_by_ids(class_ids)
+        results, missing = in_request_order(class_ids, {
+            row.class_id: ClassDetailResponse(**ClassDetailResponse.dict_from_row(row, row.dancers))
+            for row in rows
+        })
+        return ClassBatchResponse(results=results, missing=missing)
+
+    async def get_class_etag(self, class_id: str) -> Optional[str]:
+        """수업 상세 ETag (없는 수업이면 None)"""
+        row = await self.class_db_store.get_class_version(class_id)
+        return make_etag("class", class_id, row.updated_at, row.dancer_count) if row is not None else None
+
+    async def get_class_list_etag(
+        self,
+        kind: str,
+        *query: Any,
+        studio_id: Optional[str] = None,
+        dancer_id: Optional[str] = None
+    ) -> str:
+        """스튜디오/댄서별 수업 목록·캘린더 ETag
+
+        워터마크는 스튜디오/댄서 전체 수업 기준이고 (기간 밖 수업이 바뀌어도 달라짐 - 보수적),
+        query(기간/커서/페이지 크기, 캘린더 월/타임존 등 조회 조건)를 함께 넣어
+        조건이 다른 응답끼리 같은 ETag 를 갖지 않게 한다.
+        """
+        if studio_id is None and dancer_id is None:
+            raise invalid_field_format_error("studio_id 와 dancer_id 중 하나만 지정해야 합니다.")
+        row = await self.class_db_store.get_class_list_version(studio_id=studio_id, dancer_id=dancer_id)
+        return make_etag(kind, studio_id, dancer_id, *row, *query)
+
+    async def get_class_page_by_studio(
+        self,
+        studio_id: str,
+        date_from: Optional[datetime] = None,
+        date_to: Optional[datetime] = None,
+        cursor: Optional[str] = None,
+        limit: Optional[int] = None,
+        version: str = ""
+    ) -> Tuple[bytes, Optional[str]]:
+        """스튜디오별 수업 목록 응답 JSON (응답 캐시 사용, version(ETag)이 바뀌면 다른 캐시 항목)"""
+        async def load() -> Tuple[bytes, Optional[str]]:
+            rows = await self.class_db_store.get_class_listing_rows_by_studio(
+                studio_id, **self._window(date_from, date_to, cursor, limit)
+            )
+            return self._encode_class_page(rows, limit)
+
+        return await RESPONSE_CACHE.get_or_load(
+            self._page_key("class:studio", studio_id, date_from, date_to, cursor, limit, version),
+            CLASS_DETAIL_PAGE_ADAPTER,
+            load,
+            tags=[studio_classes_tag(studio_id), studio_tag(studio_id)]
+        )
+
+    async def get_class_page_by_dancer(
+        self,
+        dancer_id: str,
+        date_from: Optional[datetime] = None,
+        date_to: Optional[datetime] = None,
+        cursor: Optional[str] = None,
+        limit: Optional[int] = None,
+        version: str = ""
+    ) -> Tuple[bytes, Optional[str]]:
+        """댄서별 수업 목록 응답 JSON (응답 캐시 사용, version(ETag)이 바뀌면 다른 캐시 항목)"""
+        async def load() -> Tuple[bytes, Optional[str]]:
+            rows = await self.class_db_store.get_class_listing_rows_by_dancer(
+                dancer_id, **self._window(date_from, date_to, cursor, limit)
+            )
+            return self._encode_class_page(rows, limit)
+
+        return await RESPONSE_CACHE.get_or_load(
+            self._page_key("class:dancer", dancer_id, date_from, date_to, cursor, limit, version),
+            CLASS_DETAIL_PAGE_ADAPTER,
+            load,
+            tags=[dancer_tag(dancer_id)]
+        )
+
+    async def get_class_feed(
+        self,
+        date_from: Optional[datetime] = None,
+        date_to: Optional[datetime] = None,
+        timezone: str = "Asia/Seoul",
+        genres: Sequence[str] = (),
+        levels: Sequence[str] = (),
+        times_of_day: Sequence[str] = (),
+        cities: Sequence[str] = (),
+        districts: Sequence[str] = (),
+        stations: Sequence[str] = (),
+        cursor: Optional[str] = None,
+        limit: int = 50,
+        with_facets: bool = True
+    ) -> bytes:
+        """전체 스튜디오 수업 피드 - ClassFeedResponse 모양의 JSON
+
+        페이지와 facet 집계(수업 쪽 / 스튜디오 쪽 두 번)는 서로 독립적인 조회이므로 각자의 세션에서 동시에 실행
+        """
+        feed = self._feed_filter(date_from, date_to, timezone, genres, levels, times_of_day, cities, districts, stations)
+        window = self._window(None, None, cursor, limit)
+        loads = [lambda: self.class_db_store.get_feed_listing_rows(feed, after=window["after"], limit=window["limit"])]
+        if with_facets:
+            loads += [
+                lambda: self.class_db_store.get_feed_class_facet_rows(feed),
+                lambda: self.class_db_store.get_feed_studio_facet_rows(feed)
+            ]
+        class_rows, *facet_rows = await gather_in_new_sessions(*loads)
+
+        page, next_cursor = self._paginate(class_rows, limit)
+        content: Dict[str, Any] = {
+            "classes": self._class_dicts(page),
+            "next_cursor": next_cursor,
+            "total": None,
+            "facets": None
+        }
+        if with_facets:
+            class_facet_rows, studio_facet_rows = facet_rows
+            content["total"] = sum(
+                row.class_count for row in class_facet_rows if _matches(row, feed, CLASS_FACETS, exclude=None)
+            )
+            content["facets"] = {
+                **{name: _facet_counts(class_facet_rows, feed, CLASS_FACETS, name) for name in CLASS_FACETS},
+                **{name: _facet_counts(studio_facet_rows, feed, STUDIO_FACETS, name) for name in STUDIO_FACETS}
+            }
+        return encode_json(content)
+
+    @staticmethod
+    def _feed_filter(
+        date_from: Optional[datetime],
+        date_to: Optional[datetime],
+        timezone: str,
+        genres: Sequence[str],
+        levels: Sequence[str],
+        times_of_day: Sequence[str],
+        cities: Sequence[str],
+        districts: Sequence[str],
+        stations: Sequence[str]
+    ) -> ClassFeedFilter:
+        """요청 값 검증 - from 을 생략하면 timezone 기준 현재 시각부터"""
+        try:
+            zone = ZoneInfo(timezone)
+        except (ZoneInfoNotFoundError, ValueError):
+            raise invalid_field_format_error(f"유효하지 않은 타임존입니다: {timezone}")
+        start = to_naive_datetime(date_from) if date_from else datetime.now(zone).replace(tzinfo=None, microsecond=0)
+        end = to_naive_datetime(date_to) if date_to else start + timedelta(days=FEED_DEFAULT_DAYS)
+        if end <= start:
+            raise invalid_field_format_error("to 는 from 보다 뒤여야 합니다.")
+        if end - start > timedelta(days=FEED_MAX_DAYS):
+            raise invalid_field_format_error(f"조회 기간은 최대 {FEED_MAX_DAYS}일입니다.")
+        try:
+            genre_values = tuple(Genre(g) for g in dict.fromkeys(genres))
+            level_values = tuple(Level(l) for l in dict.fromkeys(levels))
+        except ValueError as e:
+            raise invalid_field_format_error(f"유효하지 않은 장르/레벨입니다: {e}")
+        unknown = [t for t in times_of_day if t not in TIME_OF_DAY_NAMES]
+        if unknown:
+            raise invalid_field_format_error(
+                f"유효하지 않은 시간대입니다: {', '.join(unknown)} ({', '.join(TIME_OF_DAY_NAMES)} 중 선택)"
+            )
+        return ClassFeedFilter(
+            date_from=start,
+            date_to=end,
+            genres=genre_values,
+            levels=level_values,
+            times_of_day=tuple(dict.fromkeys(times_of_day)),
+            cities=tuple(dict.fromkeys(cities)),
+            districts=tuple(dict.fromkeys(districts)),
+            stations=tuple(dict.fromkeys(stations))
+        )
+
+    async def get_class_calendar(
+        self,
+        year: int,
+        month: int,
+        timezone: str,
+        studio_id: Optional[str] = None,
+        dancer_id: Optional[str] = None
+    ) -> ClassCalendarResponse:
+        """월간 캘린더 요약 조회 (스튜디오 또는 댄서 기준)"""
+        if (studio_id is None) == (dancer_id is None):
+            raise invalid_field_format_error("studio_id 와 dancer_id 중 하나만 지정해야 합니다.")
+        try:
+            ZoneInfo(timezone)
+        except (ZoneInfoNotFoundError, ValueError):
+            raise invalid_field_format_error(f"유효하지 않은 타임존입니다: {timezone}")
+
+        month_start = date(year, month, 1)
+        month_end = date(year + 1, 1, 1) if month == 12 else date(year, month + 1, 1)
+        # 수업마다 timezone 이 다를 수 있으므로 인덱스를 타는 넉넉한 범위로 읽은 뒤 현지 날짜로 정확히 거른다
+        rows = await self.class_db_store.get_calendar_rows(
+            range_start=datetime.combine(month_start - CALENDAR_RANGE_MARGIN, datetime.min.time()),
+            range_end=datetime.combine(month_end + CALENDAR_RANGE_MARGIN, datetime.min.time()),
+            studio_id=studio_id,
+            dancer_id=dancer_id
+        )
+        return ClassCalendarResponse(
+            year=year,
+            month=month,
+            timezone=timezone,
+            days=summarize_calendar_days(rows, ZoneInfo(timezone), month_start, month_end)
+        )
+
+    @staticmethod
+    def _window(
+        date_from: Optional[datetime],
+        date_to: Optional[datetime],
+        cursor: Optional[str],
+        limit: Optional[int]
+    ) -> Dict[str, Any]:
+        """목록 조회 Store 메서드에 넘길 기간/커서/limit (다음 페이지 확인용으로 limit + 1 개 조회)"""
+        return {
+            "date_from": to_naive_datetime(date_from) if date_from else None,
+            "date_to": to_naive_datetime(date_to) if date_to else None,
+            "after": decode_cursor(cursor) if cursor else None,
+            "limit": limit + 1 if limit is not None else None
+        }
+
+    @staticmethod
+    def _page_key(
+        kind: str,
+        owner_id: str,
+        date_from: Optional[datetime],
+        date_to: Optional[datetime],
+        cursor: Optional[str],
+        limit: Optional[int],
+        version: str
+    ) -> str:
+        return ":".join([
+            kind,
+            owner_id,
+            date_from.isoformat() if date_from else "",
+            date_to.isoformat() if date_to else "",
+            cursor or "",
+            str(limit or ""),
+            version
+        ])
+
+    def _encode_class_page(
+        self,
+        class_rows: Sequence[Row],
+        limit: Optional[int]
+    ) -> Tuple[bytes, Optional[str]]:
+        """목록 행으로 List[ClassDetailResponse] 모양의 JSON 과 다음 페이지 커서 생성"""
+        page, next_cursor = self._paginate(class_rows, limit)
+        return encode_json(self._class_dicts(page)), next_cursor
+
+    @staticmethod
+    def _class_dicts(class_rows: Sequence[Row]) -> List[Dict[str, Any]]:
+        """class_listings 행을 ClassDetailResponse 모양의 dict 목록으로 (댄서 목록은 저장된 JSON 그대로)"""
+        return [ClassDetailResponse.dict_from_row(row, row.dancers) for row in class_rows]
+
+    @staticmethod
+    def _paginate(classes: Sequence[Any], limit: Optional[int]) -> Tuple[List[Any], Optional[str]]:
+        """limit + 1 개를 조회한 결과로 다음 페이지 존재 여부를 판단해 커서 생성"""
+        if limit is None or len(classes) <= limit:
+            return list(classes), None
+        page = list(classes[:limit])
+        last = page[-1]
+        return page, encode_cursor(last.class_datetime, last.class_id)
+
+
+def _matches(row: Row, feed: ClassFeedFilter, dimensions: Dict[str, FacetDimension], exclude: Optional[str]) -> bool:
+    """exclude 를 뺀 나머지 조건을 집계 행이 만족하는지"""
+    for name, (value_of, selected_in) in dimensions.items():
+        selected = selected_in(feed)
+        if name != exclude and selected and value_of(row) not in selected:
+            return False
+    return True
+
 
-    async def get_classes_by_dancer(self, dancer_id: str) -> List[Class]:
-        """댄서별 수업 목록 조회"""
-        return await self.class_db_store.get_classes_by_dancer(dancer_id)
+def _facet_counts(
+    rows: Sequence[Row],
+    feed: ClassFeedFilter,
+    dimensions: Dict[str, FacetDimension],
+    name: str
+) -> List[Dict[str, Any]]:
+    """facet 하나의 값별 개수 - 자기 조건만 빼고 합산 (값이 없는 수업은 제외, 많은 순)"""
+    value_of = dimensions[name][0]
+    counts: Counter = Counter()
+    for row in rows:
+        value = value_of(row)
+        if value is not None and _matches(row, feed, dimensions, exclude=name):
+            counts[value] += row.class_count
+    return [
+        {"value": value, "count": count}
+        for value, count in sorted(counts.items(), key=lambda item: (-item[1], item[0]))
+    ]
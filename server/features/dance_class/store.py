@@ -1,12 +1,71 @@
+from sqlalchemy import Row, Select, and_, or_, case, extract, func, insert, tuple_
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.sql import select
-from datetime import datetime, date as date_type, time as time_type
-from typing import List, Optional
+from sqlalchemy.orm import selectinload
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
-from server.database.connection import SESSION
+import uuid
+
+from server.common.utils import chunked, normalize_name, to_naive_datetime
+from server.cache.cache import queue_cache_invalidation, studio_classes_tag
+from server.database.common import is_duplicate_key_error
+from server.database.connection import SESSION, attach
 from server.database.annotation import transactional
-from server.features.dance_class.models import Class, Level
-from server.features.dancer.models import Dancer, Genre
-from server.features.dance_class.errors import class_creation_error, class_edit_error, class_delete_error
+from server.features.dance_class.listing import refresh_class_listings
+from server.features.dance_class.models import Class, ClassListing, Level, class_dancer_association
+from server.features.dancer.models import Dancer, DancerName, Genre
+from server.features.studio.models import Studio
+from server.features.dance_class.errors import (
+    class_creation_error,
+    class_edit_error,
+    class_delete_error,
+    class_bulk_conflict_error,
+    class_duplicate_error
+)
+
+# 목록 응답(ClassDetailResponse 모양)을 ORM 객체 없이 만들기 위한 읽기 모델 projection (댄서 목록은 JSON 컬럼)
+CLASS_LISTING_COLUMNS = (
+    ClassListing.class_id,
+    ClassListing.timezone,
+    ClassListing.class_datetime,
+    ClassListing.level,
+    ClassListing.genre,
+    ClassListing.studio_id,
+    ClassListing.studio_name,
+    ClassListing.studio_instagram,
+    ClassListing.dancers,
+)
+
+# 피드 시간대 구분 - 수업 현지 벽시계 시각의 [시작, 끝) 시
+TIME_OF_DAY_BUCKETS = (("NIGHT", 0, 6), ("MORNING", 6, 12), ("AFTERNOON", 12, 18), ("EVENING", 18, 24))
+
+
+def time_of_day_expr(source: Any = Class):
+    """class_datetime 의 시각으로 TIME_OF_DAY_BUCKETS 이름을 계산하는 SQL 식 (source: Class 또는 ClassListing)"""
+    hour = extract("hour", source.class_datetime)
+    *buckets, (last_name, _, _) = TIME_OF_DAY_BUCKETS
+    return case(*((hour < end, name) for name, _, end in buckets), else_=last_name)
+
+
+@dataclass(frozen=True)
+class ClassFeedFilter:
+    """/class/feed 조건 (빈 튜플은 조건 없음, 같은 항목 안의 값들은 OR)"""
+    date_from: datetime
+    date_to: datetime
+    genres: Tuple[Genre, ...] = ()
+    levels: Tuple[Level, ...] = ()
+    times_of_day: Tuple[str, ...] = ()
+    cities: Tuple[str, ...] = ()
+    districts: Tuple[str, ...] = ()
+    stations: Tuple[str, ...] = ()
+
+    @property
+    def has_studio_conditions(self) -> bool:
+        return bool(self.cities or self.districts or self.stations)
+
 
 class ClassStore:
     def __init__(self) -> None:
@@ -19,27 +78,204 @@ class ClassStore:
         return await self.session.scalar(
             select(Class)
             .where(Class.class_id == class_id)
+            .options(selectinload(Class.dancers))
             .execution_options(populate_existing=True)
         )
 
-    async def get_classes_by_studio(self, studio_id: str) -> List[Class]:
-        """스튜디오별 수업 목록 조회"""
-        result = await self.session.scalars(
-            select(Class)
-            .where(Class.studio_id == studio_id)
-            .execution_options(populate_existing=True)
+    async def get_class_listing_rows_by_studio(
+        self,
+        studio_id: str,
+        date_from: Optional[datetime] = None,
+        date_to: Optional[datetime] = None,
+        after: Optional[Tuple[datetime, str]] = None,
+        limit: Optional[int] = None
+    ) -> Sequence[Row]:
+        """스튜디오별 수업 목록 행 (기간 필터 + 키셋 페이지네이션) - class_listings 한 테이블의 (studio_id, class_datetime) 범위 조회"""
+        query = select(*CLASS_LISTING_COLUMNS).where(ClassListing.studio_id == studio_id)
+        return await self._get_rows(self._apply_window(query, date_from, date_to, after, limit, source=ClassListing))
+
+    async def get_class_listing_rows_by_dancer(
+        self,
+        dancer_id: str,
+        date_from: Optional[datetime] = None,
+        date_to: Optional[datetime] = None,
+        after: Optional[Tuple[datetime, str]] = None,
+        limit: Optional[int] = None
+    ) -> Sequence[Row]:
+        """댄서별 수업 목록 행 (기간 필터 + 키셋 페이지네이션) - 연결 테이블로 수업을 고르고 나머지 값은 class_listings 에서"""
+        query = (
+            select(*CLASS_LISTING_COLUMNS)
+            .join(class_dancer_association, class_dancer_association.c.class_id == ClassListing.class_id)
+            .where(class_dancer_association.c.dancer_id == dancer_id)
         )
-        return list(result.all())
+        return await self._get_rows(self._apply_window(query, date_from, date_to, after, limit, source=ClassListing))
 
-    async def get_classes_by_dancer(self, dancer_id: str) -> List[Class]:
-        """댄서별 수업 목록 조회 (association table 조인)"""
-        result = await self.session.scalars(
-            select(Class)
-            .join(Class.dancers)
-            .where(Dancer.dancer_id == dancer_id)
-            .execution_options(populate_existing=True)
+    async def get_class_listing_rows_by_ids(self, class_ids: List[str]) -> Sequence[Row]:
+        """여러 수업의 목록 행을 IN 조회로 (순서 보장 없음)"""
+        return await self._get_rows(select(*CLASS_LISTING_COLUMNS).where(ClassListing.class_id.in_(class_ids)))
+
+    async def get_feed_listing_rows(
+        self,
+        feed: ClassFeedFilter,
+        after: Optional[Tuple[datetime, str]] = None,
+        limit: Optional[int] = None
+    ) -> Sequence[Row]:
+        """전체 스튜디오 수업 피드 한 페이지 (스튜디오 조건이 있을 때만 studios 조인)"""
+        query = select(*CLASS_LISTING_COLUMNS)
+        if feed.has_studio_conditions:
+            query = query.join(Studio, Studio.studio_id == ClassListing.studio_id)
+        query = self._apply_feed_filter(query, feed, class_side=True, studio_side=True, source=ClassListing)
+        return await self._get_rows(
+            self._apply_window(query, feed.date_from, feed.date_to, after, limit, source=ClassListing)
+        )
+
+    async def get_feed_class_facet_rows(self, feed: ClassFeedFilter) -> Sequence[Row]:
+        """기간 안 수업의 (genre, level, time_of_day, class_count) 집계 - 스튜디오 조건만 적용
+
+        장르/레벨/시간대 facet 은 서로의 조건만 적용해 세야 하므로 서비스에서 이 집계를 다시 합산한다.
+        """
+        time_of_day = time_of_day_expr()
+        query = (
+            select(Class.genre, Class.level, time_of_day.label("time_of_day"), func.count().label("class_count"))
+            .select_from(Class)
+            .where(Class.class_datetime >= feed.date_from, Class.class_datetime < feed.date_to)
+        )
+        if feed.has_studio_conditions:
+            query = query.join(Studio, Studio.studio_id == Class.studio_id)
+        query = self._apply_feed_filter(query, feed, class_side=False, studio_side=True)
+        result = await self.session.execute(query.group_by(Class.genre, Class.level, time_of_day))
+        return result.all()
+
+    async def get_feed_studio_facet_rows(self, feed: ClassFeedFilter) -> Sequence[Row]:
+        """기간 안 수업의 스튜디오 (city, district, station, class_count) 집계 - 수업 조건만 적용"""
+        query = (
+            select(Studio.city, Studio.district, Studio.station, func.count().label("class_count"))
+            .select_from(Class)
+            .join(Studio, Studio.studio_id == Class.studio_id)
+            .where(Class.class_datetime >= feed.date_from, Class.class_datetime < feed.date_to)
+        )
+        query = self._apply_feed_filter(query, feed, class_side=True, studio_side=False)
+        result = await self.session.execute(query.group_by(Studio.city, Studio.district, Studio.station))
+        return result.all()
+
+    @staticmethod
+    def _apply_feed_filter(
+        query: Select,
+        feed: ClassFeedFilter,
+        class_side: bool,
+        studio_side: bool,
+        source: Any = Class
+    ) -> Select:
+        """피드 조건 중 수업 쪽(장르/레벨/시간대) / 스튜디오 쪽(도시/구/역) 조건 적용 (기간 제외)"""
+        if class_side:
+            if feed.genres:
+                query = query.where(source.genre.in_(feed.genres))
+            if feed.levels:
+                query = query.where(source.level.in_(feed.levels))
+            if feed.times_of_day:
+                query = query.where(time_of_day_expr(source).in_(feed.times_of_day))
+        if studio_side:
+            if feed.cities:
+                query = query.where(Studio.city.in_(feed.cities))
+            if feed.districts:
+                query = query.where(Studio.district.in_(feed.districts))
+            if feed.stations:
+                query = query.where(Studio.station.in_(feed.stations))
+        return query
+
+    async def _get_rows(self, query: Select) -> Sequence[Row]:
+        return (await self.session.execute(query)).all()
+
+    async def get_calendar_rows(
+        self,
+        range_start: datetime,
+        range_end: datetime,
+        studio_id: Optional[str] = None,
+        dancer_id: Optional[str] = None
+    ) -> Sequence[Row]:
+        """월간 캘린더용 수업 행 (class_datetime, timezone, genre, level) - 시각 순
+
+        class_datetime 은 각 수업의 Class.timezone 기준 벽시계 시각이라 요청 timezone 의 날짜는 서비스에서 나눈다
+        (MySQL CONVERT_TZ 는 tz 테이블이 없으면 NULL 을 반환하므로 DB 에서 변환하지 않음).
+        호출하는 쪽은 timezone 차이를 덮도록 range 를 넉넉하게 잡는다.
+        """
+        query = select(Class.class_datetime, Class.timezone, Class.genre, Class.level)
+        if dancer_id is not None:
+            query = (
+                query
+                .join(class_dancer_association, class_dancer_association.c.class_id == Class.class_id)
+                .where(class_dancer_association.c.dancer_id == dancer_id)
+            )
+        if studio_id is not None:
+            query = query.where(Class.studio_id == studio_id)
+        query = (
+            query
+            .where(Class.class_datetime >= range_start, Class.class_datetime < range_end)
+            .order_by(Class.class_datetime)
         )
-        return list(result.all())
+        return await self._get_rows(query)
+
+    async def get_class_version(self, class_id: str) -> Row | None:
+        """수업 상세 워터마크 (updated_at, 연결된 댄서 수 - 댄서 삭제로 연결이 끊긴 경우 반영)"""
+        result = await self.session.execute(
+            select(Class.updated_at, func.count(class_dancer_association.c.dancer_id).label("dancer_count"))
+            .outerjoin(class_dancer_association, class_dancer_association.c.class_id == Class.class_id)
+            .where(Class.class_id == class_id)
+            .group_by(Class.class_id, Class.updated_at)
+        )
+        return result.first()
+
+    async def get_class_list_version(
+        self,
+        studio_id: Optional[str] = None,
+        dancer_id: Optional[str] = None
+    ) -> Row:
+        """스튜디오/댄서별 수업 목록 워터마크 - (목록 행을 가장 최근에 다시 만든 시각, 수업 수)
+
+        응답에 포함되는 수업/스튜디오/댄서 값이 바뀌면 class_listings 행이 다시 만들어지므로 한 테이블 집계로 충분
+        """
+        query = select(
+            func.max(ClassListing.refreshed_at).label("refreshed_at"),
+            func.count().label("class_count")
+        )
+        if studio_id is not None:
+            query = query.where(ClassListing.studio_id == studio_id)
+        if dancer_id is not None:
+            query = query.where(
+                ClassListing.class_id.in_(
+                    select(class_dancer_association.c.class_id)
+                    .where(class_dancer_association.c.dancer_id == dancer_id)
+                )
+            )
+        result = await self.session.execute(query)
+        return result.one()
+
+    @staticmethod
+    def _apply_window(
+        query: Select,
+        date_from: Optional[datetime],
+        date_to: Optional[datetime],
+        after: Optional[Tuple[datetime, str]],
+        limit: Optional[int],
+        source: Any = Class
+    ) -> Select:
+        """기간(from 포함, to 미포함), 키셋 커서, 정렬, limit 을 SQL 에 적용 (source: Class 또는 ClassListing)"""
+        if date_from is not None:
+            query = query.where(source.class_datetime >= date_from)
+        if date_to is not None:
+            query = query.where(source.class_datetime < date_to)
+        if after is not None:
+            after_datetime, after_class_id = after
+            query = query.where(
+                or_(
+                    source.class_datetime > after_datetime,
+                    and_(source.class_datetime == after_datetime, source.class_id > after_class_id)
+                )
+            )
+        query = query.order_by(source.class_datetime, source.class_id)
+        if limit is not None:
+            query = query.limit(limit)
+        return query
 
     # ======================== WRITE OPERATIONS ========================
 
@@ -77,9 +313,17 @@ class ClassStore:
                 dancers=dancers
             )
             SESSION.add(class_obj)
-            return class_obj
+            await SESSION.flush()
+        except IntegrityError as e:
+            # uq_classes_studio_id_class_datetime_genre_level - /class/bulk 의 duplicate 와 같은 기준 (SQL 문은 응답에 넣지 않음)
+            if is_duplicate_key_error(e):
+                raise class_duplicate_error()
+            raise class_creation_error(e.orig if isinstance(e.orig, Exception) else e)
         except Exception as e:
             raise class_creation_error(e)
+        await refresh_class_listings([class_obj.class_id])
+        queue_cache_invalidation(SESSION().info, [studio_classes_tag(studio_id)])
+        return class_obj
 
     @transactional
     async def edit_class(
@@ -93,12 +337,8 @@ class ClassStore:
     ) -> Class:
         """수업 정보 수정"""
         try:
-            # Ensure class is in session
-            class_in_session = await SESSION.get(Class, class_obj.class_id)
-            if class_in_session is None:
-                class_obj = await SESSION.merge(class_obj)
-            else:
-                class_obj = class_in_session
+            # 요청 세션에서 dancers 와 함께 읽은 객체 (get_class_by_id) - 추가 조회 없음
+            class_obj = await attach(class_obj)
 
             # Update dancer relationships
             if dancer_ids is not None:
@@ -109,6 +349,8 @@ class ClassStore:
                 if len(dancers) != len(dancer_ids):
                     raise ValueError("One or more dancer IDs not found")
                 class_obj.dancers = dancers
+                # 연결 테이블만 바뀌면 classes 행은 UPDATE 되지 않으므로 워터마크를 직접 갱신
+                class_obj.updated_at = datetime.utcnow()
 
             # Update timezone
             if timezone is not None:
@@ -135,6 +377,9 @@ class ClassStore:
                 except ValueError:
                     class_obj.genre = None  # Set to None if invalid
 
+            await SESSION.flush()
+            await refresh_class_listings([class_obj.class_id])
+            queue_cache_invalidation(SESSION().info, [studio_classes_tag(class_obj.studio_id)])
             return class_obj
         except Exception as e:
             raise class_edit_error(e)
@@ -143,14 +388,292 @@ class ClassStore:
     async def delete_class(self, class_obj: Class) -> None:
         """수업 삭제"""
         try:
-            # Ensure class is in session
-            class_in_session = await SESSION.get(Class, class_obj.class_id)
-            if class_in_session is None:
-                class_obj = await SESSION.merge(class_obj)
-            else:
-                class_obj = class_in_session
-
-            SESSION.delete(class_obj)
-            await SESSION.flush()  # Ensure deletion is processed
+            class_obj = await attach(class_obj)
+            await SESSION.delete(class_obj)
+            await SESSION.flush()  # Ensure deletion is processed (목록 행은 FK CASCADE 로 함께 삭제)
+            queue_cache_invalidation(SESSION().info, [studio_classes_tag(class_obj.studio_id)])
         except Exception as e:
             raise class_delete_error(e)
+
+    @transactional
+    async def create_classes_bulk(self, classes_data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        여러 수업을 한 트랜잭션으로 일괄 생성
+
+        - 스튜디오/댄서 참조(ID, 인스타그램, 이름)는 종류별 IN 쿼리 몇 번으로 한꺼번에 해석
+        - 중복 기준은 scripts/remove_duplicate_classes.py 와 같은 (studio_id, class_datetime, genre, level)
+          이며, DB 에 이미 있거나 요청 안에서 앞서 나온 수업과 겹치면 저장하지 않고 duplicate 로 보고
+        - 수업과 댄서 연결 행은 청크 단위 다중 행 INSERT 로 저장
+        - 저장한 수업의 목록 읽기 모델(class_listings) 행도 같은 트랜잭션에서 생성
+
+        Args:
+            classes_data: [{"studio": "...", "dancers": [...], "class_datetime": "...", ...}, ...]
+
+        Returns:
+            행 순서대로의 결과 [{"row", "status", "class_id", "error"}, ...]
+        """
+        validated = [
+            validate_bulk_class_row(row_num, class_data)
+            for row_num, class_data in enumerate(classes_data, start=1)
+        ]
+        rows = [row for row in validated if isinstance(row, BulkClassRow)]
+
+        # 1. 참조 해석용 사전 조회
+        references = BulkClassReferences()
+        studio_refs = list({row.studio for row in rows})
+        for chunk in chunked(studio_refs, BULK_CHUNK_SIZE):
+            handles = [instagram_handle(ref) for ref in chunk]
+            result = await SESSION.execute(
+                select(Studio.studio_id, Studio.name, Studio.instagram)
+                .where(or_(Studio.studio_id.in_(chunk), Studio.instagram.in_(handles), Studio.name.in_(chunk)))
+            )
+            for found in result.all():
+                references.add_studio(found.studio_id, found.name, found.instagram)
+
+        dancer_refs = list({ref for row in rows for ref in row.dancers})
+        for chunk in chunked(dancer_refs, BULK_CHUNK_SIZE):
+            handles = [instagram_handle(ref) for ref in chunk]
+            result = await SESSION.execute(
+                select(Dancer.dancer_id, Dancer.instagram)
+                .where(or_(Dancer.dancer_id.in_(chunk), Dancer.instagram.in_(handles)))
+            )
+            for found in result.all():
+                references.add_dancer(found.dancer_id, found.instagram)
+            result = await SESSION.execute(
+                select(DancerName.normalized_name, DancerName.dancer_id)
+                .where(DancerName.normalized_name.in_({normalize_name(ref) for ref in chunk}))
+            )
+            for found in result.all():
+                references.add_dancer_name(found.normalized_name, found.dancer_id)
+
+        # 2. 참조 해석 후, 중복 판단에 필요한 기존 수업을 (studio_id, class_datetime) 인덱스로 조회
+        resolved = [references.resolve(row) if isinstance(row, BulkClassRow) else row for row in validated]
+        slots = list({(row.studio_id, row.class_datetime) for row in resolved if isinstance(row, ResolvedClassRow)})
+        existing: Dict[Tuple[Any, ...], str] = {}
+        for chunk in chunked(slots, BULK_CHUNK_SIZE):
+            result = await SESSION.execute(
+                select(Class.class_id, Class.studio_id, Class.class_datetime, Class.genre, Class.level)
+                .where(tuple_(Class.studio_id, Class.class_datetime).in_(chunk))
+            )
+            for found in result.all():
+                existing.setdefault(
+                    (found.studio_id, found.class_datetime, found.genre, found.level), found.class_id
+                )
+
+        # 3. 메모리에서 중복 제거 후 청크 단위 저장
+        results, class_rows, association_rows = plan_bulk_classes(resolved, existing)
+        try:
+            for chunk in chunked(class_rows, BULK_CHUNK_SIZE):
+                await SESSION.execute(insert(Class.__table__), chunk)
+        except IntegrityError as e:
+            # 사전 조회 이후 동시에 등록된 수업과 유니크 키가 겹친 경우 (트랜잭션 전체 롤백)
+            raise class_bulk_conflict_error(e)
+        for chunk in chunked(association_rows, BULK_CHUNK_SIZE):
+            await SESSION.execute(insert(class_dancer_association), chunk)
+        await refresh_class_listings(row["class_id"] for row in class_rows)
+        queue_cache_invalidation(SESSION().info, {studio_classes_tag(row["studio_id"]) for row in class_rows})
+        return results
+
+
+# ======================== BULK CREATE HELPERS ========================
+
+BULK_CHUNK_SIZE = 1000
+BULK_DANCER_SEPARATOR = "|"
+
+
+@dataclass
+class BulkClassRow:
+    """형식 검증을 통과한 대량 등록 행 (참조는 아직 문자열)"""
+    row: int
+    studio: str
+    dancers: List[str]
+    timezone: str
+    class_datetime: datetime
+    level: Level
+    genre: Optional[Genre]
+
+
+@dataclass
+class ResolvedClassRow:
+    """스튜디오/댄서 참조를 ID 로 해석한 행"""
+    row: int
+    studio_id: str
+    dancer_ids: List[str]
+    timezone: str
+    class_datetime: datetime
+    level: Level
+    genre: Optional[Genre]
+
+    @property
+    def duplicate_key(self) -> Tuple[Any, ...]:
+        return (self.studio_id, self.class_datetime, self.genre, self.level)
+
+
+def _class_result(row_num: int, status: str, class_id: Optional[str] = None, error: Optional[str] = None) -> Dict[str, Any]:
+    return {"row": row_num, "status": status, "class_id": class_id, "error": error}
+
+
+def instagram_handle(ref: str) -> str:
+    return ref[1:] if ref.startswith("@") else ref
+
+
+def validate_bulk_class_row(row_num: int, class_data: Dict[str, Any]) -> BulkClassRow | Dict[str, Any]:
+    """대량 등록 한 행을 검증해 BulkClassRow 또는 오류 결과를 반환"""
+    try:
+        studio = (class_data.get("studio") or "").strip()
+        dancers = class_data.get("dancers") or []
+        if isinstance(dancers, str):
+            dancers = dancers.split(BULK_DANCER_SEPARATOR)
+        dancers = list(dict.fromkeys(ref.strip() for ref in dancers if ref and ref.strip()))
+        timezone = (class_data.get("timezone") or "").strip() or "Asia/Seoul"
+        class_datetime = (class_data.get("class_datetime") or "").strip()
+        level = (class_data.get("level") or "").strip()
+        genre = (class_data.get("genre") or "").strip()
+
+        if not studio:
+            return _class_result(row_num, "error", error="studio is required")
+        if not dancers:
+            return _class_result(row_num, "error", error="At least one dancer is required")
+        try:
+            ZoneInfo(timezone)
+        except (ZoneInfoNotFoundError, ValueError):
+            return _class_result(row_num, "error", error=f"Invalid timezone: {timezone}")
+        try:
+            parsed_datetime = datetime.fromisoformat(class_datetime.replace('Z', '+00:00'))
+        except ValueError:
+            return _class_result(
+                row_num, "error",
+                error="Invalid datetime format. Expected ISO8601 (e.g., 2025-01-15T14:00:00+09:00)"
+            )
+        try:
+            parsed_level = Level(level) if level else Level.BASIC
+        except ValueError:
+            return _class_result(row_num, "error", error=f"Invalid level: {level}. Must be BASIC or ADVANCED")
+        try:
+            parsed_genre = Genre(genre) if genre else None
+        except ValueError:
+            return _class_result(row_num, "error", error=f"Invalid genre: {genre}")
+
+        return BulkClassRow(
+            row=row_num,
+            studio=studio,
+            dancers=dancers,
+            timezone=timezone,
+            # DB 에는 벽시계 시각으로 저장되므로 중복 비교도 tz 없이
+            class_datetime=to_naive_datetime(parsed_datetime),
+            level=parsed_level,
+            genre=parsed_genre
+        )
+    except Exception as e:
+        return _class_result(row_num, "error", error=str(e))
+
+
+@dataclass
+class BulkClassReferences:
+    """사전 조회한 스튜디오/댄서로 참조 문자열을 ID 로 해석 (인스타그램/이름은 대소문자 무시)
+
+    참조 해석 순서는 ID -> 인스타그램 -> 이름이며, "@" 로 시작하면 인스타그램으로만 찾는다.
+    """
+    studio_ids: Set[str] = field(default_factory=set)
+    studios_by_instagram: Dict[str, str] = field(default_factory=dict)
+    studios_by_name: Dict[str, str] = field(default_factory=dict)
+    dancer_ids: Set[str] = field(default_factory=set)
+    dancers_by_instagram: Dict[str, str] = field(default_factory=dict)
+    dancers_by_name: Dict[str, Set[str]] = field(default_factory=dict)
+
+    def add_studio(self, studio_id: str, name: str, instagram: Optional[str]) -> None:
+        self.studio_ids.add(studio_id)
+        self.studios_by_name[normalize_name(name)] = studio_id
+        if instagram:
+            self.studios_by_instagram[instagram.casefold()] = studio_id
+
+    def add_dancer(self, dancer_id: str, instagram: Optional[str]) -> None:
+        self.dancer_ids.add(dancer_id)
+        if instagram:
+            self.dancers_by_instagram[instagram.casefold()] = dancer_id
+
+    def add_dancer_name(self, normalized_name: str, dancer_id: str) -> None:
+        self.dancers_by_name.setdefault(normalized_name, set()).add(dancer_id)
+
+    def resolve_studio(self, ref: str) -> str:
+        if ref.startswith("@"):
+            studio_id = self.studios_by_instagram.get(ref[1:].casefold())
+        elif ref in self.studio_ids:
+            studio_id = ref
+        else:
+            studio_id = self.studios_by_instagram.get(ref.casefold()) or self.studios_by_name.get(normalize_name(ref))
+        if studio_id is None:
+            raise ValueError(f"Studio not found: {ref}")
+        return studio_id
+
+    def resolve_dancer(self, ref: str) -> str:
+        if ref.startswith("@"):
+            dancer_id = self.dancers_by_instagram.get(ref[1:].casefold())
+        elif ref in self.dancer_ids:
+            dancer_id = ref
+        else:
+            dancer_id = self.dancers_by_instagram.get(ref.casefold())
+            if dancer_id is None:
+                candidates = self.dancers_by_name.get(normalize_name(ref), set())
+                if len(candidates) > 1:
+                    raise ValueError(f"Dancer name is ambiguous: {ref} (use ID or instagram)")
+                dancer_id = next(iter(candidates), None)
+        if dancer_id is None:
+            raise ValueError(f"Dancer not found: {ref}")
+        return dancer_id
+
+    def resolve(self, row: BulkClassRow) -> ResolvedClassRow | Dict[str, Any]:
+        try:
+            return ResolvedClassRow(
+                row=row.row,
+                studio_id=self.resolve_studio(row.studio),
+                dancer_ids=list(dict.fromkeys(self.resolve_dancer(ref) for ref in row.dancers)),
+                timezone=row.timezone,
+                class_datetime=row.class_datetime,
+                level=row.level,
+                genre=row.genre
+            )
+        except ValueError as e:
+            return _class_result(row.row, "error", error=str(e))
+
+
+def plan_bulk_classes(
+    resolved: List[ResolvedClassRow | Dict[str, Any]],
+    existing: Dict[Tuple[Any, ...], str]
+) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]], List[Dict[str, Any]]]:
+    """해석된 행을 순서대로 중복 검사해 저장할 행을 만듦 (DB 접근 없음)
+
+    Args:
+        existing: 미리 조회한 기존 수업 (중복 키 -> class_id)
+
+    Returns:
+        (행별 결과, classes 행 목록, class_dancer_association 행 목록)
+    """
+    results: List[Dict[str, Any]] = []
+    class_rows: List[Dict[str, Any]] = []
+    association_rows: List[Dict[str, Any]] = []
+    seen = dict(existing)
+
+    for row in resolved:
+        if not isinstance(row, ResolvedClassRow):
+            results.append(row)
+            continue
+        duplicate_of = seen.get(row.duplicate_key)
+        if duplicate_of is not None:
+            results.append(_class_result(row.row, "duplicate", class_id=duplicate_of, error="Duplicate class"))
+            continue
+
+        class_id = str(uuid.uuid4())
+        seen[row.duplicate_key] = class_id
+        class_rows.append({
+            "class_id": class_id,
+            "studio_id": row.studio_id,
+            "timezone": row.timezone,
+            "class_datetime": row.class_datetime,
+            "genre": row.genre,
+            "level": row.level
+        })
+        association_rows.extend({"class_id": class_id, "dancer_id": dancer_id} for dancer_id in row.dancer_ids)
+        results.append(_class_result(row.row, "created", class_id=class_id))
+
+    return results, class_rows, association_rows
@@ -1,17 +1,35 @@
-from fastapi import APIRouter, Query, HTTPException, Depends
-from typing import Annotated, List
+from fastapi import APIRouter, Query, HTTPException, Depends, Request, Response
+from fastapi.exceptions import RequestValidationError
+from pydantic import ValidationError
+from datetime import datetime
+from typing import Annotated, List, Optional
 from starlette.status import HTTP_200_OK, HTTP_204_NO_CONTENT
 
+from server.common.batch import MAX_BATCH_IDS, BatchGetRequest
+from server.common.etag import is_not_modified, not_modified_response, set_etag
+from server.common.fast_json import RawJSONResponse
 from server.features.dance_class.service import ClassService
 from server.features.dance_class.dto.requests import (
     ClassCreateRequest,
     ClassEditRequest,
-    ClassDeleteRequest
+    ClassDeleteRequest,
+    ClassBulkCreateRequest,
+    ClassBulkItem
+)
+from server.features.dance_class.dto.responses import (
+    ClassResponse,
+    ClassDetailResponse,
+    ClassBatchResponse,
+    ClassFeedResponse,
+    ClassCalendarResponse,
+    ClassBulkCreateResponse
 )
-from server.features.dance_class.dto.responses import ClassResponse, ClassDetailResponse
 
 class_router = APIRouter()
 
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+MAX_CLASS_PAGE_SIZE = 500
+
 # ======================== CREATE ========================
 
 @class_router.post("/create", status_code=HTTP_200_OK,
@@ -24,45 +42,221 @@ async def create_class(
     """수업 생성 엔드포인트"""
     return await class_service.create_class(class_request)
 
+@class_router.post("/bulk", status_code=HTTP_200_OK,
+                   summary="수업 대량 등록",
+                   description="JSON({\"classes\": [...]}) 또는 CSV 파일(multipart, file 필드)로 여러 수업을 한 번에 등록합니다. "
+                               "스튜디오/댄서는 ID, 인스타그램(@ 접두사 허용) 또는 이름으로 지정할 수 있으며, "
+                               "같은 스튜디오/시각/장르/레벨의 수업이 이미 있으면 등록하지 않고 행별 결과에 duplicate 로 표시합니다.",
+                   openapi_extra={
+                       "requestBody": {
+                           "content": {
+                               "application/json": {
+                                   "schema": {
+                                       "type": "object",
+                                       "properties": {
+                                           "classes": {"type": "array", "items": ClassBulkItem.model_json_schema()}
+                                       },
+                                       "required": ["classes"]
+                                   }
+                               },
+                               "multipart/form-data": {
+                                   "schema": {
+                                       "type": "object",
+                                       "properties": {"file": {"type": "string", "format": "binary"}},
+                                       "required": ["file"]
+                                   }
+                               }
+                           },
+                           "required": True
+                       }
+                   })
+async def bulk_create_classes(
+    class_service: Annotated[ClassService, Depends()],
+    request: Request,
+) -> ClassBulkCreateResponse:
+    """수업 대량 등록 (Content-Type 에 따라 JSON 또는 CSV)"""
+    if request.headers.get("content-type", "").startswith("multipart/form-data"):
+        form = await request.form()
+        file = form.get("file")
+        if file is None or isinstance(file, str):
+            raise HTTPException(
+                status_code=400,
+                detail={"message": "CSV 파일(file)이 필요합니다."}
+            )
+        return await class_service.bulk_create_classes_from_csv(file)
+
+    try:
+        class_request = ClassBulkCreateRequest.model_validate_json(await request.body())
+    except ValidationError as e:
+        raise RequestValidationError(e.errors(include_url=False))
+    return await class_service.bulk_create_classes(class_request)
+
 # ======================== READ ========================
 
+@class_router.post("/batch", status_code=HTTP_200_OK,
+                   summary="수업 일괄 조회",
+                   description=f"수업 ID 목록(최대 {MAX_BATCH_IDS}개)으로 여러 수업을 댄서/스튜디오 정보와 함께 한 번에 조회합니다. "
+                               "결과는 요청 순서이며, 없는 ID 는 missing 으로 반환합니다.")
+async def get_classes_by_ids(
+    class_service: Annotated[ClassService, Depends()],
+    batch_request: BatchGetRequest
+) -> ClassBatchResponse:
+    """수업 일괄 조회"""
+    return await class_service.get_classes_by_ids(batch_request.ids)
+
+@class_router.get("/calendar", status_code=HTTP_200_OK,
+                  response_model=ClassCalendarResponse,
+                  summary="월간 캘린더 요약 조회",
+                  description="스튜디오 또는 댄서의 한 달치 수업을 일자별 개수/장르/레벨로 요약합니다. "
+                              "일자는 timezone 기준으로 나뉩니다. "
+                              "ETag 를 반환하며 If-None-Match 가 일치하면 304 를 반환합니다.")
+async def get_class_calendar(
+    class_service: Annotated[ClassService, Depends()],
+    request: Request,
+    response: Response,
+    year: int = Query(..., ge=2000, le=2100, description="연도"),
+    month: int = Query(..., ge=1, le=12, description="월"),
+    timezone: str = Query("Asia/Seoul", description="일자 구분 기준 타임존 (IANA timezone format)"),
+    studio_id: Optional[str] = Query(None, description="스튜디오 ID (dancer_id 와 둘 중 하나)"),
+    dancer_id: Optional[str] = Query(None, description="댄서 ID (studio_id 와 둘 중 하나)")
+) -> ClassCalendarResponse | Response:
+    """월간 캘린더 요약 조회"""
+    etag = await class_service.get_class_list_etag(
+        "class:calendar", year, month, timezone, studio_id=studio_id, dancer_id=dancer_id
+    )
+    if is_not_modified(request, etag):
+        return not_modified_response(etag)
+    set_etag(response, etag)
+    return await class_service.get_class_calendar(
+        year=year, month=month, timezone=timezone, studio_id=studio_id, dancer_id=dancer_id
+    )
+
+@class_router.get("/feed", status_code=HTTP_200_OK,
+                  response_model=ClassFeedResponse,
+                  summary="전체 수업 피드 조회",
+                  description="모든 스튜디오의 수업을 시간 순으로 조회합니다. "
+                              "기간(from/to, 생략하면 지금부터 7일, 최대 31일), 장르, 레벨, 시간대(NIGHT/MORNING/AFTERNOON/EVENING), "
+                              "스튜디오 도시/구/역으로 거를 수 있으며 같은 항목에 여러 값을 주면 OR 입니다. "
+                              "limit/cursor 로 페이지를 나누고 다음 페이지 커서는 next_cursor 로 반환합니다. "
+                              "facets 는 각 항목별로 자기 조건을 뺀 나머지 조건을 적용한 개수이며, "
+                              "다음 페이지를 불러올 때는 facets=false 로 집계를 생략할 수 있습니다.")
+async def get_class_feed(
+    class_service: Annotated[ClassService, Depends()],
+    date_from: Optional[datetime] = Query(None, alias="from", description="조회 시작 시각 (포함, ISO8601, 생략하면 현재 시각)"),
+    date_to: Optional[datetime] = Query(None, alias="to", description="조회 종료 시각 (미포함, ISO8601)"),
+    timezone: str = Query("Asia/Seoul", description="from 을 생략했을 때 현재 시각의 기준 타임존"),
+    genre: List[str] = Query([], description="장르 (여러 개 가능)"),
+    level: List[str] = Query([], description="레벨 (여러 개 가능)"),
+    time_of_day: List[str] = Query([], description="시간대 - 수업 현지 시각 기준 (여러 개 가능)"),
+    city: List[str] = Query([], description="스튜디오 도시 (여러 개 가능)"),
+    district: List[str] = Query([], description="스튜디오 구 (여러 개 가능)"),
+    station: List[str] = Query([], description="스튜디오 가까운 역 (여러 개 가능)"),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor 값"),
+    limit: int = Query(50, ge=1, le=MAX_CLASS_PAGE_SIZE, description="페이지 크기"),
+    facets: bool = Query(True, description="facet/전체 개수 집계 여부")
+) -> Response:
+    """전체 수업 피드 조회 (응답 JSON 은 서비스에서 직접 인코딩)"""
+    return RawJSONResponse(await class_service.get_class_feed(
+        date_from=date_from,
+        date_to=date_to,
+        timezone=timezone,
+        genres=genre,
+        levels=level,
+        times_of_day=time_of_day,
+        cities=city,
+        districts=district,
+        stations=station,
+        cursor=cursor,
+        limit=limit,
+        with_facets=facets
+    ))
+
 @class_router.get("/{class_id}", status_code=HTTP_200_OK,
+                  response_model=ClassResponse,
                   summary="수업 조회 (ID)",
-                  description="수업 ID로 수업 정보를 조회합니다.")
+                  description="수업 ID로 수업 정보를 조회합니다. "
+                              "ETag 를 반환하며 If-None-Match 가 일치하면 304 를 반환합니다.")
 async def get_class_by_id(
     class_service: Annotated[ClassService, Depends()],
+    request: Request,
+    response: Response,
     class_id: str
-) -> ClassResponse:
+) -> ClassResponse | Response:
     """수업 ID로 조회"""
-    class_obj = await class_service.get_class_by_id(class_id)
-    if class_obj is None:
+    etag = await class_service.get_class_etag(class_id)
+    if etag is not None and is_not_modified(request, etag):
+        return not_modified_response(etag)
+    class_obj = await class_service.get_class_by_id(class_id) if etag is not None else None
+    if etag is None or class_obj is None:
         raise HTTPException(
             status_code=404,
             detail={"message": "수업을 찾을 수 없습니다."}
         )
+    set_etag(response, etag)
     return ClassResponse.from_class(class_obj)
 
 @class_router.get("/studio/{studio_id}", status_code=HTTP_200_OK,
+                  response_model=List[ClassDetailResponse],
                   summary="스튜디오별 수업 목록 조회",
-                  description="특정 스튜디오의 모든 수업을 조회합니다 (댄서 상세 정보 포함).")
+                  description="특정 스튜디오의 수업을 조회합니다 (댄서 상세 정보 포함). "
+                              "from/to 로 기간을 지정하고 limit/cursor 로 페이지를 나눌 수 있으며, "
+                              "다음 페이지가 있으면 X-Next-Cursor 헤더로 커서를 반환합니다. "
+                              "ETag 를 반환하며 If-None-Match 가 일치하면 304 를 반환합니다.")
 async def get_classes_by_studio(
     class_service: Annotated[ClassService, Depends()],
-    studio_id: str
-) -> List[ClassDetailResponse]:
-    """스튜디오별 수업 목록 조회"""
-    classes = await class_service.get_classes_by_studio(studio_id)
-    return [ClassDetailResponse.from_class(c) for c in classes]
+    request: Request,
+    studio_id: str,
+    date_from: Optional[datetime] = Query(None, alias="from", description="조회 시작 시각 (포함, ISO8601)"),
+    date_to: Optional[datetime] = Query(None, alias="to", description="조회 종료 시각 (미포함, ISO8601)"),
+    cursor: Optional[str] = Query(None, description="이전 응답의 X-Next-Cursor 값"),
+    limit: Optional[int] = Query(None, ge=1, le=MAX_CLASS_PAGE_SIZE, description="페이지 크기")
+) -> Response:
+    """스튜디오별 수업 목록 조회 (응답 JSON 은 서비스에서 직접 인코딩)"""
+    etag = await class_service.get_class_list_etag(
+        "class:studio", date_from, date_to, cursor, limit, studio_id=studio_id
+    )
+    if is_not_modified(request, etag):
+        return not_modified_response(etag)
+    body, next_cursor = await class_service.get_class_page_by_studio(
+        studio_id, date_from=date_from, date_to=date_to, cursor=cursor, limit=limit, version=etag
+    )
+    return _class_page_response(body, etag, next_cursor)
 
 @class_router.get("/dancer/{dancer_id}", status_code=HTTP_200_OK,
+                  response_model=List[ClassDetailResponse],
                   summary="댄서별 수업 목록 조회",
-                  description="특정 댄서가 진행하는 모든 수업을 조회합니다 (스튜디오 정보 포함).")
+                  description="특정 댄서가 진행하는 수업을 조회합니다 (스튜디오 정보 포함). "
+                              "from/to 로 기간을 지정하고 limit/cursor 로 페이지를 나눌 수 있으며, "
+                              "다음 페이지가 있으면 X-Next-Cursor 헤더로 커서를 반환합니다. "
+                              "ETag 를 반환하며 If-None-Match 가 일치하면 304 를 반환합니다.")
 async def get_classes_by_dancer(
     class_service: Annotated[ClassService, Depends()],
-    dancer_id: str
-) -> List[ClassDetailResponse]:
-    """댄서별 수업 목록 조회"""
-    classes = await class_service.get_classes_by_dancer(dancer_id)
-    return [ClassDetailResponse.from_class(c) for c in classes]
+    request: Request,
+    dancer_id: str,
+    date_from: Optional[datetime] = Query(None, alias="from", description="조회 시작 시각 (포함, ISO8601)"),
+    date_to: Optional[datetime] = Query(None, alias="to", description="조회 종료 시각 (미포함, ISO8601)"),
+    cursor: Optional[str] = Query(None, description="이전 응답의 X-Next-Cursor 값"),
+    limit: Optional[int] = Query(None, ge=1, le=MAX_CLASS_PAGE_SIZE, description="페이지 크기")
+) -> Response:
+    """댄서별 수업 목록 조회 (응답 JSON 은 서비스에서 직접 인코딩)"""
+    etag = await class_service.get_class_list_etag(
+        "class:dancer", date_from, date_to, cursor, limit, dancer_id=dancer_id
+    )
+    if is_not_modified(request, etag):
+        return not_modified_response(etag)
+    body, next_cursor = await class_service.get_class_page_by_dancer(
+        dancer_id, date_from=date_from, date_to=date_to, cursor=cursor, limit=limit, version=etag
+    )
+    return _class_page_response(body, etag, next_cursor)
+
+
+def _class_page_response(body: bytes, etag: str, next_cursor: Optional[str]) -> Response:
+    """Response 를 직접 반환하면 주입된 response 의 헤더가 합쳐지지 않으므로 반환 객체에 헤더 설정"""
+    response = RawJSONResponse(body)
+    set_etag(response, etag)
+    if next_cursor is not None:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    return response
 
 # ======================== UPDATE ========================
 
@@ -1,4 +1,5 @@
 from pydantic import BaseModel
+from sqlalchemy import Row
 from typing import List, Dict, Any, Optional
 
 from server.features.dancer.models import Dancer
@@ -24,6 +25,25 @@ class DancerResponse(BaseModel):
             role="DANCER"
         )
 
+    @staticmethod
+    def from_row(row: Row) -> "DancerResponse":
+        """컬럼 projection 결과(Row)로부터 생성 (ORM 객체 불필요)"""
+        return DancerResponse(
+            dancer_id=row.dancer_id,
+            main_name=row.main_name,
+            names=row.names,
+            instagram=row.instagram,
+            is_verified=row.is_verified,
+            genre=row.genre.value if row.genre else None,
+            role="DANCER"
+        )
+
+
+class DancerBatchResponse(BaseModel):
+    """댄서 일괄 조회 결과 (요청 순서)"""
+    results: List[DancerResponse]
+    missing: List[str]  # 찾지 못한 dancer_id
+
 
 class DancerBulkUploadResponse(BaseModel):
     """대량 업로드 결과"""
@@ -31,3 +51,20 @@ class DancerBulkUploadResponse(BaseModel):
     success: int
     failed: int
     errors: List[Dict[str, Any]]
+
+
+class DancerBulkUploadJobResponse(BaseModel):
+    """대량 업로드 작업 등록 결과"""
+    job_id: str
+    status: str
+
+
+class DancerBulkUploadJobStatusResponse(BaseModel):
+    """대량 업로드 작업 상태"""
+    job_id: str
+    status: str                      # queued, started, finished, failed ...
+    processed: int                   # 지금까지 처리한 행 수
+    total: Optional[int] = None      # 완료 후 전체 행 수
+    success: Optional[int] = None    # 완료 후 성공 개수
+    failed: Optional[int] = None     # 완료 후 실패 개수
+    error: Optional[str] = None      # 작업 자체가 실패한 경우 원인
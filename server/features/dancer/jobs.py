@@ -0,0 +1,178 @@
+"""댄서 대량 업로드 백그라운드 작업 (RQ)
+
+API 서버는 업로드 파일을 JOB_UPLOAD_DIR 에 저장하고 작업만 등록한다.
+워커에서 DancerService.bulk_upload_dancers 로 처리하며, 진행 상황은 job.meta["processed"] 에 기록한다.
+
+    rq worker dancer-import --url $JOB_REDIS_URL
+"""
+import asyncio
+import os
+import uuid
+from typing import Annotated, Any, Dict, Optional
+
+from fastapi import Depends, HTTPException
+from rq import Queue, get_current_job
+from rq.exceptions import NoSuchJobError
+from rq.job import Job, JobStatus
+from starlette.concurrency import run_in_threadpool
+
+from server.cache.cache import RESPONSE_CACHE
+from server.common.csv_stream import UPLOAD_READ_CHUNK_SIZE, AsyncFileReader
+from server.database.connection import DATABASE, SESSION
+from server.jobs.queue import get_dancer_import_queue
+from server.jobs.settings import JOB_SETTINGS
+from server.features.dancer.dto.responses import (
+    DancerBulkUploadResponse,
+    DancerBulkUploadJobResponse,
+    DancerBulkUploadJobStatusResponse
+)
+from server.features.dancer.service import DancerService
+from server.features.dancer.store import DancerStore
+
+
+# ======================== WORKER ========================
+
+def run_dancer_bulk_upload(upload_path: str) -> Dict[str, Any]:
+    """RQ 워커에서 실행 - 저장된 CSV 를 처리하고 DancerBulkUploadResponse 를 dict 로 반환"""
+    job = get_current_job()
+
+    async def report_progress(processed: int) -> None:
+        if job is not None:
+            job.meta["processed"] = processed
+            job.save_meta()
+
+    async def run() -> DancerBulkUploadResponse:
+        try:
+            with open(upload_path, "rb") as file:
+                return await DancerService(DancerStore()).bulk_upload_dancers(
+                    AsyncFileReader(file), on_progress=report_progress
+                )
+        finally:
+            await RESPONSE_CACHE.close()
+            await SESSION.remove()
+            # asyncio.run 마다 이벤트 루프가 바뀌므로 이전 루프에 묶인 커넥션을 풀에 남기지 않음
+            await DATABASE.dispose()
+
+    try:
+        return asyncio.run(run()).model_dump()
+    finally:
+        os.remove(upload_path)
+
+
+# ======================== API ========================
+
+JOB_RESULT_MISSING_MESSAGE = "작업 결과가 없습니다 (보관 기간이 지났거나 결과 저장에 실패했습니다)."
+
+
+def _job_result(job: Job) -> Optional[DancerBulkUploadResponse]:
+    """완료된 작업의 반환값 (run_dancer_bulk_upload 의 dict) - 만료되었거나 없으면 None"""
+    result = job.return_value()
+    if result is None:
+        return None
+    return DancerBulkUploadResponse.model_validate(result)
+
+
+def _remove_if_exists(path: str) -> None:
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+class DancerBulkUploadJobService:
+    def __init__(self, queue: Annotated[Queue, Depends(get_dancer_import_queue)]):
+        self.queue = queue
+
+    async def submit(self, file) -> DancerBulkUploadJobResponse:
+        """업로드 파일을 청크 단위로 저장한 뒤 작업 등록 (등록에 실패하면 저장한 파일 삭제)"""
+        upload_path = await self._save_upload(file)
+        try:
+            job = await run_in_threadpool(
+                self.queue.enqueue,
+                run_dancer_bulk_upload,
+                upload_path,
+                job_timeout=JOB_SETTINGS.job_timeout,
+                result_ttl=JOB_SETTINGS.result_ttl,
+                failure_ttl=JOB_SETTINGS.result_ttl,
+                meta={"processed": 0}
+            )
+        except Exception:
+            await run_in_threadpool(_remove_if_exists, upload_path)
+            raise
+        return DancerBulkUploadJobResponse(job_id=job.id, status=job.get_status(refresh=False).value)
+
+    @staticmethod
+    async def _save_upload(file) -> str:
+        """업로드 파일을 JOB_UPLOAD_DIR 에 저장하고 경로 반환 - 파일 쓰기는 스레드풀에서 (이벤트 루프를 막지 않도록)"""
+        await run_in_threadpool(os.makedirs, JOB_SETTINGS.upload_dir, exist_ok=True)
+        upload_path = os.path.join(JOB_SETTINGS.upload_dir, f"dancers-{uuid.uuid4().hex}.csv")
+        out = await run_in_threadpool(open, upload_path, "wb")
+        try:
+            while chunk := await file.read(UPLOAD_READ_CHUNK_SIZE):
+                await run_in_threadpool(out.write, chunk)
+        except Exception:
+            await run_in_threadpool(out.close)
+            await run_in_threadpool(_remove_if_exists, upload_path)
+            raise
+        await run_in_threadpool(out.close)
+        return upload_path
+
+    async def get_status(self, job_id: str) -> DancerBulkUploadJobStatusResponse:
+        return await run_in_threadpool(self._status, job_id)
+
+    async def get_report(self, job_id: str) -> DancerBulkUploadResponse:
+        """완료된 작업의 결과 (행별 오류 포함)"""
+        return await run_in_threadpool(self._report, job_id)
+
+    # RQ 클라이언트는 동기 Redis 를 사용하므로 아래 메서드는 스레드풀에서 실행
+
+    def _status(self, job_id: str) -> DancerBulkUploadJobStatusResponse:
+        job = self._fetch(job_id)
+        status = job.get_status()
+        response = DancerBulkUploadJobStatusResponse(
+            job_id=job.id,
+            status=status.value if status is not None else JobStatus.FAILED.value,
+            processed=job.meta.get("processed", 0)
+        )
+        if status == JobStatus.FINISHED:
+            result = _job_result(job)
+            if result is None:
+                # 완료 표시는 있지만 결과가 없음 (보관 기간 만료 등) - 결과를 볼 수 없으므로 실패로 취급
+                response.status = JobStatus.FAILED.value
+                response.error = JOB_RESULT_MISSING_MESSAGE
+            else:
+                response.total = result.total
+                response.success = result.success
+                response.failed = result.failed
+        elif status == JobStatus.FAILED and job.exc_info:
+            response.error = job.exc_info.strip().splitlines()[-1]
+        return response
+
+    def _report(self, job_id: str) -> DancerBulkUploadResponse:
+        job = self._fetch(job_id)
+        status = job.get_status()
+        if status == JobStatus.FAILED:
+            raise HTTPException(
+                status_code=409,
+                detail={"message": "실패한 작업입니다. 상태 조회에서 원인을 확인하세요."}
+            )
+        if status != JobStatus.FINISHED:
+            raise HTTPException(
+                status_code=409,
+                detail={"message": "아직 완료되지 않은 작업입니다."}
+            )
+        result = _job_result(job)
+        if result is None:
+            raise HTTPException(
+                status_code=410,
+                detail={"message": JOB_RESULT_MISSING_MESSAGE}
+            )
+        return result
+
+    def _fetch(self, job_id: str) -> Job:
+        try:
+            return Job.fetch(job_id, connection=self.queue.connection)
+        except NoSuchJobError:
+            raise HTTPException(
+                status_code=404,
+                detail={"message": "작업을 찾을 수 없습니다."}
+            )
@@ -1,7 +1,8 @@
-from server.database.common import Base
+from server.database.common import Base, PreciseDateTime
 
-from sqlalchemy import String, ForeignKey, Boolean, JSON, Enum
+from sqlalchemy import String, ForeignKey, Boolean, JSON, Enum, Index, UniqueConstraint
 from sqlalchemy.orm import Mapped, mapped_column, relationship
+from datetime import datetime
 from typing import List, Optional, TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -49,14 +50,51 @@ class Dancer(Base):
     is_verified: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)
     # 댄스 장르
     genre: Mapped[Optional[Genre]] = mapped_column(Enum(Genre), nullable=True)
+    # 마지막 수정 시각 (ETag 워터마크) - ORM UPDATE 시 자동 갱신
+    updated_at: Mapped[datetime] = mapped_column(
+        PreciseDateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow
+    )
 
     # User와의 관계
-    user: Mapped[Optional["User"]] = relationship("User", back_populates="dancer", lazy="selectin")
+    user: Mapped[Optional["User"]] = relationship("User", back_populates="dancer", lazy="raise")
 
     # Class와의 관계 (many-to-many)
+    # 관계 로딩은 쿼리마다 명시적으로 요청 (lazy="raise")
     classes: Mapped[List["Class"]] = relationship(
         "Class",
         secondary="class_dancer_association",
         back_populates="dancers",
-        lazy="selectin"
+        lazy="raise",
+        passive_deletes=True
+    )
+
+    # 이름 조회용 정규화 테이블과의 관계 (main_name, names 와 항상 함께 갱신)
+    name_entries: Mapped[List["DancerName"]] = relationship(
+        "DancerName",
+        back_populates="dancer",
+        lazy="raise",
+        cascade="all, delete-orphan",
+        passive_deletes=True
     )
+
+
+# 댄서 이름 색인 (main_name 과 names JSON 배열을 이름 단위로 펼친 테이블)
+class DancerName(Base):
+    __tablename__ = "dancer_names"
+    __table_args__ = (
+        # 한 댄서 안에서 같은 이름(정규화 기준)은 한 번만
+        UniqueConstraint("dancer_id", "normalized_name", name="uq_dancer_names_dancer_id_normalized_name"),
+        # 이름으로 댄서 찾기
+        Index("ix_dancer_names_normalized_name", "normalized_name"),
+    )
+
+    # 이름 고유 식별자
+    dancer_name_id: Mapped[str] = mapped_column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    # 댄서 고유 식별자
+    dancer_id: Mapped[str] = mapped_column(String(36), ForeignKey("dancers.dancer_id", ondelete="CASCADE"), nullable=False)
+    # 원본 이름
+    name: Mapped[str] = mapped_column(String(50), nullable=False)
+    # 정규화된 이름 (normalize_name 결과)
+    normalized_name: Mapped[str] = mapped_column(String(50), nullable=False)
+
+    dancer: Mapped["Dancer"] = relationship("Dancer", back_populates="name_entries", lazy="raise")
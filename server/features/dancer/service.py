@@ -1,13 +1,20 @@
 from fastapi import Depends, HTTPException
-from typing import Annotated, List, Dict, Any, cast
-import pandas as pd
-from io import BytesIO
+from pydantic import TypeAdapter
+from typing import Annotated, Awaitable, Callable, List, Optional, Tuple
+
+from server.cache.cache import RESPONSE_CACHE, dancer_tag
+from server.common.batch import in_request_order
+from server.common.csv_stream import iter_csv_rows, iter_row_batches
+from server.common.etag import make_etag
 
 from server.features.dancer.models import Dancer
 from server.features.dancer.dto.requests import *
-from server.features.dancer.dto.responses import DancerResponse, DancerBulkUploadResponse
+from server.features.dancer.dto.responses import DancerResponse, DancerBatchResponse, DancerBulkUploadResponse
 from server.features.dancer.store import DancerStore
 
+# 응답 캐시의 Redis 계층 직렬화용
+DANCER_RESPONSE_ADAPTER = TypeAdapter(DancerResponse)
+
 class DancerService:
     def __init__(self, dancer_db_store: Annotated[DancerStore, Depends()]):
         self.dancer_db_store = dancer_db_store
@@ -23,8 +30,8 @@ class DancerService:
         return DancerResponse.from_dancer(dancer)
     
     async def edit_dancer(self, dancer_request: DancerEditRequest) -> DancerResponse:
-        # 먼저 댄서를 조회
-        dancer = await self.dancer_db_store.get_dancer_by_id(dancer_request.dancer_id)
+        # 먼저 댄서를 조회 (이름 색인 행도 함께 - 수정 시 추가 조회 없음)
+        dancer = await self.dancer_db_store.get_dancer_by_id(dancer_request.dancer_id, with_name_entries=True)
         if dancer is None:
             raise HTTPException(
                 status_code=404,
@@ -42,8 +49,8 @@ class DancerService:
         return DancerResponse.from_dancer(updated_dancer)
 
     async def add_dancer_name(self, dancer_request: DancerNameAddRequest) -> DancerResponse:
-        # 먼저 댄서를 조회
-        dancer = await self.dancer_db_store.get_dancer_by_id(dancer_request.dancer_id)
+        # 먼저 댄서를 조회 (이름 색인 행도 함께 - 수정 시 추가 조회 없음)
+        dancer = await self.dancer_db_store.get_dancer_by_id(dancer_request.dancer_id, with_name_entries=True)
         if dancer is None:
             raise HTTPException(
                 status_code=404,
@@ -72,16 +79,48 @@ class DancerService:
     async def get_dancer_by_id(self, dancer_id: str) -> Dancer | None:
         return await self.dancer_db_store.get_dancer_by_id(dancer_id)
 
+    async def get_dancer_etag(self, dancer_id: str) -> str | None:
+        """댄서 상세 ETag (없는 댄서면 None)"""
+        updated_at = await self.dancer_db_store.get_dancer_version(dancer_id)
+        return make_etag("dancer", dancer_id, updated_at) if updated_at is not None else None
+
+    async def get_dancer_etag_by_instagram(self, instagram: str) -> Tuple[str, str] | None:
+        """인스타그램 아이디로 (dancer_id, ETag) 조회"""
+        row = await self.dancer_db_store.get_dancer_version_by_instagram(instagram)
+        return (row.dancer_id, make_etag("dancer", row.dancer_id, row.updated_at)) if row is not None else None
+
+    async def get_dancer_response(self, dancer_id: str, version: str = "") -> DancerResponse | None:
+        """댄서 ID로 조회 (응답 캐시 사용, version(ETag)이 바뀌면 다른 캐시 항목)"""
+        async def load() -> DancerResponse | None:
+            dancer = await self.dancer_db_store.get_dancer_by_id(dancer_id)
+            return DancerResponse.from_dancer(dancer) if dancer is not None else None
+
+        return await RESPONSE_CACHE.get_or_load(
+            f"dancer:{dancer_id}:{version}", DANCER_RESPONSE_ADAPTER, load, tags=[dancer_tag(dancer_id)]
+        )
+
+    async def get_dancers_by_ids(self, dancer_ids: List[str]) -> DancerBatchResponse:
+        """여러 댄서 일괄 조회 (요청 순서, 없는 ID 는 missing 으로)"""
+        rows = await self.dancer_db_store.get_dancer_rows_by_ids(dancer_ids)
+        results, missing = in_request_order(dancer_ids, {row.dancer_id: DancerResponse.from_row(row) for row in rows})
+        return DancerBatchResponse(results=results, missing=missing)
+
     async def get_dancer_by_name(self, name: str) -> List[Dancer]:
         return await self.dancer_db_store.get_dancer_by_name(name)
 
     async def get_dancer_by_instagram(self, instagram: str) -> Dancer | None:
         return await self.dancer_db_store.get_dancer_by_instagram(instagram)
 
-    async def bulk_upload_dancers(self, file) -> DancerBulkUploadResponse:
+    async def bulk_upload_dancers(
+        self,
+        file,
+        on_progress: Optional[Callable[[int], Awaitable[None]]] = None
+    ) -> DancerBulkUploadResponse:
         """
         CSV 파일을 파싱하여 여러 댄서를 일괄 생성/업데이트 (Upsert)
 
+        파일 전체를 메모리에 올리지 않고 청크 단위로 읽어 UPLOAD_BATCH_SIZE 행씩 저장
+
         CSV 형식: name,instagram
         예시:
         name,instagram
@@ -90,12 +129,11 @@ class DancerService:
         이수진,
         """
         try:
-            # CSV 파일 읽기
-            contents = await file.read()
-            df = pd.read_csv(BytesIO(contents), dtype=str, keep_default_na=False)
+            rows = iter_csv_rows(file)
+            header = await anext(rows, None)
 
             # 필수 컬럼 확인
-            if "name" not in df.columns:
+            if header is None or "name" not in header:
                 return DancerBulkUploadResponse(
                     total=0,
                     success=0,
@@ -108,19 +146,16 @@ class DancerService:
                     }]
                 )
 
-            # DataFrame을 딕셔너리 리스트로 변환
-            dancers_data = cast(List[Dict[str, Any]], df.to_dict(orient="records"))
-
             # Store의 배치 처리 호출
-            success_count, errors = await self.dancer_db_store.create_or_update_dancers_bulk(dancers_data)
-
-            total = len(dancers_data)
-            failed = total - success_count
+            total, success_count, errors = await self.dancer_db_store.create_or_update_dancers_stream(
+                iter_row_batches(rows, header, UPLOAD_BATCH_SIZE),
+                on_progress=on_progress
+            )
 
             return DancerBulkUploadResponse(
                 total=total,
                 success=success_count,
-                failed=failed,
+                failed=total - success_count,
                 errors=errors
             )
 
@@ -135,4 +170,7 @@ class DancerService:
                     "instagram": "",
                     "error": f"File processing error: {str(e)}"
                 }]
-            )
\ No newline at end of file
+            )
+
+
+UPLOAD_BATCH_SIZE = 1000
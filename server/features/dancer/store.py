@@ -1,35 +1,95 @@
+from sqlalchemy import Row
 from sqlalchemy.sql import select
-from sqlalchemy import func
-from typing import List, Dict, Tuple, Any
+from sqlalchemy.orm import selectinload
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import List, Dict, Tuple, Any, AsyncIterator, Awaitable, Callable, Optional
 
-from server.database.connection import SESSION
+import uuid
+
+from server.common.utils import chunked, normalize_name
+from server.cache.cache import dancer_tag, queue_cache_invalidation
+from server.database.common import insert_on_conflict
+from server.database.connection import SESSION, attach
 from server.database.annotation import transactional
-from server.features.dancer.models import Dancer, Genre
+from server.features.dance_class.listing import dancer_class_ids, refresh_class_listings
+from server.features.dancer.models import Dancer, DancerName, Genre
+from server.features.search.index import dancer_entry, queue_search_index_updates
 from server.features.dancer.errors import dancer_creation_error, dancer_edit_error, dancer_delete_error
 
+# 상세 응답(DancerResponse)에 필요한 컬럼만 조회하기 위한 projection
+DANCER_RESPONSE_COLUMNS = (
+    Dancer.dancer_id,
+    Dancer.main_name,
+    Dancer.names,
+    Dancer.instagram,
+    Dancer.is_verified,
+    Dancer.genre,
+)
+
+def sync_name_entries(dancer: Dancer) -> None:
+    """dancer.main_name + dancer.names 와 dancer_names 테이블 행을 맞춤 (name_entries 가 로딩되어 있거나 새 객체여야 함)
+
+    main_name 이 names 에 없을 수도 있으므로 (대표 이름만 수정) 함께 색인 - 두 값을 모두 바꾼 뒤 호출
+    """
+    wanted: Dict[str, str] = {}
+    for name in [dancer.main_name, *dancer.names]:
+        normalized = normalize_name(name)
+        if normalized and normalized not in wanted:
+            wanted[normalized] = name
+
+    kept = []
+    for entry in dancer.name_entries:
+        if entry.normalized_name in wanted:
+            entry.name = wanted.pop(entry.normalized_name)
+            kept.append(entry)
+    dancer.name_entries = kept + [
+        DancerName(name=name, normalized_name=normalized) for normalized, name in wanted.items()
+    ]
+
+
 class DancerStore:
     def __init__(self) -> None:
         self.session = SESSION
 
-    async def get_dancer_by_id(self, dancer_id: str) -> Dancer | None:
-        return await self.session.scalar(select(Dancer).where(Dancer.dancer_id == dancer_id))
+    async def get_dancer_by_id(self, dancer_id: str, with_name_entries: bool = False) -> Dancer | None:
+        """댄서 ID로 조회 (이름을 수정할 때는 with_name_entries=True 로 이름 색인 행도 함께 로딩)"""
+        query = select(Dancer).where(Dancer.dancer_id == dancer_id)
+        if with_name_entries:
+            query = query.options(selectinload(Dancer.name_entries))
+        return await self.session.scalar(query)
 
     async def get_dancer_by_name(self, name: str) -> List[Dancer]:
-        """특정 이름이 names 배열에 포함된 모든 댄서 조회"""
+        """특정 이름이 대표 이름이거나 names 배열에 포함된 모든 댄서 조회 (dancer_names 색인 조회)"""
         result = await self.session.scalars(
-            select(Dancer).where(
-                func.json_search(
-                    Dancer.names,
-                    'one',
-                    name
-                ).isnot(None)
-            )
+            select(Dancer)
+            .join(DancerName, DancerName.dancer_id == Dancer.dancer_id)
+            .where(DancerName.normalized_name == normalize_name(name))
+            .distinct()
         )
         return list(result.all())
 
     async def get_dancer_by_instagram(self, instagram: str) -> Dancer | None:
         return await self.session.scalar(select(Dancer).where(Dancer.instagram == instagram))
 
+    async def get_dancer_rows_by_ids(self, dancer_ids: List[str]) -> List[Row]:
+        """여러 댄서를 한 번의 IN 조회로 (컬럼 projection, 순서 보장 없음)"""
+        result = await self.session.execute(
+            select(*DANCER_RESPONSE_COLUMNS).where(Dancer.dancer_id.in_(dancer_ids))
+        )
+        return list(result.all())
+
+    async def get_dancer_version(self, dancer_id: str) -> datetime | None:
+        """댄서의 updated_at (없으면 None)"""
+        return await self.session.scalar(select(Dancer.updated_at).where(Dancer.dancer_id == dancer_id))
+
+    async def get_dancer_version_by_instagram(self, instagram: str) -> Row | None:
+        """인스타그램 아이디로 (dancer_id, updated_at) 조회"""
+        result = await self.session.execute(
+            select(Dancer.dancer_id, Dancer.updated_at).where(Dancer.instagram == instagram)
+        )
+        return result.first()
+
     @transactional
     async def create_dancer(
         self,
@@ -46,6 +106,7 @@ class DancerStore:
                 genre=Genre(genre) if genre else None,
                 user_id=user_id if user_id else None
             )
+            sync_name_entries(dancer)
             SESSION.add(dancer)
             return dancer
         except Exception as e:
@@ -58,16 +119,15 @@ class DancerStore:
         name: str
     ) -> Dancer:
         try:
-            dancer_in_session = await SESSION.get(Dancer, dancer.dancer_id)
-            if dancer_in_session is None:
-                dancer = await SESSION.merge(dancer)
-            else:
-                dancer = dancer_in_session
+            # 요청 세션에서 name_entries 와 함께 읽은 객체 (get_dancer_by_id(..., with_name_entries=True))
+            dancer = await attach(dancer)
 
             if name not in dancer.names:
                 dancer.names = dancer.names + [name]
                 # main_name은 names의 첫 번째 항목으로 유지
                 dancer.main_name = dancer.names[0]
+                sync_name_entries(dancer)
+                queue_cache_invalidation(SESSION().info, [dancer_tag(dancer.dancer_id)])
             return dancer
         except Exception as e:
             raise dancer_edit_error(e)
@@ -83,11 +143,8 @@ class DancerStore:
         is_verified: bool | None = None
     ) -> Dancer:
         try:
-            dancer_in_session = await SESSION.get(Dancer, dancer.dancer_id)
-            if dancer_in_session is None:
-                dancer = await SESSION.merge(dancer)
-            else:
-                dancer = dancer_in_session
+            # 요청 세션에서 name_entries 와 함께 읽은 객체 (get_dancer_by_id(..., with_name_entries=True))
+            dancer = await attach(dancer)
 
             if names is not None:
                 dancer.names = names
@@ -96,6 +153,8 @@ class DancerStore:
                     dancer.main_name = names[0]
             if main_name is not None:
                 dancer.main_name = main_name
+            if names is not None or main_name is not None:
+                sync_name_entries(dancer)
             if instagram is not None:
                 dancer.instagram = instagram
             if genre is not None:
@@ -107,6 +166,12 @@ class DancerStore:
             if is_verified is not None:
                 dancer.is_verified = is_verified
 
+            # 수업 목록 행에는 대표 이름과 인스타그램이 들어 있음
+            if names is not None or main_name is not None or instagram is not None:
+                await SESSION.flush()
+                await refresh_class_listings(await dancer_class_ids(dancer.dancer_id))
+
+            queue_cache_invalidation(SESSION().info, [dancer_tag(dancer.dancer_id)])
             return dancer
         except Exception as e:
             raise dancer_edit_error(e)
@@ -114,13 +179,13 @@ class DancerStore:
     @transactional
     async def delete_dancer(self, dancer: Dancer) -> None:
         try:
-            dancer_in_session = await SESSION.get(Dancer, dancer.dancer_id)
-            if dancer_in_session is None:
-                dancer = await SESSION.merge(dancer)
-            else:
-                dancer = dancer_in_session
-
-            SESSION.delete(dancer)
+            dancer = await attach(dancer)
+            # 연결 행은 FK CASCADE 로 삭제되므로 지우기 전에 목록 행을 다시 만들 수업을 확인
+            class_ids = await dancer_class_ids(dancer.dancer_id)
+            await SESSION.delete(dancer)
+            await SESSION.flush()
+            await refresh_class_listings(class_ids)
+            queue_cache_invalidation(SESSION().info, [dancer_tag(dancer.dancer_id)])
         except Exception as e:
             raise dancer_delete_error(e)
 
@@ -143,92 +208,223 @@ class DancerStore:
         Returns:
             (성공한 개수, 실패 정보 리스트)
         """
+        return await self._upsert_dancer_batch(dancers_data, start_row=1)
+
+    @transactional
+    async def create_or_update_dancers_stream(
+        self,
+        batches: AsyncIterator[List[Dict[str, Any]]],
+        on_progress: Optional[Callable[[int], Awaitable[None]]] = None
+    ) -> Tuple[int, int, List[Dict[str, Any]]]:
+        """
+        create_or_update_dancers_bulk 와 같은 규칙으로, 고정 크기 배치를 받는 대로 저장 (한 트랜잭션)
+
+        앞선 배치에서 저장한 댄서는 같은 트랜잭션 안에서 다음 배치의 사전 조회에 잡히므로
+        파일 내 instagram 중복은 배치를 넘어서도 같은 댄서로 합쳐진다.
+
+        Args:
+            batches: 업로드 행 배치
+            on_progress: 배치마다 지금까지 처리한 행 수로 호출
+
+        Returns:
+            (전체 행 수, 성공한 개수, 실패 정보 리스트)
+        """
+        total = 0
         success_count = 0
-        errors = []
-        processed_instagrams = {}  # 파일 내 처리한 instagram 추적
-
-        for row_num, dancer_data in enumerate(dancers_data, start=1):
-            try:
-                name = dancer_data.get("name", "").strip()
-                instagram = dancer_data.get("instagram", "").strip() if dancer_data.get("instagram") else None
-
-                # 검증
-                if not name:
-                    errors.append({
-                        "row": row_num,
-                        "name": name,
-                        "instagram": instagram,
-                        "error": "Name is required and cannot be empty"
-                    })
-                    continue
-
-                if len(name) > 20:
-                    errors.append({
-                        "row": row_num,
-                        "name": name,
-                        "instagram": instagram,
-                        "error": "Name exceeds maximum length (20 characters)"
-                    })
-                    continue
-
-                if instagram and len(instagram) > 50:
-                    errors.append({
-                        "row": row_num,
-                        "name": name,
-                        "instagram": instagram,
-                        "error": "Instagram ID exceeds maximum length (50 characters)"
-                    })
-                    continue
-
-                # 추가 필드 추출
-                genre = dancer_data.get("genre", "").strip() if dancer_data.get("genre") else None
-
-                # instagram 기반 처리
-                if instagram:
-                    # 파일 내에서 이미 처리한 instagram인지 확인
-                    if instagram in processed_instagrams:
-                        # 같은 dancer에 이름 추가
-                        existing_dancer = processed_instagrams[instagram]
-                        if name not in existing_dancer.names:
-                            existing_dancer.names = existing_dancer.names + [name]
-                    else:
-                        # DB에서 조회
-                        existing_dancer = await SESSION.scalar(
-                            select(Dancer).where(Dancer.instagram == instagram)
-                        )
-                        if existing_dancer:
-                            # 기존 댄서에 이름 추가
-                            if name not in existing_dancer.names:
-                                existing_dancer.names = existing_dancer.names + [name]
-                            processed_instagrams[instagram] = existing_dancer
-                        else:
-                            # 새 댄서 생성
-                            new_dancer = Dancer(
-                                main_name=name,
-                                names=[name],
-                                instagram=instagram,
-                                genre=Genre(genre) if genre else None
-                            )
-                            SESSION.add(new_dancer)
-                            processed_instagrams[instagram] = new_dancer
-                else:
-                    # instagram 없이 생성
-                    new_dancer = Dancer(
-                        main_name=name,
-                        names=[name],
-                        instagram=None,
-                        genre=Genre(genre) if genre else None
-                    )
-                    SESSION.add(new_dancer)
-
-                success_count += 1
-
-            except Exception as e:
-                errors.append({
-                    "row": row_num,
-                    "name": dancer_data.get("name", ""),
-                    "instagram": dancer_data.get("instagram", ""),
-                    "error": str(e)
-                })
-
-        return success_count, errors
\ No newline at end of file
+        errors: List[Dict[str, Any]] = []
+        async for batch in batches:
+            batch_success, batch_errors = await self._upsert_dancer_batch(batch, start_row=total + 1)
+            total += len(batch)
+            success_count += batch_success
+            errors.extend(batch_errors)
+            if on_progress is not None:
+                await on_progress(total)
+        return total, success_count, errors
+
+    async def _upsert_dancer_batch(
+        self,
+        dancers_data: List[Dict[str, Any]],
+        start_row: int
+    ) -> Tuple[int, List[Dict[str, Any]]]:
+        """
+        행마다 조회하지 않고, 참조된 instagram 을 청크 단위 IN 쿼리로 미리 읽어와
+        메모리에서 병합한 뒤 INSERT ... ON DUPLICATE KEY UPDATE (SQLite 는 ON CONFLICT) 로 청크 단위 저장
+        (호출하는 쪽의 트랜잭션 안에서 실행)
+        """
+        # 1. 행 단위 검증 (결과는 행 순서대로 보관해 오류 보고 순서를 유지)
+        validated = [
+            validate_bulk_row(row_num, dancer_data)
+            for row_num, dancer_data in enumerate(dancers_data, start=start_row)
+        ]
+
+        # 2. 참조된 instagram 의 기존 댄서를 청크 단위로 미리 조회 (MySQL 기본 collation 처럼 대소문자 무시)
+        instagrams = list({row.instagram for row in validated if isinstance(row, BulkDancerRow) and row.instagram})
+        existing: Dict[str, DancerUpsertPlan] = {}
+        for chunk in chunked(instagrams, BULK_CHUNK_SIZE):
+            result = await SESSION.execute(
+                select(Dancer.dancer_id, Dancer.main_name, Dancer.names, Dancer.instagram, Dancer.genre)
+                .where(Dancer.instagram.in_(chunk))
+            )
+            for found in result.all():
+                existing[found.instagram.casefold()] = DancerUpsertPlan(
+                    dancer_id=found.dancer_id,
+                    main_name=found.main_name,
+                    names=list(found.names),
+                    instagram=found.instagram,
+                    genre=found.genre,
+                    is_new=False
+                )
+
+        # 3. 메모리에서 병합
+        success_count, errors, plans = plan_bulk_upsert(validated, dancers_data, existing, start_row)
+
+        # 4. 청크 단위 저장
+        rows = [plan.as_row() for plan in plans if plan.is_new or plan.added_names]
+        upsert = insert_on_conflict(Dancer.__table__, ["dancer_id"], ["names", "updated_at"])
+        for chunk in chunked(rows, BULK_CHUNK_SIZE):
+            await SESSION.execute(upsert, chunk)
+
+        name_rows = [
+            {
+                "dancer_name_id": str(uuid.uuid4()),
+                "dancer_id": plan.dancer_id,
+                "name": name,
+                "normalized_name": normalize_name(name)
+            }
+            for plan in plans
+            for name in plan.added_names
+            if normalize_name(name)
+        ]
+        # (dancer_id, normalized_name) 유니크 키로 이미 있는 이름만 건너뜀 (다른 오류는 그대로 발생)
+        insert_names = insert_on_conflict(DancerName.__table__, ["dancer_id", "normalized_name"])
+        for chunk in chunked(name_rows, BULK_CHUNK_SIZE):
+            await SESSION.execute(insert_names, chunk)
+
+        queue_search_index_updates(
+            SESSION().info,
+            (dancer_entry(p.dancer_id, p.main_name, p.names, p.instagram) for p in plans if p.is_new or p.added_names)
+        )
+        queue_cache_invalidation(
+            SESSION().info,
+            (dancer_tag(p.dancer_id) for p in plans if not p.is_new and p.added_names)
+        )
+        return success_count, errors
+
+
+# ======================== BULK UPSERT HELPERS ========================
+
+BULK_CHUNK_SIZE = 1000
+
+@dataclass
+class BulkDancerRow:
+    """검증을 통과한 업로드 행"""
+    name: str
+    instagram: Optional[str]
+    genre: Optional[str]
+
+
+@dataclass
+class DancerUpsertPlan:
+    """업로드 결과로 저장할 댄서 한 명 (신규 또는 기존 댄서에 이름 추가)"""
+    dancer_id: str
+    main_name: str
+    names: List[str]
+    instagram: Optional[str]
+    genre: Optional[Genre]
+    is_new: bool
+    added_names: List[str] = field(default_factory=list)
+
+    def add_name(self, name: str) -> None:
+        if name not in self.names:
+            self.names.append(name)
+            self.added_names.append(name)
+
+    def as_row(self) -> Dict[str, Any]:
+        return {
+            "dancer_id": self.dancer_id,
+            "main_name": self.main_name,
+            "names": self.names,
+            "instagram": self.instagram,
+            "genre": self.genre,
+            "is_verified": False,  # 기존 댄서는 names 만 갱신되므로 무시됨
+        }
+
+    @staticmethod
+    def new(name: str, instagram: Optional[str], genre: Optional[str]) -> "DancerUpsertPlan":
+        return DancerUpsertPlan(
+            dancer_id=str(uuid.uuid4()),
+            main_name=name,
+            names=[name],
+            instagram=instagram,
+            genre=Genre(genre) if genre else None,
+            is_new=True,
+            added_names=[name]
+        )
+
+
+def _row_error(row_num: int, name: Any, instagram: Any, error: str) -> Dict[str, Any]:
+    return {"row": row_num, "name": name, "instagram": instagram, "error": error}
+
+
+def validate_bulk_row(row_num: int, dancer_data: Dict[str, Any]) -> BulkDancerRow | Dict[str, Any]:
+    """업로드 한 행을 검증해 BulkDancerRow 또는 오류 정보를 반환"""
+    try:
+        name = dancer_data.get("name", "").strip()
+        instagram = dancer_data.get("instagram", "").strip() if dancer_data.get("instagram") else None
+
+        if not name:
+            return _row_error(row_num, name, instagram, "Name is required and cannot be empty")
+        if len(name) > 20:
+            return _row_error(row_num, name, instagram, "Name exceeds maximum length (20 characters)")
+        if instagram and len(instagram) > 50:
+            return _row_error(row_num, name, instagram, "Instagram ID exceeds maximum length (50 characters)")
+
+        genre = dancer_data.get("genre", "").strip() if dancer_data.get("genre") else None
+        return BulkDancerRow(name=name, instagram=instagram, genre=genre)
+    except Exception as e:
+        return _row_error(row_num, dancer_data.get("name", ""), dancer_data.get("instagram", ""), str(e))
+
+
+def plan_bulk_upsert(
+    validated: List[BulkDancerRow | Dict[str, Any]],
+    dancers_data: List[Dict[str, Any]],
+    existing: Dict[str, DancerUpsertPlan],
+    start_row: int = 1
+) -> Tuple[int, List[Dict[str, Any]], List[DancerUpsertPlan]]:
+    """검증된 행을 순서대로 병합 (DB 접근 없음)
+
+    Args:
+        existing: 미리 조회한 기존 댄서 (casefold 한 instagram -> plan)
+        start_row: dancers_data[0] 의 파일 내 행 번호
+
+    Returns:
+        (성공한 개수, 실패 정보 리스트, 저장 대상 plan 목록)
+    """
+    success_count = 0
+    errors: List[Dict[str, Any]] = []
+    plans: List[DancerUpsertPlan] = []
+    by_instagram: Dict[str, DancerUpsertPlan] = {}  # 파일 내 처리한 instagram 추적
+
+    for row_num, row in enumerate(validated, start=start_row):
+        if not isinstance(row, BulkDancerRow):
+            errors.append(row)
+            continue
+        try:
+            if row.instagram:
+                key = row.instagram.casefold()
+                plan = by_instagram.get(key) or existing.get(key)
+                if plan is None:
+                    plan = DancerUpsertPlan.new(row.name, row.instagram, row.genre)
+                    plans.append(plan)
+                elif key not in by_instagram:
+                    plans.append(plan)
+                plan.add_name(row.name)
+                by_instagram[key] = plan
+            else:
+                plans.append(DancerUpsertPlan.new(row.name, None, row.genre))
+            success_count += 1
+        except Exception as e:
+            dancer_data = dancers_data[row_num - start_row]
+            errors.append(_row_error(row_num, dancer_data.get("name", ""), dancer_data.get("instagram", ""), str(e)))
+
+    return success_count, errors, plans
@@ -1,11 +1,20 @@
-from fastapi import APIRouter, File, UploadFile, HTTPException
+from fastapi import APIRouter, File, UploadFile, HTTPException, Request, Response
 from typing import Annotated
 from fastapi import Depends
 
+from server.common.batch import MAX_BATCH_IDS, BatchGetRequest
+from server.common.etag import is_not_modified, not_modified_response, set_etag
 from server.features.dancer.service import DancerService
+from server.features.dancer.jobs import DancerBulkUploadJobService
 from server.features.dancer.dto.requests import *
-from server.features.dancer.dto.responses import DancerResponse, DancerBulkUploadResponse
-from starlette.status import HTTP_200_OK, HTTP_204_NO_CONTENT
+from server.features.dancer.dto.responses import (
+    DancerResponse,
+    DancerBatchResponse,
+    DancerBulkUploadResponse,
+    DancerBulkUploadJobResponse,
+    DancerBulkUploadJobStatusResponse
+)
+from starlette.status import HTTP_200_OK, HTTP_202_ACCEPTED, HTTP_204_NO_CONTENT
 
 dancer_router = APIRouter()
 
@@ -21,49 +30,100 @@ async def create_dancer(
     """댄서 생성 엔드포인트"""
     return await dancer_service.create_dancer(dancer_request)
 
-@dancer_router.post("/bulk-upload", status_code=HTTP_200_OK,
+@dancer_router.post("/bulk-upload", status_code=HTTP_202_ACCEPTED,
                       summary="댄서 대량 업로드",
-                      description="CSV 파일로 여러 댄서를 한 번에 생성/업데이트합니다.")
+                      description="CSV 파일로 여러 댄서를 한 번에 생성/업데이트하는 백그라운드 작업을 등록합니다. "
+                                  "반환된 job_id 로 진행 상황과 결과를 조회합니다.")
 async def bulk_upload_dancers(
-    dancer_service: Annotated[DancerService, Depends()],
+    job_service: Annotated[DancerBulkUploadJobService, Depends()],
     file: UploadFile = File(...)
+) -> DancerBulkUploadJobResponse:
+    """CSV 파일로 댄서 대량 업로드 (작업 등록)"""
+    return await job_service.submit(file)
+
+@dancer_router.get("/bulk-upload/{job_id}", status_code=HTTP_200_OK,
+                     summary="댄서 대량 업로드 상태 조회",
+                     description="대량 업로드 작업의 상태와 처리한 행 수를 조회합니다.")
+async def get_bulk_upload_status(
+    job_service: Annotated[DancerBulkUploadJobService, Depends()],
+    job_id: str
+) -> DancerBulkUploadJobStatusResponse:
+    """대량 업로드 작업 상태 조회"""
+    return await job_service.get_status(job_id)
+
+@dancer_router.get("/bulk-upload/{job_id}/report", status_code=HTTP_200_OK,
+                     summary="댄서 대량 업로드 결과 조회",
+                     description="완료된 대량 업로드 작업의 결과(행별 오류 포함)를 조회합니다.")
+async def get_bulk_upload_report(
+    job_service: Annotated[DancerBulkUploadJobService, Depends()],
+    job_id: str
 ) -> DancerBulkUploadResponse:
-    """CSV 파일로 댄서 대량 업로드"""
-    return await dancer_service.bulk_upload_dancers(file)
+    """대량 업로드 작업 결과 조회"""
+    return await job_service.get_report(job_id)
 
 # ======================== READ ========================
 
+@dancer_router.post("/batch", status_code=HTTP_200_OK,
+                    summary="댄서 일괄 조회",
+                    description=f"댄서 ID 목록(최대 {MAX_BATCH_IDS}개)으로 여러 댄서를 한 번에 조회합니다. "
+                                "결과는 요청 순서이며, 없는 ID 는 missing 으로 반환합니다.")
+async def get_dancers_by_ids(
+    dancer_service: Annotated[DancerService, Depends()],
+    batch_request: BatchGetRequest
+) -> DancerBatchResponse:
+    """댄서 일괄 조회"""
+    return await dancer_service.get_dancers_by_ids(batch_request.ids)
+
 @dancer_router.get("/{dancer_id}", status_code=HTTP_200_OK,
+                     response_model=DancerResponse,
                      summary="댄서 조회",
-                     description="댄서 ID로 댄서 정보를 조회합니다.")
+                     description="댄서 ID로 댄서 정보를 조회합니다. "
+                                 "ETag 를 반환하며 If-None-Match 가 일치하면 304 를 반환합니다.")
 async def get_dancer_by_id(
     dancer_service: Annotated[DancerService, Depends()],
+    request: Request,
+    response: Response,
     dancer_id: str
-) -> DancerResponse:
+) -> DancerResponse | Response:
     """댄서 ID로 조회"""
-    dancer = await dancer_service.get_dancer_by_id(dancer_id)
-    if dancer is None:
+    etag = await dancer_service.get_dancer_etag(dancer_id)
+    if etag is not None and is_not_modified(request, etag):
+        return not_modified_response(etag)
+    dancer = await dancer_service.get_dancer_response(dancer_id, version=etag) if etag is not None else None
+    if etag is None or dancer is None:
         raise HTTPException(
             status_code=404,
             detail={"message": "댄서를 찾을 수 없습니다."}
         )
-    return DancerResponse.from_dancer(dancer)
+    set_etag(response, etag)
+    return dancer
 
 @dancer_router.get("/instagram/{instagram}", status_code=HTTP_200_OK,
+                     response_model=DancerResponse,
                      summary="댄서 조회 (인스타그램)",
-                     description="인스타그램 아이디로 댄서 정보를 조회합니다.")
+                     description="인스타그램 아이디로 댄서 정보를 조회합니다. "
+                                 "ETag 를 반환하며 If-None-Match 가 일치하면 304 를 반환합니다.")
 async def get_dancer_by_instagram(
     dancer_service: Annotated[DancerService, Depends()],
+    request: Request,
+    response: Response,
     instagram: str
-) -> DancerResponse:
+) -> DancerResponse | Response:
     """인스타그램 아이디로 조회"""
-    dancer = await dancer_service.get_dancer_by_instagram(instagram)
+    found = await dancer_service.get_dancer_etag_by_instagram(instagram)
+    dancer = None
+    if found is not None:
+        dancer_id, etag = found
+        if is_not_modified(request, etag):
+            return not_modified_response(etag)
+        dancer = await dancer_service.get_dancer_response(dancer_id, version=etag)
     if dancer is None:
         raise HTTPException(
             status_code=404,
             detail={"message": "댄서를 찾을 수 없습니다."}
         )
-    return DancerResponse.from_dancer(dancer)
+    set_etag(response, etag)
+    return dancer
 
 # ======================== UPDATE ========================
 
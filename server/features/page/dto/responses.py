@@ -0,0 +1,20 @@
+from pydantic import BaseModel
+from typing import List, Optional
+
+from server.features.dance_class.dto.responses import ClassDetailResponse
+from server.features.dancer.dto.responses import DancerResponse
+from server.features.studio.dto.responses import StudioResponse
+
+
+class StudioPageResponse(BaseModel):
+    """스튜디오 상세 페이지 묶음 (스튜디오 정보 + 수업 목록 한 페이지)"""
+    studio: StudioResponse
+    classes: List[ClassDetailResponse]
+    next_cursor: Optional[str]  # 다음 수업 페이지 커서 (/class/studio/{id} 의 cursor 로 사용)
+
+
+class DancerPageResponse(BaseModel):
+    """댄서 상세 페이지 묶음 (댄서 정보 + 수업 목록 한 페이지)"""
+    dancer: DancerResponse
+    classes: List[ClassDetailResponse]
+    next_cursor: Optional[str]  # 다음 수업 페이지 커서 (/class/dancer/{id} 의 cursor 로 사용)
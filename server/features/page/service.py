@@ -0,0 +1,109 @@
+from fastapi import Depends
+from datetime import datetime
+from typing import Annotated, Any, Optional, Tuple
+
+from pydantic import BaseModel
+
+from server.common.etag import make_etag
+from server.common.fast_json import encode_json
+from server.database.connection import gather_in_new_sessions
+from server.features.dance_class.service import ClassService
+from server.features.dancer.service import DancerService
+from server.features.studio.service import StudioService
+
+# (프로필 ETag, 수업 목록 ETag) - 각 응답 캐시의 version 으로도 사용
+PageVersions = Tuple[str, str]
+
+
+class PageService:
+    """상세 페이지 묶음 조회
+
+    ETag 용 버전 확인은 요청 세션에서 차례로 하고 (가벼운 인덱스 조회 두 번),
+    본문은 프로필을 요청 세션, 수업 목록을 새 세션 하나에서 동시에 읽는다 - 요청당 커넥션 최대 2개.
+    기존 상세/목록 응답 캐시를 그대로 재사용한다 (같은 행을 두 번 읽지 않음).
+    """
+
+    def __init__(
+        self,
+        studio_service: Annotated[StudioService, Depends()],
+        dancer_service: Annotated[DancerService, Depends()],
+        class_service: Annotated[ClassService, Depends()]
+    ):
+        self.studio_service = studio_service
+        self.dancer_service = dancer_service
+        self.class_service = class_service
+
+    # ======================== STUDIO ========================
+
+    async def get_studio_page_versions(self, studio_id: str) -> PageVersions | None:
+        """스튜디오 / 수업 목록 ETag (없는 스튜디오면 None)"""
+        studio_etag = await self.studio_service.get_studio_etag(studio_id)
+        if studio_etag is None:
+            return None
+        classes_etag = await self.class_service.get_class_list_etag("class:studio", studio_id=studio_id)
+        return studio_etag, classes_etag
+
+    async def get_studio_page(
+        self,
+        studio_id: str,
+        versions: PageVersions,
+        date_from: Optional[datetime] = None,
+        date_to: Optional[datetime] = None,
+        cursor: Optional[str] = None,
+        limit: Optional[int] = None
+    ) -> bytes | None:
+        """StudioPageResponse 모양의 JSON (그 사이 스튜디오가 삭제되었으면 None)"""
+        studio_etag, classes_etag = versions
+        studio, (classes, next_cursor) = await gather_in_new_sessions(
+            lambda: self.studio_service.get_studio_response(studio_id, version=studio_etag),
+            lambda: self.class_service.get_class_page_by_studio(
+                studio_id, date_from=date_from, date_to=date_to, cursor=cursor, limit=limit, version=classes_etag
+            ),
+            reuse_current=True
+        )
+        return _encode_page("studio", studio, classes, next_cursor) if studio is not None else None
+
+    # ======================== DANCER ========================
+
+    async def get_dancer_page_versions(self, dancer_id: str) -> PageVersions | None:
+        """댄서 / 수업 목록 ETag (없는 댄서면 None)"""
+        dancer_etag = await self.dancer_service.get_dancer_etag(dancer_id)
+        if dancer_etag is None:
+            return None
+        classes_etag = await self.class_service.get_class_list_etag("class:dancer", dancer_id=dancer_id)
+        return dancer_etag, classes_etag
+
+    async def get_dancer_page(
+        self,
+        dancer_id: str,
+        versions: PageVersions,
+        date_from: Optional[datetime] = None,
+        date_to: Optional[datetime] = None,
+        cursor: Optional[str] = None,
+        limit: Optional[int] = None
+    ) -> bytes | None:
+        """DancerPageResponse 모양의 JSON (그 사이 댄서가 삭제되었으면 None)"""
+        dancer_etag, classes_etag = versions
+        dancer, (classes, next_cursor) = await gather_in_new_sessions(
+            lambda: self.dancer_service.get_dancer_response(dancer_id, version=dancer_etag),
+            lambda: self.class_service.get_class_page_by_dancer(
+                dancer_id, date_from=date_from, date_to=date_to, cursor=cursor, limit=limit, version=classes_etag
+            ),
+            reuse_current=True
+        )
+        return _encode_page("dancer", dancer, classes, next_cursor) if dancer is not None else None
+
+
+def page_etag(kind: str, versions: PageVersions, *query: Any) -> str:
+    """프로필과 수업 목록 중 하나라도 바뀌면 달라지는 페이지 ETag (query: 수업 목록 기간/커서/페이지 크기)"""
+    return make_etag(kind, *versions, *query)
+
+
+def _encode_page(key: str, profile: BaseModel, classes: bytes, next_cursor: Optional[str]) -> bytes:
+    """이미 인코딩된 수업 목록 JSON 을 다시 파싱하지 않고 그대로 이어 붙임"""
+    return b"".join([
+        b'{"', key.encode(), b'":', encode_json(profile.model_dump(mode="json")),
+        b',"classes":', classes,
+        b',"next_cursor":', encode_json(next_cursor),
+        b"}"
+    ])
@@ -0,0 +1,82 @@
+from fastapi import APIRouter, Query, HTTPException, Depends, Request, Response
+from datetime import datetime
+from typing import Annotated, Optional
+from starlette.status import HTTP_200_OK
+
+from server.common.etag import is_not_modified, not_modified_response, set_etag
+from server.common.fast_json import RawJSONResponse
+from server.features.dance_class.views import MAX_CLASS_PAGE_SIZE
+from server.features.page.service import PageService, page_etag
+from server.features.page.dto.responses import StudioPageResponse, DancerPageResponse
+
+page_router = APIRouter()
+
+# ======================== READ ========================
+
+@page_router.get("/studio/{studio_id}/page", status_code=HTTP_200_OK,
+                 response_model=StudioPageResponse,
+                 summary="스튜디오 상세 페이지 조회",
+                 description="스튜디오 정보와 수업 목록(/class/studio/{id} 와 같은 from/to/limit/cursor)을 한 번에 조회합니다. "
+                             "다음 수업 페이지 커서는 next_cursor 로 반환합니다. "
+                             "ETag 를 반환하며 If-None-Match 가 일치하면 304 를 반환합니다.")
+async def get_studio_page(
+    page_service: Annotated[PageService, Depends()],
+    request: Request,
+    studio_id: str,
+    date_from: Optional[datetime] = Query(None, alias="from", description="수업 조회 시작 시각 (포함, ISO8601)"),
+    date_to: Optional[datetime] = Query(None, alias="to", description="수업 조회 종료 시각 (미포함, ISO8601)"),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor 값"),
+    limit: Optional[int] = Query(None, ge=1, le=MAX_CLASS_PAGE_SIZE, description="수업 페이지 크기")
+) -> Response:
+    """스튜디오 상세 페이지 묶음 조회 (응답 JSON 은 서비스에서 직접 인코딩)"""
+    versions = await page_service.get_studio_page_versions(studio_id)
+    body = None
+    if versions is not None:
+        etag = page_etag("studio:page", versions, date_from, date_to, cursor, limit)
+        if is_not_modified(request, etag):
+            return not_modified_response(etag)
+        body = await page_service.get_studio_page(
+            studio_id, versions, date_from=date_from, date_to=date_to, cursor=cursor, limit=limit
+        )
+    if body is None:
+        raise HTTPException(
+            status_code=404,
+            detail={"message": "스튜디오를 찾을 수 없습니다."}
+        )
+    response = RawJSONResponse(body)
+    set_etag(response, etag)
+    return response
+
+@page_router.get("/dancer/{dancer_id}/page", status_code=HTTP_200_OK,
+                 response_model=DancerPageResponse,
+                 summary="댄서 상세 페이지 조회",
+                 description="댄서 정보와 수업 목록(/class/dancer/{id} 와 같은 from/to/limit/cursor)을 한 번에 조회합니다. "
+                             "다음 수업 페이지 커서는 next_cursor 로 반환합니다. "
+                             "ETag 를 반환하며 If-None-Match 가 일치하면 304 를 반환합니다.")
+async def get_dancer_page(
+    page_service: Annotated[PageService, Depends()],
+    request: Request,
+    dancer_id: str,
+    date_from: Optional[datetime] = Query(None, alias="from", description="수업 조회 시작 시각 (포함, ISO8601)"),
+    date_to: Optional[datetime] = Query(None, alias="to", description="수업 조회 종료 시각 (미포함, ISO8601)"),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor 값"),
+    limit: Optional[int] = Query(None, ge=1, le=MAX_CLASS_PAGE_SIZE, description="수업 페이지 크기")
+) -> Response:
+    """댄서 상세 페이지 묶음 조회 (응답 JSON 은 서비스에서 직접 인코딩)"""
+    versions = await page_service.get_dancer_page_versions(dancer_id)
+    body = None
+    if versions is not None:
+        etag = page_etag("dancer:page", versions, date_from, date_to, cursor, limit)
+        if is_not_modified(request, etag):
+            return not_modified_response(etag)
+        body = await page_service.get_dancer_page(
+            dancer_id, versions, date_from=date_from, date_to=date_to, cursor=cursor, limit=limit
+        )
+    if body is None:
+        raise HTTPException(
+            status_code=404,
+            detail={"message": "댄서를 찾을 수 없습니다."}
+        )
+    response = RawJSONResponse(body)
+    set_etag(response, etag)
+    return response
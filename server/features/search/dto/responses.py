@@ -13,3 +13,4 @@ class SearchResultItem(BaseModel):
 class SearchResponse(BaseModel):
     """통합 검색 결과"""
     results: List[SearchResultItem]
+    total: int  # limit/offset 적용 전 전체 결과 개수
@@ -0,0 +1,315 @@
+import asyncio
+import logging
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from server.common.utils import normalize_name as normalize
+from server.features.studio.models import Studio
+from server.features.dancer.models import Dancer
+
+logger = logging.getLogger(__name__)
+
+# (type, id) - type 은 "STUDIO" 또는 "DANCER"
+EntryKey = Tuple[str, str]
+
+# 한글 초성 (호환 자모, 유니코드 음절 순서)
+CHOSUNG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+CHOSUNG_SET = frozenset(CHOSUNG)
+HANGUL_START = 0xAC00
+HANGUL_END = 0xD7A3
+SYLLABLES_PER_CHOSUNG = 21 * 28
+
+# 한두 글자 검색어처럼 후보가 많은 결과를 재사용하기 위한 검색어별 캐시 크기
+RESULT_CACHE_SIZE = 1024
+
+# 다른 워커 프로세스에서 발생한 변경을 반영하기 위한 전체 재구축 주기
+INDEX_REFRESH_INTERVAL_SECONDS = 300
+
+# 검색 결과 정렬 순위 (SearchStore 와 동일, SQL 대체 경로에는 부분 일치가 없음)
+RANK_EXACT = 0
+RANK_PREFIX = 1
+RANK_INFIX = 2
+
+
+def to_chosung(text: str) -> str:
+    """한글 음절을 초성으로 치환 (그 외 문자는 그대로)"""
+    chars = []
+    for ch in text:
+        code = ord(ch)
+        if HANGUL_START <= code <= HANGUL_END:
+            chars.append(CHOSUNG[(code - HANGUL_START) // SYLLABLES_PER_CHOSUNG])
+        else:
+            chars.append(ch)
+    return "".join(chars)
+
+
+def is_chosung_query(text: str) -> bool:
+    """공백을 제외한 모든 글자가 초성인 검색어인지 ("ㄱㅁㅈ" 등)"""
+    letters = [ch for ch in text if not ch.isspace()]
+    return bool(letters) and all(ch in CHOSUNG_SET for ch in letters)
+
+
+def _grams(term: str) -> Set[str]:
+    """부분 일치 후보 검색용 1-gram + 2-gram"""
+    return set(term) | {term[i:i + 2] for i in range(len(term) - 1)}
+
+
+@dataclass(frozen=True)
+class SearchEntry:
+    id: str
+    name: str
+    type: str
+    instagram: Optional[str]
+    terms: Tuple[str, ...]       # 정규화된 검색 대상 (이름, 별칭, 인스타그램)
+    chosungs: Tuple[str, ...]    # terms 의 초성 변환본
+
+    @property
+    def key(self) -> EntryKey:
+        return (self.type, self.id)
+
+    @staticmethod
+    def build(id: str, name: str, type: str, instagram: Optional[str], names: Iterable[str]) -> "SearchEntry":
+        terms = tuple(dict.fromkeys(
+            normalize(t) for t in [name, *names, instagram or ""] if t and normalize(t)
+        ))
+        return SearchEntry(
+            id=id,
+            name=name,
+            type=type,
+            instagram=instagram,
+            terms=terms,
+            chosungs=tuple(dict.fromkeys(to_chosung(t) for t in terms))
+        )
+
+
+class _TermIndex:
+    """n-gram 역색인 (gram -> 해당 gram 을 포함하는 항목들)"""
+
+    def __init__(self) -> None:
+        self.postings: Dict[str, Set[EntryKey]] = {}
+
+    def add(self, key: EntryKey, terms: Iterable[str]) -> None:
+        for term in terms:
+            for gram in _grams(term):
+                self.postings.setdefault(gram, set()).add(key)
+
+    def remove(self, key: EntryKey, terms: Iterable[str]) -> None:
+        for term in terms:
+            for gram in _grams(term):
+                keys = self.postings.get(gram)
+                if keys is not None:
+                    keys.discard(key)
+                    if not keys:
+                        del self.postings[gram]
+
+    def candidates(self, query: str) -> Set[EntryKey]:
+        """query 를 부분 문자열로 포함할 수 있는 후보 (gram 교집합, 최종 확인은 호출자가)"""
+        grams = sorted(_grams(query), key=lambda g: len(self.postings.get(g, ())))
+        if not grams:
+            return set()
+        result = set(self.postings.get(grams[0], ()))
+        for gram in grams[1:]:
+            if not result:
+                break
+            result &= self.postings.get(gram, set())
+        return result
+
+
+class SearchIndex:
+    """검색어 자동완성용 인메모리 색인 (스튜디오 이름/인스타그램, 댄서 이름/별칭/인스타그램)
+
+    - 시작 시 rebuild 로 전체 구축, 이후 ORM 커밋 이벤트로 변경분만 반영
+    - 워커 프로세스마다 따로 존재하므로 주기적으로 전체 재구축
+    - 재구축 중(load_entries 대기 중)에 커밋된 변경분은 따로 모았다가 새 색인에 다시 반영
+    - is_warm 이 False 이면 호출자는 SQL 검색으로 대체
+    """
+
+    def __init__(self) -> None:
+        self.entries: Dict[EntryKey, SearchEntry] = {}
+        self.text_index = _TermIndex()
+        self.chosung_index = _TermIndex()
+        self.is_warm = False
+        # 정규화된 검색어 -> 정렬된 전체 결과 (색인이 바뀌면 비움)
+        self.result_cache: "OrderedDict[str, List[SearchEntry]]" = OrderedDict()
+        # 진행 중인 rebuild 마다 그동안 커밋된 변경분 (None 이면 삭제)
+        self._rebuild_changes: List[Dict[EntryKey, Optional[SearchEntry]]] = []
+
+    # ======================== BUILD / UPDATE ========================
+
+    async def rebuild(self, load_entries: Callable[[], Awaitable[Iterable[SearchEntry]]]) -> None:
+        """load_entries 로 전체 색인을 다시 구성
+
+        조회 결과는 load_entries 시작 시점 기준이라, 기다리는 동안 커밋된 변경분을 모아 두었다가
+        교체 직전에 새 색인에 덮어씀 (이미 반영된 변경이 다시 적용되어도 결과는 같음)
+        """
+        changes: Dict[EntryKey, Optional[SearchEntry]] = {}
+        self._rebuild_changes.append(changes)
+        try:
+            entries = await load_entries()
+        finally:
+            self._rebuild_changes = [c for c in self._rebuild_changes if c is not changes]
+        self.load(entries, changes)
+
+    def load(
+        self,
+        entries: Iterable[SearchEntry],
+        changes: Optional[Dict[EntryKey, Optional[SearchEntry]]] = None
+    ) -> None:
+        """전체 색인을 새로 구성해 교체 (changes 는 entries 이후에 커밋된 변경분)"""
+        fresh = SearchIndex()
+        for entry in entries:
+            fresh.upsert(entry)
+        fresh.apply(changes or {})
+        self.entries = fresh.entries
+        self.text_index = fresh.text_index
+        self.chosung_index = fresh.chosung_index
+        self.result_cache.clear()
+        self.is_warm = True
+
+    def apply(self, changes: Dict[EntryKey, Optional[SearchEntry]]) -> None:
+        """커밋된 변경분 반영 - 진행 중인 rebuild 가 있으면 교체 후 다시 반영하도록 함께 기록"""
+        for log in self._rebuild_changes:
+            log.update(changes)
+        for key, entry in changes.items():
+            if entry is None:
+                self.remove(key)
+            else:
+                self.upsert(entry)
+
+    def upsert(self, entry: SearchEntry) -> None:
+        self.remove(entry.key)
+        self.result_cache.clear()
+        self.entries[entry.key] = entry
+        self.text_index.add(entry.key, entry.terms)
+        self.chosung_index.add(entry.key, entry.chosungs)
+
+    def remove(self, key: EntryKey) -> None:
+        entry = self.entries.pop(key, None)
+        if entry is None:
+            return
+        self.result_cache.clear()
+        self.text_index.remove(key, entry.terms)
+        self.chosung_index.remove(key, entry.chosungs)
+
+    # ======================== SEARCH ========================
+
+    def search(
+        self,
+        keyword: str,
+        limit: int,
+        offset: int = 0
+    ) -> Tuple[List[Tuple[str, str, str, Optional[str]]], int]:
+        """정확 일치 > 전방 일치 > 부분 일치 순으로 검색 (SearchStore.search 와 같은 반환 형식)"""
+        query = normalize(keyword)
+        if not query:
+            return [], 0
+        ranked = self.result_cache.get(query)
+        if ranked is None:
+            ranked = self._ranked_entries(query)
+            self.result_cache[query] = ranked
+            if len(self.result_cache) > RESULT_CACHE_SIZE:
+                self.result_cache.popitem(last=False)
+        else:
+            self.result_cache.move_to_end(query)
+
+        page = ranked[offset:offset + limit]
+        return [(e.id, e.name, e.type, e.instagram) for e in page], len(ranked)
+
+    def _ranked_entries(self, query: str) -> List[SearchEntry]:
+        chosung = is_chosung_query(query)
+        term_index = self.chosung_index if chosung else self.text_index
+
+        ranked: List[Tuple[int, str, str, SearchEntry]] = []
+        for key in term_index.candidates(query):
+            entry = self.entries[key]
+            rank = self._rank(query, entry.chosungs if chosung else entry.terms)
+            if rank is not None:
+                ranked.append((rank, entry.name, entry.id, entry))
+        ranked.sort(key=lambda r: r[:3])
+        return [entry for _, _, _, entry in ranked]
+
+    @staticmethod
+    def _rank(query: str, terms: Tuple[str, ...]) -> Optional[int]:
+        best = None
+        for term in terms:
+            if term == query:
+                return RANK_EXACT
+            if term.startswith(query):
+                best = RANK_PREFIX
+            elif best is None and query in term:
+                best = RANK_INFIX
+        return best
+
+
+SEARCH_INDEX = SearchIndex()
+
+
+def studio_entry(studio_id: str, name: str, instagram: Optional[str]) -> SearchEntry:
+    return SearchEntry.build(id=studio_id, name=name, type="STUDIO", instagram=instagram, names=())
+
+
+def dancer_entry(dancer_id: str, main_name: str, names: Iterable[str], instagram: Optional[str]) -> SearchEntry:
+    return SearchEntry.build(id=dancer_id, name=main_name, type="DANCER", instagram=instagram, names=names)
+
+
+async def refresh_search_index_periodically(
+    load_entries: Callable[[], Awaitable[Iterable[SearchEntry]]]
+) -> None:
+    """INDEX_REFRESH_INTERVAL_SECONDS 마다 전체 재구축 (lifespan 에서 백그라운드 태스크로 실행)"""
+    while True:
+        try:
+            await SEARCH_INDEX.rebuild(load_entries)
+        except Exception:
+            logger.exception("search index rebuild failed")
+        await asyncio.sleep(INDEX_REFRESH_INTERVAL_SECONDS)
+
+
+# ======================== ORM EVENT HOOKS ========================
+# 스토어의 create/edit/delete 가 커밋되면 변경된 스튜디오/댄서만 색인에 반영
+
+_PENDING_KEY = "search_index_pending"
+
+
+def _snapshot(obj: Any) -> Optional[SearchEntry]:
+    if isinstance(obj, Studio):
+        return studio_entry(obj.studio_id, obj.name, obj.instagram)
+    if isinstance(obj, Dancer):
+        return dancer_entry(obj.dancer_id, obj.main_name, obj.names or (), obj.instagram)
+    return None
+
+
+def queue_search_index_updates(session_info: Dict[str, Any], entries: Iterable[SearchEntry]) -> None:
+    """ORM flush 를 거치지 않는 쓰기(Core 일괄 INSERT 등)의 변경분을 커밋 시 반영하도록 등록"""
+    pending: Dict[EntryKey, Optional[SearchEntry]] = session_info.setdefault(_PENDING_KEY, {})
+    for entry in entries:
+        pending[entry.key] = entry
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_search_index_changes(session: Session, flush_context: Any) -> None:
+    pending: Dict[EntryKey, Optional[SearchEntry]] = session.info.setdefault(_PENDING_KEY, {})
+    for obj in list(session.new) + list(session.dirty):
+        entry = _snapshot(obj)
+        if entry is not None:
+            pending[entry.key] = entry
+    for obj in session.deleted:
+        entry = _snapshot(obj)
+        if entry is not None:
+            pending[entry.key] = None
+
+
+@event.listens_for(Session, "after_commit")
+def _apply_search_index_changes(session: Session) -> None:
+    # 색인이 아직 준비되지 않았어도 버리지 않음 - 진행 중인 첫 rebuild 가 교체 후 다시 반영
+    pending = session.info.pop(_PENDING_KEY, None)
+    if pending:
+        SEARCH_INDEX.apply(pending)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_search_index_changes(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
@@ -1,6 +1,7 @@
 from fastapi import Depends
 from typing import Annotated
 
+from server.features.search.index import SEARCH_INDEX
 from server.features.search.store import SearchStore
 from server.features.search.dto.responses import SearchResponse, SearchResultItem
 
@@ -9,13 +10,20 @@ class SearchService:
     def __init__(self, search_db_store: Annotated[SearchStore, Depends()]):
         self.search_db_store = search_db_store
 
-    async def search(self, keyword: str) -> SearchResponse:
-        """통합 검색"""
-        results = await self.search_db_store.search(keyword)
+    async def search(self, keyword: str, limit: int, offset: int = 0) -> SearchResponse:
+        """통합 검색 (정확 일치 > 전방 일치 > 부분 일치 순)
+
+        인메모리 색인이 준비되어 있으면 DB 접근 없이 색인에서, 아니면 SQL 로 검색 (인덱스로 찾을 수 있는 전방 일치까지만)
+        """
+        if SEARCH_INDEX.is_warm:
+            results, total = SEARCH_INDEX.search(keyword, limit=limit, offset=offset)
+        else:
+            results, total = await self.search_db_store.search(keyword, limit=limit, offset=offset)
 
         return SearchResponse(
             results=[
                 SearchResultItem(id=id, name=name, type=type, instagram=instagram)
                 for id, name, type, instagram in results
-            ]
+            ],
+            total=total
         )
@@ -1,30 +1,121 @@
+from sqlalchemy import Row, case, func, literal, or_, union_all
 from sqlalchemy.sql import select
-from typing import List, Tuple, Optional
+from typing import List, Sequence, Tuple, Optional
 
+from server.common.utils import normalize_name
 from server.database.connection import SESSION
+from server.database.annotation import transactional
 from server.features.studio.models import Studio
-from server.features.dancer.models import Dancer
+from server.features.dancer.models import Dancer, DancerName
+from server.features.search.index import SearchEntry, studio_entry, dancer_entry
+
+# 검색 결과 정렬 순위 (낮을수록 우선) - 부분 일치(2)는 인메모리 색인에서만
+RANK_EXACT = 0
+RANK_PREFIX = 1
 
 
 class SearchStore:
     def __init__(self) -> None:
         self.session = SESSION
 
-    async def search(self, keyword: str) -> List[Tuple[str, str, str, Optional[str]]]:
-        """스튜디오와 댄서를 검색 (ID, 이름, type, instagram 반환)"""
-        # 스튜디오: ID, name, instagram SELECT
+    @transactional
+    async def get_index_entries(self) -> List[SearchEntry]:
+        """인메모리 검색 색인 구축용 전체 스튜디오/댄서 (필요한 컬럼만 조회)
+
+        백그라운드 태스크에서 호출되므로 @transactional 로 독립된 세션을 사용
+        """
         studio_result = await self.session.execute(
             select(Studio.studio_id, Studio.name, Studio.instagram)
-            .where(Studio.name.like(f"{keyword}%"))
         )
-        studios = [(row.studio_id, row.name, "STUDIO", row.instagram) for row in studio_result.all()]
-
-        # 댄서: ID, main_name, instagram SELECT
         dancer_result = await self.session.execute(
-            select(Dancer.dancer_id, Dancer.main_name, Dancer.instagram)
-            .where(Dancer.main_name.like(f"{keyword}%"))
+            select(Dancer.dancer_id, Dancer.main_name, Dancer.names, Dancer.instagram)
         )
-        dancers = [(row.dancer_id, row.main_name, "DANCER", row.instagram) for row in dancer_result.all()]
+        return [
+            studio_entry(row.studio_id, row.name, row.instagram) for row in studio_result.all()
+        ] + [
+            dancer_entry(row.dancer_id, row.main_name, row.names or [], row.instagram)
+            for row in dancer_result.all()
+        ]
+
+    async def search(
+        self,
+        keyword: str,
+        limit: int,
+        offset: int = 0
+    ) -> Tuple[List[Tuple[str, str, str, Optional[str]]], int]:
+        """스튜디오와 댄서를 한 번의 쿼리(UNION ALL)로 전방 일치 검색 - 인메모리 색인이 준비되기 전의 대체 경로
+
+        모든 조건이 인덱스 컬럼의 LIKE 'kw%' 범위 조회가 되도록 전방 일치만 지원한다 (부분 일치/초성은 색인에서).
+        스튜디오 이름/인스타그램, 댄서 이름/별칭(dancer_names.normalized_name)/인스타그램을 대상으로
+        정확 일치 > 전방 일치 순으로 정렬하고, 전체 개수는 윈도우 함수로 함께 계산
+
+        Returns:
+            ([(ID, 이름, type, instagram), ...], 전체 결과 개수)
+        """
+        normalized = normalize_name(keyword)
+        if not normalized:
+            return [], 0
 
-        # 통합 반환
-        return studios + dancers
+        # name / instagram 각각의 unique 인덱스 범위 조회 (OR 는 index merge)
+        studio_query = select(
+            Studio.studio_id.label("id"),
+            Studio.name.label("name"),
+            literal("STUDIO").label("type"),
+            Studio.instagram.label("instagram"),
+            case(
+                (or_(Studio.name == keyword, Studio.instagram == keyword), RANK_EXACT),
+                else_=RANK_PREFIX
+            ).label("rank")
+        ).where(
+            or_(
+                Studio.name.startswith(keyword, autoescape=True),
+                Studio.instagram.startswith(keyword, autoescape=True)
+            )
+        )
+
+        # 대표 이름/별칭은 dancer_names 인덱스로 (대표 이름도 함께 색인됨), 인스타그램은 dancers 인덱스로 찾은 뒤 댄서별 가장 좋은 순위만
+        dancer_matches = union_all(
+            select(
+                DancerName.dancer_id.label("dancer_id"),
+                case((DancerName.normalized_name == normalized, RANK_EXACT), else_=RANK_PREFIX).label("rank")
+            ).where(DancerName.normalized_name.startswith(normalized, autoescape=True)),
+            select(
+                Dancer.dancer_id.label("dancer_id"),
+                case((Dancer.instagram == keyword, RANK_EXACT), else_=RANK_PREFIX).label("rank")
+            ).where(Dancer.instagram.startswith(keyword, autoescape=True))
+        ).subquery()
+        dancer_ranks = (
+            select(dancer_matches.c.dancer_id, func.min(dancer_matches.c.rank).label("rank"))
+            .group_by(dancer_matches.c.dancer_id)
+            .subquery()
+        )
+        dancer_query = select(
+            Dancer.dancer_id.label("id"),
+            Dancer.main_name.label("name"),
+            literal("DANCER").label("type"),
+            Dancer.instagram.label("instagram"),
+            dancer_ranks.c.rank
+        ).join(dancer_ranks, dancer_ranks.c.dancer_id == Dancer.dancer_id)
+
+        matches = union_all(studio_query, dancer_query).subquery()
+        result = await self.session.execute(
+            select(
+                matches.c.id,
+                matches.c.name,
+                matches.c.type,
+                matches.c.instagram,
+                func.count().over().label("total")
+            )
+            .order_by(matches.c.rank, matches.c.name, matches.c.id)
+            .limit(limit)
+            .offset(offset)
+        )
+        rows: Sequence[Row] = result.all()
+        if rows:
+            total = rows[0].total
+        elif offset > 0:
+            # offset 이 결과 범위를 벗어나면 윈도우 함수 값을 받을 행이 없으므로 개수만 따로 조회
+            total = await self.session.scalar(select(func.count()).select_from(matches)) or 0
+        else:
+            total = 0
+        return [(row.id, row.name, row.type, row.instagram) for row in rows], total
@@ -11,10 +11,14 @@ search_router = APIRouter()
 
 @search_router.get("/", status_code=HTTP_200_OK,
                    summary="통합 검색",
-                   description="스튜디오와 댄서를 통합 검색합니다 (전방 일치).")
+                   description="스튜디오(이름/인스타그램)와 댄서(이름/별칭/인스타그램)를 통합 검색합니다. "
+                               "정확 일치, 전방 일치, 부분 일치 순으로 정렬됩니다. "
+                               "서버 시작 직후 검색 색인이 준비되기 전에는 전방 일치까지만 반환합니다.")
 async def search(
     search_service: Annotated[SearchService, Depends()],
-    keyword: str = Query(..., description="검색어", min_length=1)
+    keyword: str = Query(..., description="검색어", min_length=1),
+    limit: int = Query(20, ge=1, le=100, description="최대 결과 개수"),
+    offset: int = Query(0, ge=0, description="건너뛸 결과 개수")
 ) -> SearchResponse:
     """통합 검색 엔드포인트"""
-    return await search_service.search(keyword)
+    return await search_service.search(keyword, limit=limit, offset=offset)
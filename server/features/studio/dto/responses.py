@@ -1,5 +1,6 @@
 from pydantic import BaseModel
-from typing import Optional
+from sqlalchemy import Row
+from typing import Any, Dict, List, Optional
 
 from server.features.studio.models import Studio
 
@@ -36,6 +37,45 @@ class StudioListItem(BaseModel):
             reservation_form=studio.reservation_form
         )
 
+    @staticmethod
+    def from_row(row: Row) -> "StudioListItem":
+        """컬럼 projection 결과(Row)로부터 생성 (ORM 객체 불필요)"""
+        return StudioListItem(**StudioListItem.dict_from_row(row))
+
+    @staticmethod
+    def dict_from_row(row: Row) -> Dict[str, Any]:
+        """컬럼 projection 결과(Row)로 같은 모양의 dict 생성 (빠른 JSON 경로용, 모델 생성/검증 없음)"""
+        return {
+            "studio_id": row.studio_id,
+            "name": row.name,
+            "instagram": row.instagram,
+            "station": row.station,
+            "city": row.city,
+            "district": row.district,
+            "is_verified": row.is_verified,
+            "lat": float(row.lat) if row.lat is not None else None,
+            "lng": float(row.lng) if row.lng is not None else None,
+            "location": row.location,
+            "youtube": row.youtube,
+            "reservation_form": row.reservation_form
+        }
+
+
+class StudioBatchResponse(BaseModel):
+    """스튜디오 일괄 조회 결과 (요청 순서, 목록/카드 뷰 필드)"""
+    results: List[StudioListItem]
+    missing: List[str]  # 찾지 못한 studio_id
+
+
+class StudioDistanceItem(StudioListItem):
+    """위치 기반 조회 결과 - 기준 좌표(내 위치 / 지도 중심)와의 거리 포함"""
+    distance_m: float
+
+    @staticmethod
+    def from_distance_row(row: Row, distance_m: float) -> "StudioDistanceItem":
+        """from_row 와 같은 컬럼 projection 결과 + 계산한 거리(m)"""
+        return StudioDistanceItem(**StudioListItem.dict_from_row(row), distance_m=round(distance_m, 1))
+
 
 class StudioResponse(BaseModel):
     studio_id: str
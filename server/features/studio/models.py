@@ -1,8 +1,8 @@
-from server.database.common import Base
+from server.database.common import Base, PreciseDateTime
 
 from sqlalchemy import String, BigInteger, Time, Boolean, ForeignKey, Numeric
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from datetime import time
+from datetime import datetime, time
 from typing import Optional, List, TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -29,6 +29,8 @@ class Studio(Base):
     lat: Mapped[Optional[float]] = mapped_column(Numeric(precision=10, scale=7), nullable=True)
     # 스튜디오 경도
     lng: Mapped[Optional[float]] = mapped_column(Numeric(precision=10, scale=7), nullable=True)
+    # 위경도 geohash (위치 기반 조회용 B-tree 인덱스) - Store 에서 lat/lng 와 함께 갱신
+    geohash: Mapped[Optional[str]] = mapped_column(String(12), nullable=True, index=True)
     # 가까운 역
     station: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
     # 도시
@@ -51,14 +53,21 @@ class Studio(Base):
     youtube: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
     # 스튜디오 소개글
     bio: Mapped[Optional[str]] = mapped_column(String(500), nullable=True)
+    # 마지막 수정 시각 (ETag 워터마크) - ORM UPDATE 시 자동 갱신
+    updated_at: Mapped[datetime] = mapped_column(
+        PreciseDateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow
+    )
 
     # User와의 관계
-    user: Mapped[Optional["User"]] = relationship("User", back_populates="studio", lazy="selectin")
+    user: Mapped[Optional["User"]] = relationship("User", back_populates="studio", lazy="raise")
 
     # Class와의 관계 (one-to-many)
+    # 관계 로딩은 쿼리마다 options(selectinload(...)) 로 명시적으로 요청 (lazy="raise")
+    # 삭제 시에는 FK 의 ON DELETE CASCADE 에 맡겨 수업 목록을 불러오지 않음
     classes: Mapped[List["Class"]] = relationship(
         "Class",
         back_populates="studio",
-        lazy="selectin",
-        cascade="all, delete-orphan"
+        lazy="raise",
+        cascade="all, delete-orphan",
+        passive_deletes=True
     )
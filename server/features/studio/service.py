@@ -1,15 +1,33 @@
 from fastapi import Depends, HTTPException
-from typing import Annotated, List
+from pydantic import TypeAdapter
+from sqlalchemy import Row
+import math
+from typing import Annotated, Any, List, Optional, Sequence, Tuple
 
+from server.cache.cache import RESPONSE_CACHE, STUDIO_LIST_TAG, studio_tag
+from server.common.batch import in_request_order
+from server.common.etag import make_etag
+from server.common.fast_json import encode_json
+from server.common.geo import BoundingBox, box_around
+from server.common.utils import encode_distance_cursor, decode_distance_cursor
 from server.features.studio.models import Studio
 from server.features.studio.dto.requests import (
     StudioCreateRequest,
     StudioEditRequest,
     StudioDeleteRequest
 )
-from server.features.studio.dto.responses import StudioResponse
+from server.features.studio.dto.responses import (
+    StudioResponse,
+    StudioListItem,
+    StudioBatchResponse,
+    StudioDistanceItem
+)
 from server.features.studio.store import StudioStore
 
+# 응답 캐시의 Redis 계층 직렬화용
+STUDIO_RESPONSE_ADAPTER = TypeAdapter(StudioResponse)
+STUDIO_LIST_ADAPTER = TypeAdapter(bytes)
+
 
 class StudioService:
     def __init__(self, studio_db_store: Annotated[StudioStore, Depends()]):
@@ -98,6 +116,86 @@ class StudioService:
         """인스타그램 아이디로 조회"""
         return await self.studio_db_store.get_studio_by_instagram(instagram)
 
-    async def get_all_studios(self) -> List[Studio]:
-        """전체 스튜디오 목록 조회"""
-        return await self.studio_db_store.get_all_studios()
+    async def get_studio_etag(self, studio_id: str) -> str | None:
+        """스튜디오 상세 ETag (없는 스튜디오면 None)"""
+        updated_at = await self.studio_db_store.get_studio_version(studio_id)
+        return make_etag("studio", studio_id, updated_at) if updated_at is not None else None
+
+    async def get_studio_etag_by_instagram(self, instagram: str) -> Tuple[str, str] | None:
+        """인스타그램 아이디로 (studio_id, ETag) 조회"""
+        row = await self.studio_db_store.get_studio_version_by_instagram(instagram)
+        return (row.studio_id, make_etag("studio", row.studio_id, row.updated_at)) if row is not None else None
+
+    async def get_studio_list_etag(self, *query: Any) -> str:
+        """스튜디오 목록 ETag (query: 위치 기반 조회의 좌표/범위/커서 등 - 조건이 다른 응답끼리 같은 ETag 를 갖지 않게)"""
+        row = await self.studio_db_store.get_studio_list_version()
+        return make_etag("studio:list", row.updated_at, row.count, *query)
+
+    async def get_studio_response(self, studio_id: str, version: str = "") -> StudioResponse | None:
+        """스튜디오 ID로 조회 (응답 캐시 사용, version(ETag)이 바뀌면 다른 캐시 항목)"""
+        async def load() -> StudioResponse | None:
+            studio = await self.studio_db_store.get_studio_by_id(studio_id)
+            return StudioResponse.from_studio(studio) if studio is not None else None
+
+        return await RESPONSE_CACHE.get_or_load(
+            f"studio:{studio_id}:{version}", STUDIO_RESPONSE_ADAPTER, load, tags=[studio_tag(studio_id)]
+        )
+
+    async def get_studio_list(self, version: str = "") -> bytes:
+        """목록/카드 뷰용 경량 스튜디오 목록 조회 - List[StudioListItem] 모양의 JSON (응답 캐시 사용)"""
+        async def load() -> bytes:
+            rows = await self.studio_db_store.get_studio_list_rows()
+            return encode_json([StudioListItem.dict_from_row(row) for row in rows])
+
+        return await RESPONSE_CACHE.get_or_load(
+            f"studio:list:{version}", STUDIO_LIST_ADAPTER, load, tags=[STUDIO_LIST_TAG]
+        )
+
+    async def get_studios_by_ids(self, studio_ids: List[str]) -> StudioBatchResponse:
+        """여러 스튜디오 일괄 조회 (요청 순서, 없는 ID 는 missing 으로)"""
+        rows = await self.studio_db_store.get_studio_list_rows_by_ids(studio_ids)
+        results, missing = in_request_order(studio_ids, {row.studio_id: StudioListItem.from_row(row) for row in rows})
+        return StudioBatchResponse(results=results, missing=missing)
+
+    # ======================== LOCATION ========================
+
+    async def get_nearby_studios(
+        self,
+        lat: float,
+        lng: float,
+        radius_m: float,
+        cursor: Optional[str] = None,
+        limit: int = 50
+    ) -> Tuple[List[StudioDistanceItem], Optional[str]]:
+        """(lat, lng) 반경 radius_m 안의 스튜디오를 가까운 순으로 조회 (목록, 다음 페이지 커서)"""
+        rows = await self.studio_db_store.get_studio_list_rows_by_distance(
+            box_around(lat, lng, radius_m), lat, lng,
+            max_distance_m=radius_m,
+            after=decode_distance_cursor(cursor) if cursor else None,
+            limit=limit + 1
+        )
+        return self._distance_page(rows, limit)
+
+    async def get_studios_in_bounds(
+        self,
+        box: BoundingBox,
+        cursor: Optional[str] = None,
+        limit: int = 50
+    ) -> Tuple[List[StudioDistanceItem], Optional[str]]:
+        """지도 영역 안의 스튜디오를 영역 중심에서 가까운 순으로 조회 (목록, 다음 페이지 커서)"""
+        center_lat, center_lng = box.center
+        rows = await self.studio_db_store.get_studio_list_rows_by_distance(
+            box, center_lat, center_lng,
+            after=decode_distance_cursor(cursor) if cursor else None,
+            limit=limit + 1
+        )
+        return self._distance_page(rows, limit)
+
+    @staticmethod
+    def _distance_page(rows: Sequence[Row], limit: int) -> Tuple[List[StudioDistanceItem], Optional[str]]:
+        """limit + 1 개를 조회한 결과로 다음 페이지 커서 생성 (커서는 SQL 정렬 키 (distance_sq, studio_id))"""
+        page = rows[:limit]
+        next_cursor = None
+        if len(rows) > limit:
+            next_cursor = encode_distance_cursor(page[-1].distance_sq, page[-1].studio_id)
+        return [StudioDistanceItem.from_distance_row(row, math.sqrt(row.distance_sq)) for row in page], next_cursor
@@ -1,13 +1,46 @@
+from sqlalchemy import Float, Row, and_, func, or_, type_coerce
 from sqlalchemy.sql import select
-from datetime import time as time_type
-from typing import Optional, List
+from datetime import datetime, time as time_type
+from typing import Optional, List, Sequence, Tuple
 
-from server.database.connection import SESSION
+from server.cache.cache import STUDIO_LIST_TAG, queue_cache_invalidation, studio_tag
+from server.common.geo import METERS_PER_DEGREE, BoundingBox, geohash_cover, longitude_scale, studio_geohash
+from server.database.connection import SESSION, attach
 from server.database.annotation import transactional
+from server.features.dance_class.listing import update_studio_class_listings
 from server.features.studio.models import Studio
 from server.features.studio.errors import studio_creation_error, studio_edit_error, studio_delete_error
 
 
+# 목록/카드 뷰(StudioListItem)에 필요한 컬럼만 조회하기 위한 projection
+STUDIO_LIST_COLUMNS = (
+    Studio.studio_id,
+    Studio.name,
+    Studio.instagram,
+    Studio.station,
+    Studio.city,
+    Studio.district,
+    Studio.is_verified,
+    Studio.lat,
+    Studio.lng,
+    Studio.location,
+    Studio.youtube,
+    Studio.reservation_form,
+)
+
+
+def _distance_sq(lat: float, lng: float):
+    """(lat, lng) 까지의 제곱 거리(m²) SQL 식
+
+    기준 위도에서의 평면 근사 (반경 수십 km 안에서 오차 1% 미만) - 삼각함수 없이 사칙연산만 쓰므로
+    MySQL/SQLite 가 같은 값으로 정렬하고, 같은 식으로 다시 계산한 값과 커서를 비교할 수 있다.
+    """
+    dy = (Studio.lat - lat) * METERS_PER_DEGREE
+    dx = (Studio.lng - lng) * (METERS_PER_DEGREE * longitude_scale(lat))
+    # lat/lng 는 DECIMAL 이므로 결과를 float 로
+    return type_coerce(dy * dy + dx * dx, Float)
+
+
 class StudioStore:
     def __init__(self) -> None:
         self.session = SESSION
@@ -32,12 +65,77 @@ class StudioStore:
             select(Studio).where(Studio.instagram == instagram)
         )
 
-    async def get_all_studios(self) -> List[Studio]:
-        """전체 스튜디오 목록 조회"""
-        result = await self.session.scalars(
-            select(Studio).execution_options(populate_existing=True)
+    async def get_studio_list_rows(self) -> Sequence[Row]:
+        """목록/카드 뷰용 경량 조회 (컬럼 projection, 관계 로딩 및 ORM 객체 생성 없음)"""
+        result = await self.session.execute(select(*STUDIO_LIST_COLUMNS))
+        return result.all()
+
+    async def get_studio_list_rows_by_ids(self, studio_ids: List[str]) -> Sequence[Row]:
+        """여러 스튜디오를 한 번의 IN 조회로 (목록 컬럼 projection, 순서 보장 없음)"""
+        result = await self.session.execute(
+            select(*STUDIO_LIST_COLUMNS).where(Studio.studio_id.in_(studio_ids))
         )
-        return list(result.all())
+        return result.all()
+
+    async def get_studio_list_rows_by_distance(
+        self,
+        box: BoundingBox,
+        lat: float,
+        lng: float,
+        max_distance_m: Optional[float] = None,
+        after: Optional[Tuple[float, str]] = None,
+        limit: Optional[int] = None
+    ) -> Sequence[Row]:
+        """box 안의 스튜디오를 (lat, lng) 에서 가까운 순으로 (목록 컬럼 + distance_sq)
+
+        geohash 셀 prefix 로 인덱스 범위 조회한 뒤 위경도로 정확히 거르고,
+        반경 / (distance_sq, studio_id) 키셋 커서 / 정렬 / limit 까지 SQL 에서 처리한다 (후보 전체를 읽지 않음).
+        """
+        distance_sq = _distance_sq(lat, lng)
+        query = select(*STUDIO_LIST_COLUMNS, distance_sq.label("distance_sq")).where(
+            Studio.lat.between(box.south, box.north),
+            Studio.lng.between(box.west, box.east)
+        )
+        prefixes = geohash_cover(box)
+        if prefixes:
+            query = query.where(or_(*(Studio.geohash.like(f"{prefix}%") for prefix in prefixes)))
+        if max_distance_m is not None:
+            query = query.where(distance_sq <= max_distance_m ** 2)
+        if after is not None:
+            after_distance_sq, after_studio_id = after
+            query = query.where(
+                or_(
+                    distance_sq > after_distance_sq,
+                    and_(distance_sq == after_distance_sq, Studio.studio_id > after_studio_id)
+                )
+            )
+        query = query.order_by(distance_sq, Studio.studio_id)
+        if limit is not None:
+            query = query.limit(limit)
+        result = await self.session.execute(query)
+        return result.all()
+
+    # ======================== VERSION (ETag) ========================
+
+    async def get_studio_version(self, studio_id: str) -> datetime | None:
+        """스튜디오의 updated_at (없으면 None)"""
+        return await self.session.scalar(
+            select(Studio.updated_at).where(Studio.studio_id == studio_id)
+        )
+
+    async def get_studio_version_by_instagram(self, instagram: str) -> Row | None:
+        """인스타그램 아이디로 (studio_id, updated_at) 조회"""
+        result = await self.session.execute(
+            select(Studio.studio_id, Studio.updated_at).where(Studio.instagram == instagram)
+        )
+        return result.first()
+
+    async def get_studio_list_version(self) -> Row:
+        """스튜디오 목록 워터마크 (최근 updated_at, 개수 - 삭제도 반영되도록)"""
+        result = await self.session.execute(
+            select(func.max(Studio.updated_at).label("updated_at"), func.count().label("count"))
+        )
+        return result.one()
 
     # ======================== WRITE OPERATIONS ========================
 
@@ -75,6 +173,7 @@ class StudioStore:
                 location=location,
                 lat=lat,
                 lng=lng,
+                geohash=studio_geohash(lat, lng),
                 station=station,
                 city=city,
                 district=district,
@@ -88,6 +187,7 @@ class StudioStore:
                 user_id=user_id
             )
             SESSION.add(studio)
+            queue_cache_invalidation(SESSION().info, [STUDIO_LIST_TAG])
             return studio
         except Exception as e:
             raise studio_creation_error(e)
@@ -115,12 +215,8 @@ class StudioStore:
     ) -> Studio:
         """스튜디오 정보 수정"""
         try:
-            # Ensure studio is in session
-            studio_in_session = await SESSION.get(Studio, studio.studio_id)
-            if studio_in_session is None:
-                studio = await SESSION.merge(studio)
-            else:
-                studio = studio_in_session
+            # 요청 세션에서 읽은 객체면 추가 조회 없이 그대로 사용
+            studio = await attach(studio)
 
             # Update fields if provided
             if name is not None:
@@ -133,6 +229,8 @@ class StudioStore:
                 studio.lat = lat
             if lng is not None:
                 studio.lng = lng
+            if lat is not None or lng is not None:
+                studio.geohash = studio_geohash(studio.lat, studio.lng)
             if station is not None:
                 studio.station = station
             if city is not None:
@@ -157,6 +255,11 @@ class StudioStore:
             if is_verified is not None:
                 studio.is_verified = is_verified
 
+            # 수업 목록 행에는 스튜디오 이름과 인스타그램이 들어 있음
+            if name is not None or instagram is not None:
+                await update_studio_class_listings(studio.studio_id, studio.name, studio.instagram)
+
+            queue_cache_invalidation(SESSION().info, [studio_tag(studio.studio_id), STUDIO_LIST_TAG])
             return studio
         except Exception as e:
             raise studio_edit_error(e)
@@ -165,13 +268,11 @@ class StudioStore:
     async def delete_studio(self, studio: Studio) -> None:
         """스튜디오 삭제"""
         try:
-            # Ensure studio is in session
-            studio_in_session = await SESSION.get(Studio, studio.studio_id)
-            if studio_in_session is None:
-                studio = await SESSION.merge(studio)
-            else:
-                studio = studio_in_session
-
-            SESSION.delete(studio)
+            # 요청 세션에서 읽은 객체면 추가 조회 없이 그대로 사용
+            studio = await attach(studio)
+
+            await SESSION.delete(studio)
+            # 스튜디오 태그는 해당 스튜디오의 수업 목록 캐시에도 붙어 있음 (FK CASCADE 로 함께 삭제)
+            queue_cache_invalidation(SESSION().info, [studio_tag(studio.studio_id), STUDIO_LIST_TAG])
         except Exception as e:
             raise studio_delete_error(e)
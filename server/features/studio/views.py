@@ -1,18 +1,32 @@
-from fastapi import APIRouter, HTTPException, Depends
-from typing import Annotated, List
+from fastapi import APIRouter, HTTPException, Depends, Query, Request, Response
+from typing import Annotated, List, Optional, Tuple
 from starlette.status import HTTP_200_OK, HTTP_204_NO_CONTENT
 
+from server.common.batch import MAX_BATCH_IDS, BatchGetRequest
+from server.common.errors import invalid_field_format_error
+from server.common.etag import is_not_modified, not_modified_response, set_etag
+from server.common.fast_json import RawJSONResponse
+from server.common.geo import BoundingBox
 from server.features.studio.service import StudioService
 from server.features.studio.dto.requests import (
     StudioCreateRequest,
     StudioEditRequest,
     StudioDeleteRequest
 )
-from server.features.studio.dto.responses import StudioResponse, StudioListItem
+from server.features.studio.dto.responses import (
+    StudioResponse,
+    StudioListItem,
+    StudioBatchResponse,
+    StudioDistanceItem
+)
 
 
 studio_router = APIRouter()
 
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+MAX_NEARBY_RADIUS_M = 50_000
+MAX_LOCATION_PAGE_SIZE = 500
+
 
 # ======================== CREATE ========================
 
@@ -30,48 +44,159 @@ async def create_studio(
 # ======================== READ ========================
 
 @studio_router.get("/list", status_code=HTTP_200_OK,
+                   response_model=List[StudioListItem],
                    summary="스튜디오 목록 조회 (경량)",
-                   description="경량화된 스튜디오 목록을 조회합니다 (카드/목록 뷰용).")
+                   description="경량화된 스튜디오 목록을 조회합니다 (카드/목록 뷰용). "
+                               "ETag 를 반환하며 If-None-Match 가 일치하면 304 를 반환합니다.")
 async def get_studios_list(
-    studio_service: Annotated[StudioService, Depends()]
-) -> List[StudioListItem]:
-    """전체 스튜디오 목록 조회 - 경량 버전"""
-    studios = await studio_service.get_all_studios()
-    return [StudioListItem.from_studio(s) for s in studios]
+    studio_service: Annotated[StudioService, Depends()],
+    request: Request
+) -> Response:
+    """전체 스튜디오 목록 조회 - 경량 버전 (응답 JSON 은 서비스에서 직접 인코딩)"""
+    etag = await studio_service.get_studio_list_etag()
+    if is_not_modified(request, etag):
+        return not_modified_response(etag)
+    response = RawJSONResponse(await studio_service.get_studio_list(version=etag))
+    set_etag(response, etag)
+    return response
+
+
+@studio_router.post("/batch", status_code=HTTP_200_OK,
+                    summary="스튜디오 일괄 조회",
+                    description=f"스튜디오 ID 목록(최대 {MAX_BATCH_IDS}개)으로 여러 스튜디오를 한 번에 조회합니다 (목록/카드 뷰 필드). "
+                                "결과는 요청 순서이며, 없는 ID 는 missing 으로 반환합니다.")
+async def get_studios_by_ids(
+    studio_service: Annotated[StudioService, Depends()],
+    batch_request: BatchGetRequest
+) -> StudioBatchResponse:
+    """스튜디오 일괄 조회"""
+    return await studio_service.get_studios_by_ids(batch_request.ids)
+
+
+@studio_router.get("/nearby", status_code=HTTP_200_OK,
+                   response_model=List[StudioDistanceItem],
+                   summary="주변 스튜디오 조회",
+                   description="(lat, lng) 에서 반경 radius 미터 안의 스튜디오를 가까운 순으로 조회합니다. "
+                               "limit/cursor 로 페이지를 나누며, 다음 페이지가 있으면 X-Next-Cursor 헤더로 커서를 반환합니다. "
+                               "ETag 를 반환하며 If-None-Match 가 일치하면 304 를 반환합니다.")
+async def get_nearby_studios(
+    studio_service: Annotated[StudioService, Depends()],
+    request: Request,
+    response: Response,
+    lat: float = Query(..., ge=-90, le=90, description="위도"),
+    lng: float = Query(..., ge=-180, le=180, description="경도"),
+    radius: float = Query(2000, gt=0, le=MAX_NEARBY_RADIUS_M, description="반경 (미터)"),
+    cursor: Optional[str] = Query(None, description="이전 응답의 X-Next-Cursor 값"),
+    limit: int = Query(50, ge=1, le=MAX_LOCATION_PAGE_SIZE, description="페이지 크기")
+) -> List[StudioDistanceItem] | Response:
+    """주변 스튜디오 조회 (거리순)"""
+    etag = await studio_service.get_studio_list_etag("nearby", lat, lng, radius, cursor, limit)
+    if is_not_modified(request, etag):
+        return not_modified_response(etag)
+    studios, next_cursor = await studio_service.get_nearby_studios(
+        lat, lng, radius, cursor=cursor, limit=limit
+    )
+    set_etag(response, etag)
+    if next_cursor is not None:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    return studios
+
+
+@studio_router.get("/in-bounds", status_code=HTTP_200_OK,
+                   response_model=List[StudioDistanceItem],
+                   summary="지도 영역 내 스튜디오 조회",
+                   description="남서(sw)~북동(ne) 모서리로 지정한 지도 영역 안의 스튜디오를 영역 중심에서 가까운 순으로 조회합니다. "
+                               "좌표는 \"위도,경도\" 형식이며, 날짜변경선을 넘는 영역은 지원하지 않습니다. "
+                               "limit/cursor 로 페이지를 나누며, 다음 페이지가 있으면 X-Next-Cursor 헤더로 커서를 반환합니다. "
+                               "ETag 를 반환하며 If-None-Match 가 일치하면 304 를 반환합니다.")
+async def get_studios_in_bounds(
+    studio_service: Annotated[StudioService, Depends()],
+    request: Request,
+    response: Response,
+    sw: str = Query(..., description="남서쪽 모서리 \"위도,경도\" (예: 37.4,126.8)"),
+    ne: str = Query(..., description="북동쪽 모서리 \"위도,경도\" (예: 37.7,127.2)"),
+    cursor: Optional[str] = Query(None, description="이전 응답의 X-Next-Cursor 값"),
+    limit: int = Query(200, ge=1, le=MAX_LOCATION_PAGE_SIZE, description="페이지 크기")
+) -> List[StudioDistanceItem] | Response:
+    """지도 영역 내 스튜디오 조회 (영역 중심 기준 거리순)"""
+    south, west = _parse_lat_lng("sw", sw)
+    north, east = _parse_lat_lng("ne", ne)
+    if south > north or west > east:
+        raise invalid_field_format_error("sw 는 ne 보다 남서쪽이어야 합니다.")
+    etag = await studio_service.get_studio_list_etag("in-bounds", south, west, north, east, cursor, limit)
+    if is_not_modified(request, etag):
+        return not_modified_response(etag)
+    studios, next_cursor = await studio_service.get_studios_in_bounds(
+        BoundingBox(south=south, west=west, north=north, east=east), cursor=cursor, limit=limit
+    )
+    set_etag(response, etag)
+    if next_cursor is not None:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    return studios
+
+
+def _parse_lat_lng(field: str, value: str) -> Tuple[float, float]:
+    """\"위도,경도\" 문자열 파싱"""
+    try:
+        lat, lng = (float(part) for part in value.split(","))
+    except ValueError:
+        raise invalid_field_format_error(f"{field} 는 \"위도,경도\" 형식이어야 합니다.")
+    if not (-90 <= lat <= 90 and -180 <= lng <= 180):
+        raise invalid_field_format_error(f"{field} 의 좌표 범위가 올바르지 않습니다.")
+    return lat, lng
 
 
 @studio_router.get("/{studio_id}", status_code=HTTP_200_OK,
+                   response_model=StudioResponse,
                    summary="스튜디오 조회 (ID)",
-                   description="스튜디오 ID로 스튜디오 정보를 조회합니다.")
+                   description="스튜디오 ID로 스튜디오 정보를 조회합니다. "
+                               "ETag 를 반환하며 If-None-Match 가 일치하면 304 를 반환합니다.")
 async def get_studio_by_id(
     studio_service: Annotated[StudioService, Depends()],
+    request: Request,
+    response: Response,
     studio_id: str
-) -> StudioResponse:
+) -> StudioResponse | Response:
     """스튜디오 ID로 조회"""
-    studio = await studio_service.get_studio_by_id(studio_id)
-    if studio is None:
+    etag = await studio_service.get_studio_etag(studio_id)
+    if etag is not None and is_not_modified(request, etag):
+        return not_modified_response(etag)
+    studio = await studio_service.get_studio_response(studio_id, version=etag) if etag is not None else None
+    if etag is None or studio is None:
         raise HTTPException(
             status_code=404,
             detail={"message": "스튜디오를 찾을 수 없습니다."}
         )
-    return StudioResponse.from_studio(studio)
+    set_etag(response, etag)
+    return studio
 
 
 @studio_router.get("/instagram/{instagram}", status_code=HTTP_200_OK,
+                   response_model=StudioResponse,
                    summary="스튜디오 조회 (인스타그램)",
-                   description="인스타그램 아이디로 스튜디오 정보를 조회합니다.")
+                   description="인스타그램 아이디로 스튜디오 정보를 조회합니다. "
+                               "ETag 를 반환하며 If-None-Match 가 일치하면 304 를 반환합니다.")
 async def get_studio_by_instagram(
     studio_service: Annotated[StudioService, Depends()],
+    request: Request,
+    response: Response,
     instagram: str
-) -> StudioResponse:
+) -> StudioResponse | Response:
     """인스타그램 아이디로 조회"""
-    studio = await studio_service.get_studio_by_instagram(instagram)
+    found = await studio_service.get_studio_etag_by_instagram(instagram)
+    studio = None
+    if found is not None:
+        studio_id, etag = found
+        if is_not_modified(request, etag):
+            return not_modified_response(etag)
+        studio = await studio_service.get_studio_response(studio_id, version=etag)
     if studio is None:
         raise HTTPException(
             status_code=404,
             detail={"message": "스튜디오를 찾을 수 없습니다."}
         )
-    return StudioResponse.from_studio(studio)
+    set_etag(response, etag)
+    return studio
 
 
 # ======================== UPDATE ========================
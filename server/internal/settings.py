@@ -0,0 +1,20 @@
+from typing import Optional
+
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+
+class InternalSettings(BaseSettings):
+    # /internal/* (응답 캐시/커넥션 풀 현황) 라우터 등록 여부 - 기본은 등록하지 않음 (404)
+    enabled: bool = False
+    # 설정하면 X-Internal-Token 헤더가 같은 요청만 허용 (비우면 사설망/프록시에서 막는다고 가정)
+    token: Optional[str] = None
+
+    model_config = SettingsConfigDict(
+        case_sensitive=False,
+        env_prefix="INTERNAL_",
+        env_file=".env",
+        extra = "allow"
+    )
+
+
+INTERNAL_SETTINGS = InternalSettings()
@@ -0,0 +1,42 @@
+import secrets
+
+from fastapi import APIRouter, Depends, Header, HTTPException
+from typing import Any, Dict, Optional
+from starlette.status import HTTP_200_OK
+
+from server.cache.cache import RESPONSE_CACHE
+from server.database.connection import DATABASE
+from server.database.pool import pool_snapshot
+from server.internal.settings import INTERNAL_SETTINGS
+
+
+def require_internal_token(x_internal_token: Optional[str] = Header(None)) -> None:
+    """INTERNAL_TOKEN 이 설정되어 있으면 X-Internal-Token 헤더가 같아야 함"""
+    expected = INTERNAL_SETTINGS.token
+    if expected is None:
+        return
+    if x_internal_token is None or not secrets.compare_digest(x_internal_token, expected):
+        raise HTTPException(
+            status_code=403,
+            detail={"message": "내부 엔드포인트 접근 권한이 없습니다."}
+        )
+
+
+# api_router 에서 INTERNAL_ENABLED 일 때만 등록
+internal_router = APIRouter(dependencies=[Depends(require_internal_token)])
+
+
+@internal_router.get("/cache", status_code=HTTP_200_OK,
+                     summary="응답 캐시 통계",
+                     description="현재 프로세스의 응답 캐시 적중/미스 횟수와 항목 수를 조회합니다 (캐시 크기 조정용).")
+async def get_cache_stats() -> Dict[str, Any]:
+    """응답 캐시 통계"""
+    return RESPONSE_CACHE.snapshot()
+
+
+@internal_router.get("/db-pool", status_code=HTTP_200_OK,
+                     summary="DB 커넥션 풀 현황",
+                     description="현재 프로세스의 커넥션 풀 크기, 사용 중/오버플로 커넥션 수, 체크아웃 대기 시간과 타임아웃 횟수를 조회합니다.")
+async def get_db_pool_stats() -> Dict[str, Any]:
+    """DB 커넥션 풀 현황"""
+    return pool_snapshot(DATABASE.engine, DATABASE.replica_engine)
@@ -0,0 +1,19 @@
+from functools import lru_cache
+
+from redis import Redis
+from rq import Queue
+
+from server.jobs.settings import JOB_SETTINGS
+
+# 큐 이름 (워커 실행: rq worker dancer-import --url $JOB_REDIS_URL)
+DANCER_IMPORT_QUEUE = "dancer-import"
+
+
+@lru_cache
+def get_redis() -> Redis:
+    return Redis.from_url(JOB_SETTINGS.redis_url)
+
+
+def get_dancer_import_queue() -> Queue:
+    """FastAPI 의존성 - 테스트에서는 fakeredis 기반 Queue 로 override"""
+    return Queue(DANCER_IMPORT_QUEUE, connection=get_redis())
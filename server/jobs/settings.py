@@ -0,0 +1,22 @@
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+
+class JobSettings(BaseSettings):
+    # RQ 가 사용하는 Redis
+    redis_url: str = "redis://localhost:6379/0"
+    # 업로드 파일을 워커에 넘기기 위해 임시 저장하는 디렉터리 (API 서버와 워커가 함께 접근 가능해야 함)
+    upload_dir: str = "/tmp/oddc-uploads"
+    # 작업 최대 실행 시간 (초)
+    job_timeout: int = 1800
+    # 완료/실패한 작업 결과 보관 시간 (초) - 이 시간 동안 상태/오류 리포트 조회 가능
+    result_ttl: int = 86400
+
+    model_config = SettingsConfigDict(
+        case_sensitive=False,
+        env_prefix="JOB_",
+        env_file=".env",
+        extra = "allow"
+    )
+
+
+JOB_SETTINGS = JobSettings()
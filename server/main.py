@@ -1,21 +1,55 @@
+import asyncio
+from contextlib import asynccontextmanager, suppress
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from server.api import api_router
+from server.cache.cache import RESPONSE_CACHE
+from server.database.connection import DATABASE
+from server.database.middleware import DefaultSessionMiddleware
+from server.database.pool import log_pool_stats_periodically
+from server.database.settings import DB_SETTINGS
+from server.features.search.index import refresh_search_index_periodically
+from server.features.search.store import SearchStore
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # 엔진/커넥션 풀은 import 가 아니라 여기서 생성 (워커 부팅 시 import 단계를 가볍게)
+    DATABASE.start()
+    # 검색 자동완성 색인 구축 (준비 전까지는 SQL 검색으로 대체)
+    background_tasks = [asyncio.create_task(
+        refresh_search_index_periodically(SearchStore().get_index_entries)
+    )]
+    # 커넥션 풀 사용량/대기 시간 주기 로그
+    if DB_SETTINGS.pool_stats_log_interval > 0:
+        background_tasks.append(asyncio.create_task(
+            log_pool_stats_periodically(DATABASE.engine, DB_SETTINGS.pool_stats_log_interval)
+        ))
+    try:
+        yield
+    finally:
+        # 서버가 정상 종료되지 않아도 (lifespan 안의 예외, 시작 실패 등) 태스크/캐시/커넥션 정리
+        for task in background_tasks:
+            task.cancel()
+        for task in background_tasks:
+            with suppress(asyncio.CancelledError):
+                await task
+        await RESPONSE_CACHE.close()
+        await DATABASE.dispose()
 
-# Import models to register them with SQLAlchemy
-import server.features.user.models  # noqa: F401
-import server.features.dancer.models  # noqa: F401
-import server.features.studio.models  # noqa: F401
-import server.features.dance_class.models  # noqa: F401
 
-app = FastAPI()
+app = FastAPI(lifespan=lifespan)
 
+# 요청 단위 세션 - 요청 안의 @transactional 은 이 세션에 합류하고 응답 직전에 한 번 커밋
+app.add_middleware(DefaultSessionMiddleware)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],   # 필요하면 특정 도메인으로 제한 가능
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor", "ETag"],  # 수업 목록 키셋 페이지네이션 커서, 조건부 GET
 )
 
 app.include_router(api_router, prefix="")
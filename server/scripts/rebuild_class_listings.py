@@ -0,0 +1,116 @@
+"""수업 목록 읽기 모델(class_listings) 재구성 스크립트
+
+class_listings 는 수업/댄서/스튜디오를 수정하는 Store 메서드가 같은 트랜잭션에서 갱신하지만,
+DB 를 직접 고쳤거나 갱신 경로 밖에서 원본이 바뀌어 어긋난 경우 원본 테이블로부터 다시 만든다.
+classes 를 class_id 순서로 batch_size 개씩 읽어 행을 다시 만들고 배치마다 커밋한 뒤, 원본이 없는 행을 삭제한다.
+
+    python -m server.scripts.rebuild_class_listings --dry-run
+    python -m server.scripts.rebuild_class_listings --batch-size 1000
+"""
+import argparse
+import asyncio
+from typing import List
+
+from sqlalchemy import delete, func, or_, select
+
+# DB 연결 세션 가져오기
+from server.database.connection import SESSION
+# 모델 가져오기
+from server.features.dance_class.listing import LISTING_CHUNK_SIZE, refresh_class_listings
+from server.features.dance_class.models import Class, ClassListing
+from server.features.studio.models import Studio
+
+
+async def report_drift() -> None:
+    """다시 만들지 않고 어긋난 행 수만 출력 (댄서 목록 JSON 은 비교하지 않음)"""
+    missing = await SESSION.scalar(
+        select(func.count())
+        .select_from(Class)
+        .outerjoin(ClassListing, ClassListing.class_id == Class.class_id)
+        .where(ClassListing.class_id.is_(None))
+    )
+    orphaned = await SESSION.scalar(
+        select(func.count())
+        .select_from(ClassListing)
+        .outerjoin(Class, Class.class_id == ClassListing.class_id)
+        .where(Class.class_id.is_(None))
+    )
+    stale = await SESSION.scalar(
+        select(func.count())
+        .select_from(ClassListing)
+        .join(Class, Class.class_id == ClassListing.class_id)
+        .join(Studio, Studio.studio_id == Class.studio_id)
+        .where(
+            # NULL 끼리는 같은 값으로 비교 (MySQL 에서는 NOT (a <=> b))
+            or_(
+                ClassListing.studio_id != Class.studio_id,
+                ClassListing.class_datetime != Class.class_datetime,
+                ClassListing.timezone != Class.timezone,
+                ClassListing.level != Class.level,
+                ClassListing.genre.is_distinct_from(Class.genre),
+                ClassListing.studio_name != Studio.name,
+                ClassListing.studio_instagram.is_distinct_from(Studio.instagram)
+            )
+        )
+    )
+    print(f"📊 목록 행 없는 수업: {missing}개 / 수업 없는 목록 행: {orphaned}개 / 수업·스튜디오 값이 다른 행: {stale}개")
+
+
+async def rebuild_class_listings(batch_size: int) -> int:
+    """모든 수업의 목록 행을 batch_size 개씩 다시 만들고 배치마다 커밋, 다시 만든 행 수를 반환"""
+    total = await SESSION.scalar(select(func.count()).select_from(Class))
+    rebuilt = 0
+    last_class_id = ""
+    while True:
+        # class_id 키셋으로 다음 배치 (PK 범위 조회)
+        class_ids: List[str] = list((await SESSION.scalars(
+            select(Class.class_id)
+            .where(Class.class_id > last_class_id)
+            .order_by(Class.class_id)
+            .limit(batch_size)
+        )).all())
+        if not class_ids:
+            break
+        rebuilt += await refresh_class_listings(class_ids)
+        await SESSION.commit()
+        last_class_id = class_ids[-1]
+        print(f"  🔁 재구성: {rebuilt}/{total}")
+
+    result = await SESSION.execute(
+        delete(ClassListing)
+        .where(~select(Class.class_id).where(Class.class_id == ClassListing.class_id).exists())
+        .execution_options(synchronize_session=False)
+    )
+    await SESSION.commit()
+    if result.rowcount:
+        print(f"  ❌ 수업 없는 목록 행 삭제: {result.rowcount}개")
+    return rebuilt
+
+
+async def main(dry_run: bool, batch_size: int):
+    print("\n🚀 스크립트 시작...")
+    try:
+        await report_drift()
+        if dry_run:
+            return
+
+        rebuilt = await rebuild_class_listings(batch_size)
+        print("-" * 30)
+        print(f"📊 재구성한 목록 행: {rebuilt}개")
+        await report_drift()
+        print("-" * 30)
+    except Exception as e:
+        print(f"스크립트 에러: {e}")
+        await SESSION.rollback()
+    finally:
+        # 세션 닫기
+        await SESSION.close()
+        print("스크립트 종료")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="수업 목록 읽기 모델 재구성")
+    parser.add_argument("--dry-run", action="store_true", help="다시 만들지 않고 어긋난 행 수만 출력")
+    parser.add_argument("--batch-size", type=int, default=LISTING_CHUNK_SIZE, help="배치당 수업 수")
+    args = parser.parse_args()
+    asyncio.run(main(dry_run=args.dry_run, batch_size=args.batch_size))
@@ -1,85 +1,104 @@
+"""중복 수업 정리 스크립트
+
+중복 판단 기준: 스튜디오ID + 시간 + 장르 + 레벨 (genre 가 NULL 인 수업끼리도 같은 키로 봄)
+그룹마다 class_id 가 가장 작은 수업 하나만 남기고, 나머지는 배치 단위로 삭제/커밋한다.
+(수업-댄서 연결 행은 FK 의 ON DELETE CASCADE 로 함께 삭제)
+
+    python -m server.scripts.remove_duplicate_classes --dry-run
+    python -m server.scripts.remove_duplicate_classes --batch-size 500
+"""
+import argparse
 import asyncio
-from collections import defaultdict
-from sqlalchemy import select, func
+from typing import List
+
+from sqlalchemy import delete, func, select
 
 # DB 연결 세션 가져오기
 from server.database.connection import SESSION
 # 모델 가져오기
 from server.features.dance_class.models import Class
 
-async def remove_duplicate_classes():
-    print("\n🚀 스크립트 시작...")
-    
-    # 1. [팩트 체크] 삭제 전 전체 수업 개수 확인
-    count_query = await SESSION.execute(select(func.count()).select_from(Class))
-    before_count = count_query.scalar()
-    print(f"📊 현재 DB에 저장된 총 수업 개수: {before_count}개")
-
-    # 2. 모든 수업 조회
-    print("...데이터 조회 중...")
-    result = await SESSION.scalars(
-        select(Class).execution_options(populate_existing=True)
+DEFAULT_BATCH_SIZE = 1000
+DRY_RUN_SAMPLE_SIZE = 20
+
+DUPLICATE_KEY = (Class.studio_id, Class.class_datetime, Class.genre, Class.level)
+
+
+def duplicate_class_ids_query():
+    """그룹 내 두 번째 이후 수업의 class_id (윈도 함수, MySQL 8+)"""
+    ranked = (
+        select(
+            Class.class_id,
+            func.row_number().over(partition_by=DUPLICATE_KEY, order_by=Class.class_id).label("rn")
+        )
+        .subquery()
+    )
+    return select(ranked.c.class_id).where(ranked.c.rn > 1).order_by(ranked.c.class_id)
+
+
+async def report_duplicates() -> None:
+    """삭제하지 않고 중복 그룹 현황만 출력 (GROUP BY 집계)"""
+    groups = (
+        select(*DUPLICATE_KEY, func.count().label("class_count"), func.min(Class.class_id).label("keep_id"))
+        .group_by(*DUPLICATE_KEY)
+        .having(func.count() > 1)
+        .subquery()
     )
-    all_classes = list(result.all())
-    
-    # 3. 중복 그룹핑 로직 (기존과 동일)
-    duplicate_groups = defaultdict(list)
-    
-    for dance_class in all_classes:
-        # 중복 판단 기준: 스튜디오ID + 시간 + 장르 + 레벨
-        # (주의: 장르나 레벨이 Enum인 경우 값을 문자열로 변환해서 키로 사용)
-        key = (
-            dance_class.studio_id,
-            dance_class.class_datetime,
-            str(dance_class.genre),
-            str(dance_class.level)
+    summary = (await SESSION.execute(
+        select(func.count(), func.coalesce(func.sum(groups.c.class_count - 1), 0))
+    )).one()
+    print(f"📊 중복 그룹: {summary[0]}개 / 삭제 대상 수업: {summary[1]}개")
+
+    sample = await SESSION.execute(
+        select(groups).order_by(groups.c.class_count.desc()).limit(DRY_RUN_SAMPLE_SIZE)
+    )
+    for row in sample.all():
+        genre = row.genre.value if row.genre else None
+        print(
+            f"  🔎 {row.studio_id} / {row.class_datetime} / {genre} / {row.level.value}"
+            f" - {row.class_count}개 (유지: {row.keep_id})"
         )
-        duplicate_groups[key].append(dance_class)
 
-    # 4. 삭제 대상 선정 및 삭제
+
+async def remove_duplicate_classes(batch_size: int) -> int:
+    """중복 수업을 batch_size 개씩 삭제하고 배치마다 커밋, 삭제한 개수를 반환"""
+    # 삭제 대상 ID 만 한 번에 조회 (ORM 객체/관계는 불러오지 않음)
+    duplicate_ids: List[str] = list((await SESSION.scalars(duplicate_class_ids_query())).all())
+    # 조회용 트랜잭션을 닫아 삭제 배치마다 짧은 트랜잭션으로 처리
+    await SESSION.commit()
+    if not duplicate_ids:
+        return 0
+
     total_deleted = 0
-    
-    for key, classes in duplicate_groups.items():
-        if len(classes) > 1:
-            # 생성일(class_id 등) 순으로 정렬해서 가장 먼저 생긴(혹은 나중) 하나만 남김
-            # 여기서는 리스트의 첫 번째를 남기고 나머지 삭제
-            keep_class = classes[0]
-            to_delete = classes[1:]
-            
-            for class_obj in to_delete:
-                print(f"  ❌ 삭제 대기: ID {class_obj.class_id} / {class_obj.class_datetime}")
-                await SESSION.delete(class_obj)
-                total_deleted += 1
-
-    if total_deleted == 0:
-        print("\n✨ 삭제할 중복 수업이 없습니다.")
-        return
-
-    print(f"\n총 {total_deleted}개의 중복 수업을 삭제 목록에 올렸습니다.")
-
-    # 5. [핵심] 강제 커밋 (이게 없어서 아까 실패한 것임)
+    for i in range(0, len(duplicate_ids), batch_size):
+        batch = duplicate_ids[i:i + batch_size]
+        result = await SESSION.execute(delete(Class).where(Class.class_id.in_(batch)))
+        await SESSION.commit()
+        total_deleted += result.rowcount
+        print(f"  ❌ 삭제: {total_deleted}/{len(duplicate_ids)}")
+    return total_deleted
+
+
+async def main(dry_run: bool, batch_size: int):
+    print("\n🚀 스크립트 시작...")
     try:
-        print("💾 DB 저장(Commit) 중... 잠시만 기다리세요...")
-        await SESSION.commit()  # <--- 여기서 진짜로 지워집니다!
-        print("✅ DB 저장 완료!")
-    except Exception as e:
-        print(f"💥 저장 중 에러 발생: {e}")
-        await SESSION.rollback()
-        return
+        before_count = await SESSION.scalar(select(func.count()).select_from(Class))
+        print(f"📊 현재 DB에 저장된 총 수업 개수: {before_count}개")
 
-    # 6. 결과 확인
-    count_query_after = await SESSION.execute(select(func.count()).select_from(Class))
-    after_count = count_query_after.scalar()
-    
-    print("-" * 30)
-    print(f"📊 삭제 전 개수: {before_count}")
-    print(f"📉 삭제 후 개수: {after_count}")
-    print("-" * 30)
+        if dry_run:
+            await report_duplicates()
+            return
 
+        total_deleted = await remove_duplicate_classes(batch_size)
+        if total_deleted == 0:
+            print("\n✨ 삭제할 중복 수업이 없습니다.")
+            return
 
-async def main():
-    try:
-        await remove_duplicate_classes()
+        after_count = await SESSION.scalar(select(func.count()).select_from(Class))
+        print("-" * 30)
+        print(f"📊 삭제 전 개수: {before_count}")
+        print(f"📉 삭제 후 개수: {after_count}")
+        print("-" * 30)
     except Exception as e:
         print(f"스크립트 에러: {e}")
         await SESSION.rollback()
@@ -88,5 +107,10 @@ async def main():
         await SESSION.close()
         print("스크립트 종료")
 
+
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="중복 수업 정리")
+    parser.add_argument("--dry-run", action="store_true", help="삭제하지 않고 중복 현황만 출력")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE, help="배치당 삭제 개수")
+    args = parser.parse_args()
+    asyncio.run(main(dry_run=args.dry_run, batch_size=args.batch_size))
@@ -0,0 +1,65 @@
+"""테스트 공통 fixture
+
+임시 sqlite(aiosqlite) 파일 DB 에 테이블을 만들고 httpx ASGITransport 로 앱을 직접 호출한다.
+DB_ / CACHE_ / JOB_ 환경변수는 server 모듈을 import 하기 전에 정해야 하므로 이 파일 맨 위에서 설정한다.
+"""
+import os
+import tempfile
+
+_TEST_DIR = tempfile.mkdtemp(prefix="oddc-test-")
+_DB_PATH = os.path.join(_TEST_DIR, "test.db")
+os.environ.update({
+    "DB_DIALECT": "sqlite",
+    "DB_DRIVER": "aiosqlite",
+    "DB_DATABASE": _DB_PATH,
+    "DB_POOL_STATS_LOG_INTERVAL": "0",
+    # 응답 캐시를 끄고 매 요청 DB 조회 (문장 수 비교가 캐시 적중에 흔들리지 않도록)
+    "CACHE_ENABLED": "false",
+    "JOB_UPLOAD_DIR": os.path.join(_TEST_DIR, "uploads"),
+})
+
+from typing import AsyncIterator, Iterator, List
+
+import httpx
+import pytest
+from sqlalchemy import event
+
+from server.database.common import Base
+from server.database.connection import DATABASE
+from server.main import app
+
+
+@pytest.fixture
+def anyio_backend() -> str:
+    return "asyncio"
+
+
+@pytest.fixture(autouse=True)
+async def database(anyio_backend) -> AsyncIterator[None]:
+    """테스트마다 빈 테이블 - 끝나면 삭제하고 풀 정리 (aiosqlite 커넥션은 테스트의 이벤트 루프에 묶임)"""
+    async with DATABASE.engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    yield
+    async with DATABASE.engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+    await DATABASE.dispose()
+
+
+@pytest.fixture
+async def client() -> AsyncIterator[httpx.AsyncClient]:
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as c:
+        yield c
+
+
+@pytest.fixture
+def statements() -> Iterator[List[str]]:
+    """실행된 SQL 문장 목록 (before_cursor_execute) - clear() 후 요청하면 그 요청의 문장만 남음"""
+    executed: List[str] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        executed.append(statement)
+
+    sync_engine = DATABASE.engine.sync_engine
+    event.listen(sync_engine, "before_cursor_execute", record)
+    yield executed
+    event.remove(sync_engine, "before_cursor_execute", record)
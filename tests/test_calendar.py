@@ -0,0 +1,35 @@
+"""/class/calendar 월간 요약 - 수업 timezone 과 요청 timezone 이 다를 때의 날짜 구분"""
+import pytest
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_calendar_buckets_by_request_timezone(client):
+    studio_id = (await client.post("/studio/create", json={"name": "studio", "instagram": "studio"})).json()["studio_id"]
+    dancer_id = (await client.post("/dancer/create", json={"name": "dancer", "instagram": "dancer"})).json()["dancer_id"]
+    response = await client.post("/class/bulk", json={"classes": [
+        # 서울 3/1 08:00 = UTC 2/28 23:00 -> UTC 기준이면 2월
+        {"studio": studio_id, "dancers": [dancer_id], "class_datetime": "2030-03-01T08:00:00", "genre": "HIPHOP"},
+        {"studio": studio_id, "dancers": [dancer_id], "class_datetime": "2030-03-15T20:00:00", "level": "ADVANCED"},
+        # 뉴욕 3/15 20:00 = UTC 3/16 00:00
+        {
+            "studio": studio_id,
+            "dancers": [dancer_id],
+            "class_datetime": "2030-03-15T20:00:00",
+            "timezone": "America/New_York",
+            "genre": "HOUSE",
+        },
+    ]})
+    assert response.status_code == 200, response.text
+
+    seoul = (await client.get(
+        "/class/calendar", params={"year": 2030, "month": 3, "studio_id": studio_id}
+    )).json()
+    assert [(day["date"], day["count"]) for day in seoul["days"]] == [("2030-03-01", 1), ("2030-03-15", 1), ("2030-03-16", 1)]
+    assert seoul["days"][2]["genres"] == ["HOUSE"]
+
+    utc = (await client.get(
+        "/class/calendar", params={"year": 2030, "month": 3, "timezone": "UTC", "dancer_id": dancer_id}
+    )).json()
+    assert [(day["date"], day["count"]) for day in utc["days"]] == [("2030-03-15", 1), ("2030-03-16", 1)]
+    assert utc["days"][0]["levels"] == ["ADVANCED"]
@@ -0,0 +1,25 @@
+"""/class/create - 유니크 키(studio_id, class_datetime, genre, level)가 겹치면 /class/bulk 와 같은 duplicate 409"""
+import pytest
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_duplicate_class_returns_conflict(client):
+    studio_id = (await client.post("/studio/create", json={"name": "studio", "instagram": "studio"})).json()["studio_id"]
+    dancer_id = (await client.post("/dancer/create", json={"name": "dancer", "instagram": "dancer"})).json()["dancer_id"]
+    payload = {"studio_id": studio_id, "dancer_ids": [dancer_id], "class_datetime": "2030-03-01T19:00:00"}
+
+    response = await client.post("/class/create", json=payload)
+    assert response.status_code == 200, response.text
+
+    # genre 가 NULL 이어도 COALESCE 키로 중복 판정
+    response = await client.post("/class/create", json=payload)
+    assert response.status_code == 409, response.text
+    message = response.json()["detail"]["message"]
+    assert "duplicate" in message
+    assert "INSERT" not in message.upper()
+
+    # 실패한 요청은 롤백되고 다른 수업은 계속 등록됨
+    response = await client.post("/class/create", json={**payload, "genre": "HIPHOP"})
+    assert response.status_code == 200, response.text
+    assert len((await client.get(f"/class/studio/{studio_id}")).json()) == 2
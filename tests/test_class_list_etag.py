@@ -0,0 +1,37 @@
+"""수업 목록 ETag - 같은 워터마크라도 조회 조건(기간/커서/페이지 크기)이 다르면 다른 ETag"""
+import pytest
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_list_etag_depends_on_query(client):
+    studio_id = (await client.post("/studio/create", json={"name": "studio", "instagram": "studio"})).json()["studio_id"]
+    dancer_id = (await client.post("/dancer/create", json={"name": "dancer", "instagram": "dancer"})).json()["dancer_id"]
+    response = await client.post("/class/bulk", json={"classes": [
+        {"studio": studio_id, "dancers": [dancer_id], "class_datetime": f"2030-0{month}-01T19:00:00"}
+        for month in (1, 2)
+    ]})
+    assert response.status_code == 200, response.text
+
+    january = await client.get(f"/class/studio/{studio_id}", params={"from": "2030-01-01T00:00:00", "to": "2030-02-01T00:00:00"})
+    etag = january.headers["etag"]
+    assert len(january.json()) == 1
+
+    # 같은 조건이면 304, 다른 기간이면 이전 ETag 로 304 를 받지 않음
+    again = await client.get(
+        f"/class/studio/{studio_id}",
+        params={"from": "2030-01-01T00:00:00", "to": "2030-02-01T00:00:00"},
+        headers={"If-None-Match": etag}
+    )
+    assert again.status_code == 304
+    february = await client.get(
+        f"/class/studio/{studio_id}",
+        params={"from": "2030-02-01T00:00:00", "to": "2030-03-01T00:00:00"},
+        headers={"If-None-Match": etag}
+    )
+    assert february.status_code == 200
+    assert february.headers["etag"] != etag
+
+    page = await client.get(f"/studio/{studio_id}/page", params={"limit": 1})
+    other = await client.get(f"/studio/{studio_id}/page", params={"limit": 2}, headers={"If-None-Match": page.headers["etag"]})
+    assert other.status_code == 200
@@ -0,0 +1,59 @@
+"""DancerStore 이름 색인 - 대량 upsert 는 새 이름만 추가하고, 수정 시 대표 이름도 dancer_names 에 유지"""
+import pytest
+from sqlalchemy import select
+
+from server.database.connection import DATABASE
+from server.features.dancer.models import Dancer, DancerName
+from server.features.dancer.store import DancerStore
+
+pytestmark = pytest.mark.anyio
+
+
+async def names_by_instagram():
+    async with DATABASE.session_factory() as session:
+        rows = (await session.execute(
+            select(Dancer.instagram, DancerName.normalized_name)
+            .join(DancerName, DancerName.dancer_id == Dancer.dancer_id)
+            .order_by(Dancer.instagram, DancerName.normalized_name)
+        )).all()
+    result = {}
+    for instagram, name in rows:
+        result.setdefault(instagram, []).append(name)
+    return result
+
+
+async def test_bulk_upsert_merges_names_without_duplicates():
+    store = DancerStore()
+    success, errors = await store.create_or_update_dancers_bulk([
+        {"name": "Kim", "instagram": "kim"},
+        {"name": "KIM", "instagram": "kim"},
+        {"name": "Kimmy", "instagram": "kim"},
+        {"name": "Lee", "instagram": "lee"},
+        {"name": "", "instagram": "nobody"},
+    ])
+    assert success == 4
+    assert [error["row"] for error in errors] == [5]
+    assert await names_by_instagram() == {"kim": ["kim", "kimmy"], "lee": ["lee"]}
+
+    # 두 번째 업로드 - 이미 있는 이름은 건너뛰고 새 별칭만 추가
+    success, errors = await store.create_or_update_dancers_bulk([
+        {"name": "kimmy", "instagram": "kim"},
+        {"name": "Lee J", "instagram": "lee"},
+    ])
+    assert (success, errors) == (2, [])
+    assert await names_by_instagram() == {"kim": ["kim", "kimmy"], "lee": ["lee", "lee j"]}
+
+
+async def test_edit_keeps_main_name_in_dancer_names(client):
+    dancer_id = (await client.post("/dancer/create", json={"name": "Bravo", "instagram": "bravo"})).json()["dancer_id"]
+
+    # 대표 이름만 수정 - names 에 없어도 dancer_names 에 색인
+    response = await client.patch(f"/dancer/{dancer_id}", json={"dancer_id": dancer_id, "main_name": "Kilo"})
+    assert response.status_code == 200, response.text
+    assert await names_by_instagram() == {"bravo": ["bravo", "kilo"]}
+
+    # names 를 바꾸면 빠진 별칭은 지우되 대표 이름은 남김
+    response = await client.patch(f"/dancer/{dancer_id}",
+                                  json={"dancer_id": dancer_id, "main_name": "Kilo", "names": ["Lima"]})
+    assert response.status_code == 200, response.text
+    assert await names_by_instagram() == {"bravo": ["kilo", "lima"]}
@@ -0,0 +1,106 @@
+"""/dancer/bulk-upload 백그라운드 작업 - fakeredis 위의 RQ 큐
+
+등록된 작업은 워커 프로세스 대신 Queue.run_sync 로 별도 스레드에서 실행한다 (요청 컨텍스트 밖, 워커와 같은 조건).
+작업은 자기 이벤트 루프(asyncio.run)에서 DB 에 접근하므로, 실행 전에 테스트 루프의 풀을 비워 둔다.
+"""
+import asyncio
+import os
+
+import pytest
+from fakeredis import FakeStrictRedis
+from rq import Queue
+from rq.job import JobStatus
+
+from server.database.connection import DATABASE
+from server.jobs.queue import DANCER_IMPORT_QUEUE, get_dancer_import_queue
+from server.jobs.settings import JOB_SETTINGS
+from server.main import app
+
+pytestmark = pytest.mark.anyio
+
+CSV = "name,instagram\nKim,kim\nKimmy,kim\n,broken\nLee,lee\n".encode()
+
+
+@pytest.fixture
+def redis():
+    return FakeStrictRedis()
+
+
+@pytest.fixture
+def use_queue(redis):
+    """get_dancer_import_queue 를 fakeredis 큐로 교체"""
+    def install() -> Queue:
+        queue = Queue(DANCER_IMPORT_QUEUE, connection=redis)
+        app.dependency_overrides[get_dancer_import_queue] = lambda: queue
+        return queue
+
+    yield install
+    app.dependency_overrides.pop(get_dancer_import_queue, None)
+
+
+def uploaded_files():
+    if not os.path.isdir(JOB_SETTINGS.upload_dir):
+        return []
+    return os.listdir(JOB_SETTINGS.upload_dir)
+
+
+async def upload(client):
+    return await client.post("/dancer/bulk-upload", files={"file": ("dancers.csv", CSV, "text/csv")})
+
+
+async def test_upload_job_runs_and_reports(client, use_queue):
+    queue = use_queue()
+    before = uploaded_files()
+
+    response = await upload(client)
+    assert response.status_code == 202, response.text
+    job_id = response.json()["job_id"]
+    await DATABASE.dispose()
+    await asyncio.to_thread(queue.run_sync, queue.fetch_job(job_id))
+
+    status = (await client.get(f"/dancer/bulk-upload/{job_id}")).json()
+    assert status["status"] == JobStatus.FINISHED.value
+    assert (status["processed"], status["total"], status["success"], status["failed"]) == (4, 4, 3, 1)
+
+    report = (await client.get(f"/dancer/bulk-upload/{job_id}/report")).json()
+    assert [error["row"] for error in report["errors"]] == [3]
+    # 작업이 끝나면 저장한 업로드 파일 삭제
+    assert uploaded_files() == before
+
+    dancer = (await client.get("/dancer/instagram/kim")).json()
+    assert dancer["names"] == ["Kim", "Kimmy"]
+
+
+async def test_queued_job_status_and_report(client, use_queue):
+    use_queue()
+    job_id = (await upload(client)).json()["job_id"]
+
+    status = (await client.get(f"/dancer/bulk-upload/{job_id}")).json()
+    assert (status["status"], status["processed"], status["total"]) == (JobStatus.QUEUED.value, 0, None)
+    assert (await client.get(f"/dancer/bulk-upload/{job_id}/report")).status_code == 409
+    assert (await client.get("/dancer/bulk-upload/missing")).status_code == 404
+
+
+async def test_finished_job_without_result_is_reported_as_failed(client, use_queue):
+    queue = use_queue()
+    job_id = (await upload(client)).json()["job_id"]
+    # 결과 보관 기간이 지난 완료 작업
+    queue.fetch_job(job_id).set_status(JobStatus.FINISHED)
+
+    status = (await client.get(f"/dancer/bulk-upload/{job_id}")).json()
+    assert status["status"] == JobStatus.FAILED.value
+    assert status["error"]
+    assert (await client.get(f"/dancer/bulk-upload/{job_id}/report")).status_code == 410
+
+
+async def test_failed_enqueue_removes_saved_upload(client, use_queue):
+    queue = use_queue()
+
+    def broken_enqueue(*args, **kwargs):
+        raise ConnectionError("redis down")
+
+    queue.enqueue = broken_enqueue
+    before = uploaded_files()
+    with pytest.raises(ConnectionError):
+        await upload(client)
+    assert uploaded_files() == before
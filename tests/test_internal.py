@@ -0,0 +1,26 @@
+"""/internal/* - INTERNAL_ENABLED 가 아니면 등록하지 않고, INTERNAL_TOKEN 이 있으면 헤더 확인"""
+import httpx
+import pytest
+from fastapi import FastAPI
+
+from server.internal.settings import INTERNAL_SETTINGS
+from server.internal.views import internal_router
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_internal_endpoints_are_not_mounted_by_default(client):
+    assert (await client.get("/internal/db-pool")).status_code == 404
+    assert (await client.get("/internal/cache")).status_code == 404
+
+
+async def test_internal_token_is_required_when_configured(monkeypatch):
+    monkeypatch.setattr(INTERNAL_SETTINGS, "token", "secret")
+    app = FastAPI()
+    app.include_router(internal_router, prefix="/internal")
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        assert (await client.get("/internal/cache")).status_code == 403
+        assert (await client.get("/internal/cache", headers={"X-Internal-Token": "wrong"})).status_code == 403
+        response = await client.get("/internal/db-pool", headers={"X-Internal-Token": "secret"})
+        assert response.status_code == 200, response.text
+        assert "checkouts" in response.json()
@@ -0,0 +1,81 @@
+"""목록 엔드포인트의 SQL 문장 수 회귀 테스트 (N+1 방지)
+
+같은 요청을 행 수를 크게 늘린 뒤 다시 보내도 요청당 문장 수가 그대로여야 한다.
+"""
+from typing import List
+
+import httpx
+import pytest
+
+pytestmark = pytest.mark.anyio
+
+
+async def create_dancers(client: httpx.AsyncClient, count: int) -> List[str]:
+    dancer_ids = []
+    for i in range(count):
+        response = await client.post("/dancer/create", json={"name": f"dancer{i}", "instagram": f"dancer_{i}"})
+        dancer_ids.append(response.json()["dancer_id"])
+    return dancer_ids
+
+
+async def create_studios_with_classes(
+    client: httpx.AsyncClient,
+    dancer_ids: List[str],
+    first: int,
+    studios: int,
+    classes_per_studio: int
+) -> List[str]:
+    """스튜디오 studios 개 + 스튜디오마다 수업 classes_per_studio 개 (수업마다 댄서 2명), 스튜디오 ID 목록 반환"""
+    studio_ids = []
+    for i in range(first, first + studios):
+        response = await client.post(
+            "/studio/create", json={"name": f"studio{i}", "instagram": f"studio_{i}", "district": "마포구"}
+        )
+        studio_ids.append(response.json()["studio_id"])
+    items = [
+        {
+            "studio": studio_id,
+            "dancers": [dancer_ids[n % len(dancer_ids)], dancer_ids[(n + 1) % len(dancer_ids)]],
+            "class_datetime": f"2030-01-{n + 1:02d}T19:00:00",
+        }
+        for studio_id in studio_ids
+        for n in range(classes_per_studio)
+    ]
+    response = await client.post("/class/bulk", json={"classes": items})
+    assert response.status_code == 200, response.text
+    return studio_ids
+
+
+async def statement_counts(client: httpx.AsyncClient, statements: List[str], urls: List[str]) -> List[int]:
+    counts = []
+    for url in urls:
+        statements.clear()
+        response = await client.get(url)
+        assert response.status_code == 200, response.text
+        counts.append(len(statements))
+    return counts
+
+
+async def test_list_statement_count_does_not_grow_with_rows(client, statements):
+    dancer_ids = await create_dancers(client, 3)
+    studio_id = (await create_studios_with_classes(client, dancer_ids, 0, 1, 2))[0]
+    urls = [
+        "/studio/list",
+        f"/class/studio/{studio_id}",
+        f"/class/dancer/{dancer_ids[0]}",
+        "/class/feed?from=2030-01-01T00:00:00&to=2030-02-01T00:00:00",
+    ]
+    small = await statement_counts(client, statements, urls)
+
+    # 스튜디오 10배, 스튜디오/댄서별 수업 10배
+    await create_studios_with_classes(client, dancer_ids, 1, 9, 20)
+    response = await client.post("/class/bulk", json={"classes": [
+        {"studio": studio_id, "dancers": dancer_ids[:2], "class_datetime": f"2030-01-{day:02d}T21:00:00"}
+        for day in range(3, 21)
+    ]})
+    assert response.status_code == 200, response.text
+    large = await statement_counts(client, statements, urls)
+
+    assert large == small
+    # 목록 조회는 관계를 따라가지 않음 - 버전(ETag) 확인 + 본문 조회 정도
+    assert max(small) <= 4
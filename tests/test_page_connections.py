@@ -0,0 +1,48 @@
+"""상세 페이지 묶음 조회 - 요청 하나가 동시에 잡는 커넥션 수"""
+from typing import Iterator, List
+
+import pytest
+from sqlalchemy import event
+
+from server.database.connection import DATABASE
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+def peak_checkouts() -> Iterator[List[int]]:
+    """[현재 체크아웃 수, 최대 체크아웃 수, 전체 체크아웃 횟수]"""
+    counter = [0, 0, 0]
+
+    def on_checkout(dbapi_connection, connection_record, connection_proxy):
+        counter[0] += 1
+        counter[1] = max(counter[1], counter[0])
+        counter[2] += 1
+
+    def on_checkin(dbapi_connection, connection_record):
+        counter[0] -= 1
+
+    pool = DATABASE.engine.sync_engine.pool
+    event.listen(pool, "checkout", on_checkout)
+    event.listen(pool, "checkin", on_checkin)
+    yield counter
+    event.remove(pool, "checkout", on_checkout)
+    event.remove(pool, "checkin", on_checkin)
+
+
+async def test_page_uses_request_session_and_one_side_session(client, peak_checkouts):
+    studio_id = (await client.post("/studio/create", json={"name": "studio", "instagram": "studio"})).json()["studio_id"]
+    dancer_id = (await client.post("/dancer/create", json={"name": "dancer", "instagram": "dancer"})).json()["dancer_id"]
+    response = await client.post("/class/bulk", json={"classes": [
+        {"studio": studio_id, "dancers": [dancer_id], "class_datetime": "2030-03-01T19:00:00"}
+    ]})
+    assert response.status_code == 200, response.text
+
+    for url in (f"/studio/{studio_id}/page", f"/dancer/{dancer_id}/page"):
+        peak_checkouts[1:] = [0, 0]
+        response = await client.get(url)
+        assert response.status_code == 200, response.text
+        assert len(response.json()["classes"]) == 1
+        # 요청 세션(버전 확인 + 프로필) + 수업 목록용 세션 하나
+        assert peak_checkouts[1:] == [2, 2]
+    assert (await client.get("/studio/missing/page")).status_code == 404
@@ -0,0 +1,20 @@
+"""커넥션 풀 계측 - Pool.connect() 체크아웃 기록과 QueuePool 현황"""
+import pytest
+
+from server.database.connection import DATABASE
+from server.database.pool import POOL_METRICS, pool_snapshot
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_checkouts_are_recorded(client):
+    before = POOL_METRICS.checkouts
+    response = await client.post("/studio/create", json={"name": "studio", "instagram": "studio"})
+    assert response.status_code == 200, response.text
+
+    snapshot = pool_snapshot(DATABASE.engine, DATABASE.replica_engine)
+    assert snapshot["checkouts"] > before
+    # 요청이 끝나면 커넥션을 돌려줌
+    assert snapshot["checked_out"] == 0
+    assert snapshot["size"] >= 1
+    assert snapshot["replica"] is None
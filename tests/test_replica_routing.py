@@ -0,0 +1,62 @@
+"""읽기/쓰기 분리 - SQLite 파일 두 개를 primary / replica 로 (복제는 없으므로 어느 쪽에서 읽었는지 구분됨)"""
+import os
+import tempfile
+from typing import AsyncIterator
+
+import httpx
+import pytest
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from server.database.common import Base
+from server.database.connection import DATABASE
+from server.database.middleware import READ_PRIMARY_COOKIE, READ_PRIMARY_HEADER
+from server.database.settings import DB_SETTINGS
+from server.features.studio.models import Studio
+from server.main import app
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+async def replica(monkeypatch) -> AsyncIterator[AsyncEngine]:
+    """DATABASE 에 빈 replica 를 붙임 (DB_REPLICA_URL 을 설정하고 시작한 것과 같은 상태)"""
+    url = f"sqlite+aiosqlite:///{os.path.join(tempfile.mkdtemp(prefix='oddc-replica-'), 'replica.db')}"
+    engine = DATABASE._create_engine(url)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    monkeypatch.setattr(DB_SETTINGS, "replica_url", url)
+    monkeypatch.setattr(DATABASE, "_replica_engine", engine)
+    DATABASE.session_factory.configure(replica_bind=engine.sync_engine)
+    yield engine
+    DATABASE.session_factory.configure(replica_bind=None)
+    await engine.dispose()
+
+
+def new_client() -> httpx.AsyncClient:
+    """쿠키를 공유하지 않는 클라이언트"""
+    return httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test")
+
+
+async def studio_names(client: httpx.AsyncClient, **headers: str):
+    response = await client.get("/studio/list", headers=headers)
+    assert response.status_code == 200, response.text
+    return [item["name"] for item in response.json()]
+
+
+async def test_reads_go_to_replica_and_writes_to_primary(replica):
+    async with replica.begin() as conn:
+        await conn.execute(insert(Studio.__table__), [{"studio_id": "replica-only", "name": "replica studio"}])
+
+    async with new_client() as writer:
+        response = await writer.post("/studio/create", json={"name": "primary studio", "instagram": "primary"})
+        assert response.status_code == 200, response.text
+        # 쓰기 응답에는 read-your-writes 쿠키 - 같은 클라이언트의 이후 조회는 primary
+        assert READ_PRIMARY_COOKIE in response.cookies
+        assert await studio_names(writer) == ["primary studio"]
+
+    async with new_client() as reader:
+        # 잠금 없는 조회는 replica
+        assert await studio_names(reader) == ["replica studio"]
+        # 헤더로 primary 조회 요청
+        assert await studio_names(reader, **{READ_PRIMARY_HEADER: "1"}) == ["primary studio"]
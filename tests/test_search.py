@@ -0,0 +1,63 @@
+"""/search - 인메모리 색인이 준비되기 전의 SQL 대체 경로 (전방 일치, 별칭은 dancer_names)"""
+import pytest
+
+from server.features.search import index as search_index
+from server.features.search.index import SEARCH_INDEX, SearchIndex
+from server.features.search.store import SearchStore
+
+pytestmark = pytest.mark.anyio
+
+
+async def search(client, keyword: str):
+    response = await client.get("/search/", params={"keyword": keyword})
+    assert response.status_code == 200, response.text
+    body = response.json()
+    return [(item["type"], item["name"]) for item in body["results"]], body["total"]
+
+
+async def test_sql_search_matches_prefixes_and_aliases(client, statements):
+    assert not SEARCH_INDEX.is_warm
+    await client.post("/studio/create", json={"name": "Alpha Studio", "instagram": "alpha_studio"})
+    dancer_id = (await client.post("/dancer/create", json={"name": "Bravo", "instagram": "alpha"})).json()["dancer_id"]
+    response = await client.post(f"/dancer/{dancer_id}/names", json={"dancer_id": dancer_id, "name": "Alp"})
+    assert response.status_code == 200, response.text
+    await client.post("/dancer/create", json={"name": "Charlie", "instagram": "charlie"})
+
+    statements.clear()
+    # 인스타그램/별칭 정확 일치가 먼저, 같은 댄서는 한 번만
+    assert await search(client, "alp") == ([("DANCER", "Bravo"), ("STUDIO", "Alpha Studio")], 2)
+    assert len(statements) == 1
+    assert "json_search" not in statements[0].lower()
+
+    assert await search(client, "alpha") == ([("DANCER", "Bravo"), ("STUDIO", "Alpha Studio")], 2)
+    assert await search(client, "cha") == ([("DANCER", "Charlie")], 1)
+    # 부분 일치는 색인에서만
+    assert await search(client, "harl") == ([], 0)
+
+
+async def test_sql_search_finds_edited_main_name(client):
+    dancer_id = (await client.post("/dancer/create", json={"name": "Bravo", "instagram": "bravo"})).json()["dancer_id"]
+    response = await client.patch(f"/dancer/{dancer_id}", json={"dancer_id": dancer_id, "main_name": "Kilo"})
+    assert response.status_code == 200, response.text
+
+    # 대표 이름만 바꿔도 dancer_names 에 색인되어 검색됨, 예전 이름도 별칭으로 남음
+    assert await search(client, "kil") == ([("DANCER", "Kilo")], 1)
+    assert await search(client, "bra") == ([("DANCER", "Kilo")], 1)
+
+
+async def test_rebuild_keeps_changes_committed_while_loading(client, monkeypatch):
+    index = SearchIndex()
+    monkeypatch.setattr(search_index, "SEARCH_INDEX", index)
+    await client.post("/studio/create", json={"name": "Alpha Studio", "instagram": "alpha_studio"})
+
+    async def load_entries():
+        # 조회가 끝난 뒤(교체 전)에 다른 요청이 커밋 - 조회 결과에는 없는 변경
+        entries = await SearchStore().get_index_entries()
+        response = await client.post("/studio/create", json={"name": "Alpine Studio", "instagram": "alpine"})
+        assert response.status_code == 200, response.text
+        return entries
+
+    await index.rebuild(load_entries)
+    assert index.is_warm
+    names = [name for _, name, _, _ in index.search("alp", limit=10)[0]]
+    assert names == ["Alpha Studio", "Alpine Studio"]
@@ -0,0 +1,31 @@
+"""DefaultSessionMiddleware - 응답 직전 커밋, 커밋 실패는 상태 줄이 나가기 전에 500 으로"""
+import httpx
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from server.main import app
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_write_is_committed_before_response(client):
+    response = await client.post("/studio/create", json={"name": "studio", "instagram": "studio"})
+    assert response.status_code == 200, response.text
+    assert "commit;dur=" in response.headers["server-timing"]
+    # 다른 요청(새 세션)에서 바로 보임
+    assert (await client.get(f"/studio/{response.json()['studio_id']}")).status_code == 200
+
+
+async def test_commit_failure_returns_500_instead_of_original_status(monkeypatch):
+    async def failing_commit(self):
+        raise RuntimeError("commit failed")
+
+    monkeypatch.setattr(AsyncSession, "commit", failing_commit)
+    transport = httpx.ASGITransport(app=app, raise_app_exceptions=False)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        response = await client.post("/studio/create", json={"name": "studio", "instagram": "studio"})
+        assert response.status_code == 500
+        assert "server-timing" not in response.headers
+        monkeypatch.undo()
+        # 롤백되어 저장되지 않음
+        assert (await client.get("/studio/list")).json() == []
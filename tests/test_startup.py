@@ -0,0 +1,40 @@
+"""앱 시작/종료 - import 시간 예산, import 시 엔진 미생성, lifespan 종료 정리"""
+import os
+
+import pytest
+
+from benchmarks.bench_import_time import measure_once
+from server.cache.cache import RESPONSE_CACHE
+from server.database.connection import DATABASE
+from server.main import app, lifespan
+
+# 워커 부팅 때마다 드는 import server.main 비용 상한 (CI 머신 편차를 감안한 값)
+IMPORT_BUDGET_MS = 1500
+IMPORT_RUNS = 3
+
+pytestmark = pytest.mark.anyio
+
+
+def test_import_is_within_budget_and_creates_no_engine():
+    module_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    runs = [measure_once(module_root) for _ in range(IMPORT_RUNS)]
+    assert not any(engine_created for _, _, engine_created in runs)
+    best_ms = min(total for _, total, _ in runs) / 1000
+    assert best_ms <= IMPORT_BUDGET_MS, f"import server.main took {best_ms:.1f}ms"
+
+
+async def test_lifespan_cleans_up_when_body_fails(monkeypatch):
+    closed = []
+
+    async def close():
+        closed.append("cache")
+
+    async def dispose():
+        closed.append("database")
+
+    monkeypatch.setattr(RESPONSE_CACHE, "close", close)
+    monkeypatch.setattr(DATABASE, "dispose", dispose)
+    with pytest.raises(RuntimeError):
+        async with lifespan(app):
+            raise RuntimeError("startup failed after lifespan")
+    assert closed == ["cache", "database"]
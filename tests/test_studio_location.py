@@ -0,0 +1,47 @@
+"""/studio/nearby, /studio/in-bounds - 반경/거리순/키셋 페이지를 SQL 한 문장(LIMIT)으로"""
+import pytest
+
+pytestmark = pytest.mark.anyio
+
+# 서울시청 기준 북쪽으로 약 0m, 111m, 556m, 1.1km, 5.6km
+SEOUL = (37.5665, 126.9780)
+OFFSETS = [0.0, 0.001, 0.005, 0.01, 0.05]
+
+
+async def create_studios(client):
+    for i, offset in enumerate(OFFSETS):
+        response = await client.post("/studio/create", json={
+            "name": f"studio{i}", "instagram": f"studio_{i}", "lat": SEOUL[0] + offset, "lng": SEOUL[1]
+        })
+        assert response.status_code == 200, response.text
+    # 좌표 없는 스튜디오는 제외
+    await client.post("/studio/create", json={"name": "nowhere", "instagram": "nowhere"})
+
+
+async def test_nearby_pages_by_distance_in_sql(client, statements):
+    await create_studios(client)
+    params = {"lat": SEOUL[0], "lng": SEOUL[1], "radius": 2000, "limit": 2}
+
+    statements.clear()
+    first = await client.get("/studio/nearby", params=params)
+    assert first.status_code == 200, first.text
+    assert [item["name"] for item in first.json()] == ["studio0", "studio1"]
+    assert [round(item["distance_m"]) for item in first.json()] == [0, 111]
+    location_queries = [s for s in statements if "distance_sq" in s]
+    assert len(location_queries) == 1 and "LIMIT" in location_queries[0].upper()
+
+    second = await client.get("/studio/nearby", params={**params, "cursor": first.headers["x-next-cursor"]})
+    assert [item["name"] for item in second.json()] == ["studio2", "studio3"]
+    # 5.6km 는 반경 밖 - 다음 페이지 없음
+    assert "x-next-cursor" not in second.headers
+    assert second.headers["etag"] != first.headers["etag"]
+
+
+async def test_in_bounds_orders_from_center(client):
+    await create_studios(client)
+    response = await client.get("/studio/in-bounds", params={
+        "sw": f"{SEOUL[0] + 0.004},{SEOUL[1] - 0.01}", "ne": f"{SEOUL[0] + 0.06},{SEOUL[1] + 0.01}"
+    })
+    assert response.status_code == 200, response.text
+    # 중심 위도 ≈ +0.032 -> 0.05(0.018), 0.01(0.022), 0.005(0.027) 순
+    assert [item["name"] for item in response.json()] == ["studio4", "studio3", "studio2"]